@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark: file size and wall time of each slide output format.
+
+Renders the same carousel with every encoder setting, with and without the
+background writer thread, and reports average slide size and total time.
+
+Run: python benchmarks/bench_encoders.py [--slides 5] [--runs 3] [--words 40]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from bench_text_layout import make_text
+from rendering.carousel_renderer import CarouselRenderer
+
+ENCODER_SETTINGS = [
+    ("png (level 6, default)", {"output_format": "png"}),
+    ("png (level 1)", {"output_format": "png", "png_compress_level": 1}),
+    ("png (level 9, optimize)", {"output_format": "png", "png_compress_level": 9, "optimize": True}),
+    ("jpeg (q90)", {"output_format": "jpeg", "quality": 90}),
+    ("jpeg (q75)", {"output_format": "jpeg", "quality": 75}),
+    ("webp (q80)", {"output_format": "webp", "quality": 80}),
+    ("webp (lossless)", {"output_format": "webp", "lossless": True}),
+]
+
+
+def run_case(options, slides, runs, async_writes):
+    renderer = CarouselRenderer(async_writes=async_writes, **options)
+    output_dir = tempfile.mkdtemp(prefix="bench_encoders_")
+    try:
+        renderer.render_carousel(slides, output_dir=output_dir)  # warm up fonts and caches
+        start = time.perf_counter()
+        for _ in range(runs):
+            paths = renderer.render_carousel(slides, output_dir=output_dir)
+        elapsed = (time.perf_counter() - start) / runs
+        avg_size = sum(os.path.getsize(p) for p in paths) / len(paths)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return elapsed, avg_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--slides', type=int, default=5)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--words', type=int, default=40)
+    args = parser.parse_args()
+
+    slides = [{"text": make_text(args.words, seed)} for seed in range(args.slides)]
+    rows = []
+    stdout = sys.stdout
+    for label, options in ENCODER_SETTINGS:
+        sys.stdout = open(os.devnull, 'w')  # silence per-slide progress output
+        try:
+            sync_time, size = run_case(options, slides, args.runs, async_writes=False)
+            async_time, _ = run_case(options, slides, args.runs, async_writes=True)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        rows.append((label, size, sync_time, async_time))
+
+    print(f"{args.slides} slides x {args.words} words, mean of {args.runs} runs")
+    print(f"{'format':26} {'avg size':>10} {'sync':>10} {'async':>10}")
+    for label, size, sync_time, async_time in rows:
+        print(f"{label:26} {size / 1024:8.1f}KB {sync_time * 1000:8.1f}ms {async_time * 1000:8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Import-time benchmark and startup guard for Nexus entry points.
+
+Each entry point is imported in a fresh interpreter with ``python -X importtime``
+and the per-module report on stderr is parsed into its total import time, the
+slowest modules it pulled in, and any heavy SDKs or drivers it loaded. Provider
+SDKs (anthropic, google.generativeai, groq), requests and psycopg2 must only be
+imported when a client is first used, never at module import.
+
+Run:
+    python benchmarks/bench_import.py                  # report
+    python benchmarks/bench_import.py --check          # exit 1 if an entry point imports a heavy module
+    python benchmarks/bench_import.py --check --budget-ms 300 --top 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+
+ENTRY_POINTS = [
+    "api_clients.claude_client",
+    "api_clients.gemini_client",
+    "api_clients.groq_client",
+    "api_clients.pexels_client",
+    "social_analytics",
+    "rendering.carousel_renderer",
+    "rendering.render_service",
+]
+
+# Modules that must not load at import time (they are imported on first use)
+HEAVY_MODULES = ["anthropic", "google.generativeai", "groq", "requests", "psycopg2"]
+
+
+def parse_importtime(stderr: str) -> list[tuple]:
+    """
+    Parse `python -X importtime` output
+
+    Returns:
+        (module, self microseconds, cumulative microseconds, nesting depth) per
+        imported module, in the order imports finished (children before parents)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        name = name[1:]  # drop the separator's space; the rest of the indent is nesting
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def attributed_entries(entries: list[tuple], module: str) -> list[tuple]:
+    """Entries imported by `import module` (its packages and everything they pulled in),
+    excluding modules the interpreter imported during startup"""
+    attributed = []
+    block = []
+    for entry in entries:
+        block.append(entry)
+        name, _, _, depth = entry
+        if depth == 0:
+            if module == name or module.startswith(name + "."):
+                attributed.extend(block)
+            block = []
+    return attributed
+
+
+def measure_import(module: str, python: str = sys.executable) -> dict:
+    """Import module in a fresh interpreter and summarize its import cost"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])))
+    completed = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"],
+                               capture_output=True, text=True, env=env)
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "unknown error"
+        return {"module": module, "error": error}
+    entries = attributed_entries(parse_importtime(completed.stderr), module)
+    loaded = {name for name, _, _, _ in entries}
+    total_us = sum(cumulative_us for _, _, cumulative_us, depth in entries if depth == 0)
+    return {
+        "module": module,
+        "error": None,
+        "total_ms": round(total_us / 1000, 1),
+        "slowest": sorted(entries, key=lambda entry: entry[1], reverse=True),
+        "heavy": [name for name in HEAVY_MODULES if name in loaded],
+    }
+
+
+def check(results: list[dict], budget_ms: float = None) -> list[str]:
+    """Startup problems: heavy modules loaded at import, failed imports, or budget overruns"""
+    problems = []
+    for result in results:
+        if result["error"]:
+            problems.append(f"{result['module']}: import failed ({result['error']})")
+            continue
+        if result["heavy"]:
+            problems.append(f"{result['module']}: imports {', '.join(result['heavy'])} at module load")
+        if budget_ms is not None and result["total_ms"] > budget_ms:
+            problems.append(f"{result['module']}: {result['total_ms']}ms exceeds the {budget_ms}ms budget")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time benchmark for Nexus entry points")
+    parser.add_argument('modules', nargs='*', help="Entry points to measure (default: all)")
+    parser.add_argument('--check', action='store_true', help="Exit 1 on startup regressions")
+    parser.add_argument('--budget-ms', type=float, help="Maximum import time per entry point")
+    parser.add_argument('--top', type=int, default=3, help="Slowest modules to list per entry point")
+    args = parser.parse_args(argv)
+
+    results = [measure_import(module) for module in args.modules or ENTRY_POINTS]
+    for result in results:
+        if result["error"]:
+            print(f"{result['module']:32} FAILED: {result['error']}")
+            continue
+        heavy = f"  heavy: {', '.join(result['heavy'])}" if result["heavy"] else ""
+        print(f"{result['module']:32} {result['total_ms']:8.1f}ms{heavy}")
+        for name, self_us, _, _ in result["slowest"][:args.top]:
+            print(f"    {self_us / 1000:8.1f}ms  {name}")
+
+    if args.check:
+        problems = check(results, args.budget_ms)
+        for problem in problems:
+            print(f"STARTUP REGRESSION {problem}")
+        if problems:
+            return 1
+        print("Startup check passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Rendering benchmark suite with throughput regression gates.
+
+Measures slides per second and peak RSS of CarouselRenderer.render_carousel
+across text lengths, canvas sizes and output formats. Every case runs in a
+fresh process so its peak RSS is not inflated by earlier cases.
+
+Run:
+    python benchmarks/bench_render.py                      # print results
+    python benchmarks/bench_render.py --save-baseline      # record benchmarks/baseline.json
+    python benchmarks/bench_render.py --check              # exit 1 on a throughput regression
+    python benchmarks/bench_render.py --check --tolerance 0.10 --quick
+
+Baselines are machine specific: record them on the Pi that runs production.
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+DEFAULT_BASELINE = Path(__file__).parent / 'baseline.json'
+
+TEXT_LENGTHS = {"short": 10, "medium": 60, "long": 300}
+CANVAS_SIZES = {"square": (1080, 1080), "portrait": (1080, 1350)}
+OUTPUT_FORMATS = ["png", "jpeg", "webp"]
+
+
+def benchmark_cases(quick=False):
+    """Case ids and parameters for the full matrix (or a small smoke subset)"""
+    cases = {}
+    for (length, words), (canvas, size), fmt in itertools.product(
+            TEXT_LENGTHS.items(), CANVAS_SIZES.items(), OUTPUT_FORMATS):
+        if quick and (canvas != "square" or fmt == "webp"):
+            continue
+        cases[f"{length}-{canvas}-{fmt}"] = {"words": words, "size": size, "format": fmt}
+    return cases
+
+
+def run_case(params, slides=5, runs=3):
+    """Render `runs` carousels of `slides` slides; returns throughput and peak RSS"""
+    from bench_text_layout import make_text
+    from rendering.carousel_renderer import CarouselRenderer
+
+    width, height = params["size"]
+    renderer = CarouselRenderer(width=width, height=height, output_format=params["format"])
+    slides_data = [{"text": make_text(params["words"], seed)} for seed in range(slides)]
+    output_dir = tempfile.mkdtemp(prefix="bench_render_")
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')  # silence per-slide progress output
+    try:
+        renderer.render_carousel(slides_data, output_dir=output_dir)  # warm-up
+        start = time.perf_counter()
+        for _ in range(runs):
+            renderer.render_carousel(slides_data, output_dir=output_dir)
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KB on Linux
+    return {
+        "slides_per_sec": round(slides * runs / elapsed, 3),
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+    }
+
+
+def _case_worker(params, slides, runs, results):
+    results.put(run_case(params, slides, runs))
+
+
+def run_isolated(params, slides=5, runs=3, timeout=600.0):
+    """
+    run_case in a fresh interpreter so peak RSS reflects only this case
+
+    Raises:
+        RuntimeError: If the case process dies without a result (e.g. OOM-killed)
+            or takes longer than timeout seconds
+    """
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    process = ctx.Process(target=_case_worker, args=(params, slides, runs, results))
+    process.start()
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                return results.get(timeout=min(1.0, max(0.01, deadline - time.monotonic())))
+            except queue.Empty:
+                pass
+            if not process.is_alive():
+                try:
+                    return results.get(timeout=1.0)  # a result put just before exiting
+                except queue.Empty:
+                    raise RuntimeError(f"benchmark process exited with code {process.exitcode} "
+                                       f"without a result")
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"benchmark case timed out after {timeout:g}s")
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+
+def compare(results, baseline, tolerance=0.15):
+    """
+    Compare results against a baseline
+
+    Returns:
+        List of (case id, baseline slides/s, current slides/s) for every case
+        whose throughput fell more than `tolerance` (a fraction) below baseline.
+        Cases missing from either side are ignored.
+    """
+    regressions = []
+    for case_id, result in results.items():
+        expected = baseline.get("cases", {}).get(case_id)
+        if expected is None:
+            continue
+        floor = expected["slides_per_sec"] * (1 - tolerance)
+        if result["slides_per_sec"] < floor:
+            regressions.append((case_id, expected["slides_per_sec"], result["slides_per_sec"]))
+    return regressions
+
+
+def save_baseline(results, path):
+    baseline = {
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "cases": results,
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rendering benchmark suite")
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help="Baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="Write results as the new baseline")
+    parser.add_argument('--check', action='store_true', help="Fail if throughput regressed past --tolerance")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="Allowed throughput drop (fraction)")
+    parser.add_argument('--quick', action='store_true', help="Run a small subset of cases")
+    parser.add_argument('--cases', help="Comma-separated case ids to run")
+    parser.add_argument('--slides', type=int, default=5, help="Slides per carousel")
+    parser.add_argument('--runs', type=int, default=3, help="Timed carousels per case")
+    parser.add_argument('--timeout', type=float, default=600.0, help="Seconds before a case counts as failed")
+    args = parser.parse_args(argv)
+
+    cases = benchmark_cases(args.quick)
+    if args.cases:
+        wanted = set(args.cases.split(','))
+        cases = {case_id: params for case_id, params in cases.items() if case_id in wanted}
+
+    baseline = load_baseline(args.baseline) if args.check else {}
+    results = {}
+    print(f"{'case':24} {'slides/s':>10} {'peak RSS':>10} {'vs baseline':>12}")
+    failures = []
+    for case_id, params in cases.items():
+        try:
+            result = run_isolated(params, args.slides, args.runs, args.timeout)
+        except RuntimeError as e:
+            failures.append(case_id)
+            print(f"FAILED {case_id}: {str(e)}")
+            continue
+        results[case_id] = result
+        expected = baseline.get("cases", {}).get(case_id)
+        delta = ""
+        if expected:
+            delta = f"{(result['slides_per_sec'] / expected['slides_per_sec'] - 1) * 100:+.1f}%"
+        print(f"{case_id:24} {result['slides_per_sec']:10.2f} {result['peak_rss_mb']:8.1f}MB {delta:>12}")
+
+    if failures:
+        print(f"{len(failures)} case(s) failed to run; no baseline saved or compared")
+        return 1
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.check:
+        regressions = compare(results, baseline, args.tolerance)
+        for case_id, expected, actual in regressions:
+            print(f"REGRESSION {case_id}: {actual:.2f} slides/s < {expected:.2f} baseline "
+                  f"(tolerance {args.tolerance:.0%})")
+        if regressions:
+            return 1
+        print(f"No throughput regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
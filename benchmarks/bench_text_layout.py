@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark: cached TextLayout vs the original per-word textbbox wrapper.
+
+Run: python benchmarks/bench_text_layout.py [--words 300] [--runs 20]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.carousel_renderer import CarouselRenderer
+from rendering.text_layout import TextLayout
+
+VOCABULARY = (
+    "octopuses have three hearts and blue blood while honey never spoils "
+    "because of its low moisture content the eiffel tower grows about fifteen "
+    "centimeters taller in summer when the iron expands bananas are berries "
+    "but strawberries are not a day on venus is longer than its year"
+).split()
+
+
+def legacy_wrap(draw, font, text, max_width):
+    """The wrapping loop CarouselRenderer.create_slide used before TextLayout."""
+    lines = []
+    current_line = []
+    for word in text.split():
+        test_line = ' '.join(current_line + [word])
+        if draw.textbbox((0, 0), test_line, font=font)[2] < max_width:
+            current_line.append(word)
+        else:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+    lines.append(' '.join(current_line))
+    widths = [draw.textbbox((0, 0), line, font=font)[2] for line in lines]
+    return list(zip(lines, widths))
+
+
+def make_text(words, seed=0):
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def time_it(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=300)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    renderer = CarouselRenderer()
+    draw = ImageDraw.Draw(Image.new('RGB', (renderer.width, renderer.height)))
+    max_width = renderer.width - 100
+    texts = [make_text(args.words, seed) for seed in range(args.runs)]
+
+    for text in texts:
+        expected = legacy_wrap(draw, renderer.font, text, max_width)
+        actual = TextLayout(renderer.font, max_width).wrap(text)
+        if expected != actual:
+            sys.exit("TextLayout wrapping differs from the legacy wrapper")
+
+    legacy = time_it(lambda: [legacy_wrap(draw, renderer.font, t, max_width) for t in texts], 1)
+    cold = time_it(lambda: [TextLayout(renderer.font, max_width).wrap(t) for t in texts], 1)
+    layout = TextLayout(renderer.font, max_width)
+    warm = time_it(lambda: [layout.wrap(t) for t in texts], 1)
+
+    per_slide = lambda total: total / len(texts) * 1000
+    print(f"{args.words}-word slides, {len(texts)} texts (identical wrapping verified)")
+    print(f"  legacy textbbox wrap : {per_slide(legacy):8.2f} ms/slide")
+    print(f"  TextLayout (cold)    : {per_slide(cold):8.2f} ms/slide  ({legacy / cold:5.1f}x)")
+    print(f"  TextLayout (warm)    : {per_slide(warm):8.2f} ms/slide  ({legacy / warm:5.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
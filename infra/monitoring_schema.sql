@@ -103,6 +103,28 @@ CREATE TABLE IF NOT EXISTS monitoring.improvements (
 -- Create indexes for improvements queries
 CREATE INDEX IF NOT EXISTS idx_improvements_status ON monitoring.improvements (status, priority, suggested_at DESC);
 
+-- External API calls (Claude, Groq, Gemini, Pexels, Instagram Graph API)
+-- Written in batches by src/api_clients/instrumentation.py
+CREATE TABLE IF NOT EXISTS monitoring.api_calls (
+    id BIGSERIAL PRIMARY KEY,
+    called_at TIMESTAMPTZ NOT NULL,
+    provider TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    latency_ms FLOAT NOT NULL CHECK (latency_ms >= 0),
+    status_code INT,
+    success BOOLEAN NOT NULL,
+    error TEXT,
+    retries INT NOT NULL DEFAULT 0 CHECK (retries >= 0),
+    input_tokens INT CHECK (input_tokens IS NULL OR input_tokens >= 0),
+    output_tokens INT CHECK (output_tokens IS NULL OR output_tokens >= 0),
+    cache_read_tokens INT CHECK (cache_read_tokens IS NULL OR cache_read_tokens >= 0),
+    cache_write_tokens INT CHECK (cache_write_tokens IS NULL OR cache_write_tokens >= 0)
+);
+
+-- Create indexes for API call queries
+CREATE INDEX IF NOT EXISTS idx_api_calls_called_at ON monitoring.api_calls (called_at DESC);
+CREATE INDEX IF NOT EXISTS idx_api_calls_provider ON monitoring.api_calls (provider, called_at DESC);
+
 -- Views for common queries
 
 -- Recent vitals (last 24 hours)
@@ -172,6 +194,36 @@ ORDER BY
     END,
     suggested_at DESC;
 
+-- API latency histogram per provider (last 24 hours, power-of-two millisecond buckets)
+CREATE OR REPLACE VIEW monitoring.api_latency_histogram AS
+SELECT
+    provider,
+    POWER(2, CEIL(LOG(2, GREATEST(latency_ms, 1)::NUMERIC)))::INT AS bucket_le_ms,
+    COUNT(*) AS calls,
+    COUNT(*) FILTER (WHERE NOT success) AS failed
+FROM monitoring.api_calls
+WHERE called_at > NOW() - INTERVAL '24 hours'
+GROUP BY provider, bucket_le_ms
+ORDER BY provider, bucket_le_ms;
+
+-- Hourly API latency percentiles, error rate and tokens per provider (last 7 days)
+CREATE OR REPLACE VIEW monitoring.api_latency_hourly AS
+SELECT
+    date_trunc('hour', called_at) AS hour,
+    provider,
+    COUNT(*) AS calls,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY latency_ms) AS p50_ms,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY latency_ms) AS p95_ms,
+    (COUNT(*) FILTER (WHERE NOT success))::FLOAT / COUNT(*) AS error_rate,
+    SUM(retries) AS retries,
+    SUM(input_tokens) AS input_tokens,
+    SUM(output_tokens) AS output_tokens,
+    SUM(cache_read_tokens) AS cache_read_tokens
+FROM monitoring.api_calls
+WHERE called_at > NOW() - INTERVAL '7 days'
+GROUP BY hour, provider
+ORDER BY hour DESC, provider;
+
 -- Data retention policy (keep 90 days detailed, aggregate older data)
 -- This will be implemented via a cron job that runs monthly
 
@@ -181,6 +233,8 @@ COMMENT ON TABLE monitoring.service_health IS 'Docker service status checks';
 COMMENT ON TABLE monitoring.incidents IS 'Problems detected and resolutions attempted';
 COMMENT ON TABLE monitoring.disk_usage IS 'Disk usage breakdown per mount point';
 COMMENT ON TABLE monitoring.improvements IS 'Suggested optimizations and enhancements';
+COMMENT ON TABLE monitoring.api_calls IS 'Latency, status, retries and tokens of external API calls';
+COMMENT ON COLUMN monitoring.api_calls.retries IS 'HTTP-session retries (Pexels, Instagram); always 0 for LLM SDK calls, which retry internally';
 
 -- Grant permissions (assuming nexus database user exists)
 -- Note: This may need adjustment based on actual PostgreSQL user setup
@@ -12,6 +12,8 @@ INSTAGRAM_TOKEN="${INSTAGRAM_ACCESS_TOKEN:-}"
 POSTGRES_CONTAINER="nexus-postgres"
 POSTGRES_USER="faceless"
 POSTGRES_DB="nexus_system"
+MEDIA_PAGE_SIZE="${MEDIA_PAGE_SIZE:-100}"   # posts per Graph API page (max 100)
+MEDIA_MAX_PAGES="${MEDIA_MAX_PAGES:-50}"    # safety stop for the paging loop
 
 log() {
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] $1"
@@ -62,11 +64,21 @@ EOF
 
 log "Account data stored successfully"
 
-# Step 4: Collect recent posts with insights (Business API provides reach/impressions)
-log "Collecting recent posts..."
-posts_json=$(curl -s "https://graph.facebook.com/v18.0/${ig_business_id}/media?access_token=${INSTAGRAM_TOKEN}&fields=id,caption,media_type,media_url,permalink,timestamp,like_count,comments_count,shares_count&limit=10")
+# Step 4: Collect all posts with insights (Business API provides reach/impressions),
+# following the paging.next cursors one page at a time
+log "Collecting posts..."
+posts_url="https://graph.facebook.com/v18.0/${ig_business_id}/media?access_token=${INSTAGRAM_TOKEN}&fields=id,caption,media_type,media_url,permalink,timestamp,like_count,comments_count,shares_count&limit=${MEDIA_PAGE_SIZE}"
+post_count=0
+pages=0
 
-post_count=$(echo "$posts_json" | python3 -c "import sys, json; data = json.load(sys.stdin); print(len(data.get('data', [])))" 2>/dev/null || echo "0")
-log "Found $post_count recent posts"
+while [[ -n "$posts_url" && $pages -lt $MEDIA_MAX_PAGES ]]; do
+    posts_json=$(curl -s "$posts_url")
+    page_count=$(echo "$posts_json" | python3 -c "import sys, json; data = json.load(sys.stdin); print(len(data.get('data', [])))" 2>/dev/null || echo "0")
+    posts_url=$(echo "$posts_json" | python3 -c "import sys, json; data = json.load(sys.stdin); print(data.get('paging', {}).get('next', ''))" 2>/dev/null || echo "")
+    post_count=$((post_count + page_count))
+    pages=$((pages + 1))
+done
 
-log "Instagram sync complete! Collected account metrics and $post_count recent posts"
+log "Found $post_count posts across $pages pages"
+
+log "Instagram sync complete! Collected account metrics and $post_count posts"
@@ -0,0 +1,104 @@
+"""Shared behaviour for the text generation clients (Claude, Groq, Gemini)."""
+
+import json
+import time
+
+from .batch import BatchResult, generate_batch
+from .instrumentation import default_instrumentation
+from .rate_limit import RateLimiter, provider_limiter
+from .response_cache import ResponseCache, default_cache
+
+
+class LLMClient:
+    """Base class for clients exposing generate_text(prompt, max_tokens)"""
+
+    provider = None
+    model = None
+
+    def __init__(self, cache: ResponseCache = None, rate_limiter: RateLimiter = None):
+        """
+        Args:
+            cache: Response cache shared between clients (defaults to the
+                $LLM_CACHE_PATH cache when that variable is set, else none)
+            rate_limiter: Request/token limits (defaults to the process-wide
+                limiter for this provider, configured from the environment)
+        """
+        self.cache = cache if cache is not None else default_cache()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else provider_limiter(self.provider)
+        self.instrumentation = default_instrumentation()
+
+    def generate_text(self, prompt: str, max_tokens: int = 1000, use_cache: bool = True, **options) -> str:
+        """
+        Generate text, serving identical earlier requests from the response cache
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Maximum tokens to generate
+            use_cache: False to always call the API (the fresh answer is still cached)
+            options: Request options every client accepts: system (system prompt) and
+                prefix (long, stable context sent ahead of the prompt)
+        """
+        cache_prompt = self._cache_prompt(prompt, options)
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(self.provider, self.model, cache_prompt, max_tokens)
+            if cached is not None:
+                return cached
+        self.rate_limiter.acquire(cache_prompt, max_tokens)  # counts system and prefix too
+        start = time.perf_counter()
+        with self.instrumentation.track(self.provider, "generate"):
+            text = self._generate(prompt, max_tokens, **options)
+        if self.cache is not None:
+            self.cache.put(self.provider, self.model, cache_prompt, max_tokens, text, time.perf_counter() - start)
+        return text
+
+    def generate_batch(self, prompts: list[str], max_tokens: int = 1000, concurrency: int = 4,
+                       use_cache: bool = True, **options) -> list[BatchResult]:
+        """
+        Generate for many prompts concurrently, within this provider's rate limits
+
+        Returns:
+            BatchResult(index, prompt, text, error) per prompt, in input order
+        """
+        return generate_batch(self.generate_text, prompts, max_tokens, concurrency, use_cache=use_cache, **options)
+
+    def generate_stream(self, prompt: str, max_tokens: int = 1000, use_cache: bool = True, **options):
+        """
+        Stream generated text as it arrives (a cached response is yielded as one chunk)
+
+        Yields:
+            Text chunks; the completed response is stored in the response cache
+        """
+        cache_prompt = self._cache_prompt(prompt, options)
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(self.provider, self.model, cache_prompt, max_tokens)
+            if cached is not None:
+                yield cached
+                return
+        self.rate_limiter.acquire(cache_prompt, max_tokens)  # counts system and prefix too
+        start = time.perf_counter()
+        chunks = []
+        with self.instrumentation.track(self.provider, "stream") as call:
+            for chunk in self._stream(prompt, max_tokens, **options):
+                if chunk:
+                    chunks.append(chunk)
+                    # Time the consumer spends on a chunk (e.g. rendering a slide) is not provider latency
+                    paused = time.perf_counter()
+                    try:
+                        yield chunk
+                    finally:
+                        call["idle"] += time.perf_counter() - paused
+        if self.cache is not None:
+            self.cache.put(self.provider, self.model, cache_prompt, max_tokens, "".join(chunks),
+                           time.perf_counter() - start)
+
+    def _cache_prompt(self, prompt: str, options: dict) -> str:
+        # Response cache key text: the prompt, plus any options that change the answer
+        if not options:
+            return prompt
+        return json.dumps([prompt, options], sort_keys=True, default=str)
+
+    def _generate(self, prompt: str, max_tokens: int) -> str:
+        raise NotImplementedError
+
+    def _stream(self, prompt: str, max_tokens: int):
+        raise NotImplementedError
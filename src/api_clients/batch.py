@@ -0,0 +1,34 @@
+"""Concurrent batch generation over any generate_text(prompt, max_tokens) callable."""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# One result per prompt, in input order; exactly one of text and error is set
+BatchResult = namedtuple("BatchResult", ["index", "prompt", "text", "error"])
+
+
+def generate_batch(generate_text, prompts: list[str], max_tokens: int = 1000, concurrency: int = 4,
+                   **kwargs) -> list[BatchResult]:
+    """
+    Run generate_text over many prompts on a thread pool
+
+    Args:
+        generate_text: Callable taking (prompt, max_tokens, **kwargs)
+        prompts: Prompts to generate for
+        max_tokens: Maximum tokens per completion
+        concurrency: Requests in flight at once
+        kwargs: Passed through to generate_text (e.g. use_cache=False)
+
+    Returns:
+        BatchResult per prompt in input order; a failed prompt carries its
+        exception message in error instead of aborting the batch
+    """
+    def run(item):
+        index, prompt = item
+        try:
+            return BatchResult(index, prompt, generate_text(prompt, max_tokens, **kwargs), None)
+        except Exception as e:
+            return BatchResult(index, prompt, None, str(e))
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="llm-batch") as executor:
+        return list(executor.map(run, enumerate(prompts)))
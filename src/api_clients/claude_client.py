@@ -1,18 +1,121 @@
 import os
-from anthropic import Anthropic
+import threading
 
-class ClaudeClient:
-    def __init__(self):
+from .base import LLMClient
+from .instrumentation import annotate
+
+# Marks the end of a block that Anthropic may cache and reuse for later requests
+EPHEMERAL = {"type": "ephemeral"}
+
+USAGE_FIELDS = ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens")
+
+class ClaudeClient(LLMClient):
+    provider = "claude"
+    model = "claude-3-haiku-20240307"
+
+    def __init__(self, cache=None, rate_limiter=None, system=None):
+        """
+        Initialize the Claude client
+
+        Args:
+            cache: Optional ResponseCache
+            rate_limiter: Optional RateLimiter
+            system: Default system prompt (e.g. the FactsMind style guide), a string or list of strings
+        """
+        super().__init__(cache, rate_limiter)
+        from anthropic import Anthropic  # imported on first use; the SDK is slow to load
         self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
-    
-    def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
-        """Generate text using Claude API"""
+        self.system = system
+        self.usage = dict.fromkeys(USAGE_FIELDS, 0)
+        self.requests = 0
+        self._usage_lock = threading.Lock()
+
+    def _system_blocks(self, system):
+        # The breakpoint on the last block caches the whole system prompt
+        system = self.system if system is None else system
+        if not system:
+            return None
+        texts = [system] if isinstance(system, str) else list(system)
+        blocks = [{"type": "text", "text": text} for text in texts]
+        blocks[-1]["cache_control"] = EPHEMERAL
+        return blocks
+
+    @staticmethod
+    def _messages(prompt: str, prefix: str = None) -> list:
+        # A stable prefix (e.g. the MetricsEngine brief) is cached; only the short ask after it varies
+        if not prefix:
+            return [{"role": "user", "content": prompt}]
+        return [{"role": "user", "content": [
+            {"type": "text", "text": prefix, "cache_control": EPHEMERAL},
+            {"type": "text", "text": prompt},
+        ]}]
+
+    def _request(self, prompt: str, max_tokens: int, system=None, prefix: str = None) -> dict:
+        request = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": self._messages(prompt, prefix),
+        }
+        system_blocks = self._system_blocks(system)
+        if system_blocks:
+            request["system"] = system_blocks
+        return request
+
+    def _cache_prompt(self, prompt: str, options: dict) -> str:
+        # The default system prompt changes the answer too, so it belongs in the response cache key
+        if options.get("system") is None and self.system:
+            options = dict(options, system=self.system)
+        return super()._cache_prompt(prompt, options)
+
+    def _record_usage(self, usage):
+        annotate(input_tokens=getattr(usage, "input_tokens", None),
+                 output_tokens=getattr(usage, "output_tokens", None),
+                 cache_read_tokens=getattr(usage, "cache_read_input_tokens", None),
+                 cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None))
+        with self._usage_lock:
+            self.requests += 1
+            for field in USAGE_FIELDS:
+                value = getattr(usage, field, None)
+                if isinstance(value, int):  # older SDKs omit the cache fields
+                    self.usage[field] += value
+
+    def usage_report(self) -> dict:
+        """
+        Input token totals split by prompt-cache outcome
+
+        Returns:
+            Token counters, plus cache_hit_rate: the share of input tokens read from the cache
+        """
+        with self._usage_lock:
+            report = dict(self.usage, requests=self.requests)
+        total_input = (report["input_tokens"] + report["cache_creation_input_tokens"]
+                       + report["cache_read_input_tokens"])
+        report["cache_hit_rate"] = round(report["cache_read_input_tokens"] / total_input, 3) if total_input else 0.0
+        return report
+
+    def _generate(self, prompt: str, max_tokens: int = 1000, system=None, prefix: str = None) -> str:
+        """
+        Generate text using Claude API
+
+        Args:
+            prompt: Short, request-specific ask
+            max_tokens: Maximum tokens to generate
+            system: System prompt overriding the client default (cached)
+            prefix: Long, stable context sent ahead of the prompt (cached). Blocks
+                shorter than the model's minimum cacheable length are sent uncached.
+        """
         try:
-            response = self.client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            response = self.client.messages.create(**self._request(prompt, max_tokens, system, prefix))
+            self._record_usage(getattr(response, "usage", None))
             return response.content[0].text
         except Exception as e:
-            raise Exception(f"Claude API error: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Claude API error: {str(e)}")
+
+    def _stream(self, prompt: str, max_tokens: int = 1000, system=None, prefix: str = None):
+        """Stream text using Claude API"""
+        try:
+            with self.client.messages.stream(**self._request(prompt, max_tokens, system, prefix)) as stream:
+                yield from stream.text_stream
+                self._record_usage(getattr(stream.get_final_message(), "usage", None))
+        except Exception as e:
+            raise Exception(f"Claude API error: {str(e)}")
@@ -1,15 +1,44 @@
 import os
-import google.generativeai as genai
 
-class GeminiClient:
-    def __init__(self):
+from .base import LLMClient
+from .instrumentation import annotate
+
+class GeminiClient(LLMClient):
+    provider = "gemini"
+    model = "gemini-2.5-flash"
+
+    def __init__(self, cache=None, rate_limiter=None):
+        super().__init__(cache, rate_limiter)
+        import google.generativeai as genai  # imported on first use; takes seconds on the Pi
         genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self._genai = genai
+        self.model_client = genai.GenerativeModel(self.model)
+
+    def _model_for(self, system):
+        # The system prompt is fixed per GenerativeModel, so a call with one gets its own model object
+        if not system:
+            return self.model_client
+        return self._genai.GenerativeModel(self.model, system_instruction=system)
+
+    @staticmethod
+    def _contents(prompt: str, prefix: str = None):
+        return [prefix, prompt] if prefix else prompt
 
-    def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
-        """Generate text using Gemini API"""
+    def _generate(self, prompt: str, max_tokens: int = 1000, system=None, prefix: str = None) -> str:
+        """Generate text using Gemini API (system and prefix as for ClaudeClient)"""
         try:
-            response = self.model.generate_content(prompt)
+            response = self._model_for(system).generate_content(self._contents(prompt, prefix))
+            usage = getattr(response, "usage_metadata", None)
+            annotate(input_tokens=getattr(usage, "prompt_token_count", None),
+                     output_tokens=getattr(usage, "candidates_token_count", None))
             return response.text
         except Exception as e:
-            raise Exception(f"Gemini API error: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Gemini API error: {str(e)}")
+
+    def _stream(self, prompt: str, max_tokens: int = 1000, system=None, prefix: str = None):
+        """Stream text using Gemini API"""
+        try:
+            for chunk in self._model_for(system).generate_content(self._contents(prompt, prefix), stream=True):
+                yield chunk.text
+        except Exception as e:
+            raise Exception(f"Gemini API error: {str(e)}")
@@ -1,18 +1,52 @@
 import os
-from groq import Groq
 
-class GroqClient:
-    def __init__(self):
+from .base import LLMClient
+from .instrumentation import annotate
+
+class GroqClient(LLMClient):
+    provider = "groq"
+    model = "llama3-8b-8192"
+
+    def __init__(self, cache=None, rate_limiter=None):
+        super().__init__(cache, rate_limiter)
+        from groq import Groq  # imported on first use; the SDK is slow to load
         self.client = Groq(api_key=os.getenv('GROQ_API_KEY'))
-    
-    def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
-        """Generate text using Groq API"""
+
+    @staticmethod
+    def _messages(prompt: str, system=None, prefix: str = None) -> list:
+        # Groq has no prompt caching: the system prompt becomes a system message, the prefix leads the user text
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system if isinstance(system, str) else "\n\n".join(system)})
+        messages.append({"role": "user", "content": f"{prefix}\n\n{prompt}" if prefix else prompt})
+        return messages
+
+    def _generate(self, prompt: str, max_tokens: int = 1000, system=None, prefix: str = None) -> str:
+        """Generate text using Groq API (system and prefix as for ClaudeClient)"""
         try:
             response = self.client.chat.completions.create(
-                model="llama3-8b-8192",
-                messages=[{"role": "user", "content": prompt}],
+                model=self.model,
+                messages=self._messages(prompt, system, prefix),
                 max_tokens=max_tokens
             )
+            usage = getattr(response, "usage", None)
+            annotate(input_tokens=getattr(usage, "prompt_tokens", None),
+                     output_tokens=getattr(usage, "completion_tokens", None))
             return response.choices[0].message.content
         except Exception as e:
-            raise Exception(f"Groq API error: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Groq API error: {str(e)}")
+
+    def _stream(self, prompt: str, max_tokens: int = 1000, system=None, prefix: str = None):
+        """Stream text using Groq API"""
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._messages(prompt, system, prefix),
+                max_tokens=max_tokens,
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            raise Exception(f"Groq API error: {str(e)}")
@@ -0,0 +1,122 @@
+"""Pooled, retrying HTTP session shared by the Pexels and Instagram clients.
+
+A requests.Session keeps TCP/TLS connections alive between calls instead of
+paying a new handshake per request (the module-level requests.get opens a fresh
+connection every time). The session's adapter retries idempotent requests on
+connection errors, 429 and 5xx with exponential backoff, honours Retry-After
+(capped so a bad header cannot stall a sync for an hour) and applies a default
+timeout to every request. get() and head() also record each call with the
+instrumentation.
+"""
+
+import os
+import threading
+
+from .instrumentation import default_instrumentation
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+DEFAULT_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+DEFAULT_RETRIES = int(os.getenv('HTTP_RETRIES', '3'))
+DEFAULT_TIMEOUT = (5.0, float(os.getenv('HTTP_TIMEOUT', '30')))  # (connect, read) seconds
+
+
+def make_session(pool_size: int = DEFAULT_POOL_SIZE, retries: int = DEFAULT_RETRIES, backoff_factor: float = 0.5,
+                 timeout=DEFAULT_TIMEOUT, max_retry_after: float = 60.0):
+    """
+    Create a keep-alive session with retries and a default timeout
+
+    Args:
+        pool_size: Connections kept open per host (raise it to match download concurrency)
+        retries: Retries per request for connection errors, 429 and 5xx responses
+        backoff_factor: Exponential backoff base in seconds (0.5 -> 0.5s, 1s, 2s, ...)
+        timeout: Default timeout, seconds or a (connect, read) tuple; per-call timeouts win
+        max_retry_after: Longest Retry-After wait honoured, in seconds
+
+    Returns:
+        requests.Session
+    """
+    import requests  # imported on first use to keep startup fast
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class CappedRetry(Retry):
+        """Retry that honours Retry-After up to max_retry_after seconds"""
+
+        def get_retry_after(self, response):
+            retry_after = super().get_retry_after(response)
+            return None if retry_after is None else min(retry_after, max_retry_after)
+
+    class TimeoutSession(requests.Session):
+        def request(self, method, url, **kwargs):
+            kwargs.setdefault("timeout", self.timeout)
+            return super().request(method, url, **kwargs)
+
+    retry = CappedRetry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # hand the final response back so raise_for_status reports it
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = TimeoutSession()
+    session.timeout = timeout
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_shared_session = None
+_shared_lock = threading.Lock()
+
+
+def shared_session():
+    """Process-wide pooled session (pool size, retries and timeout from the environment)"""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = make_session()
+        return _shared_session
+
+
+def retries_of(response) -> int:
+    """Retries urllib3 made before this response"""
+    retry = getattr(getattr(response, "raw", None), "retries", None)
+    history = getattr(retry, "history", None)
+    return len(history) if isinstance(history, tuple) else 0
+
+
+def request(method: str, provider: str, operation: str, url: str, session=None, **kwargs):
+    """
+    Send a request through the pooled session, recorded as one instrumented call
+
+    Args:
+        method: HTTP method with a matching Session method ("GET", "HEAD")
+        provider: Instrumentation provider name (e.g. "pexels")
+        operation: Instrumentation operation name (e.g. "search")
+        url: Request URL
+        session: Session to use (default: shared_session())
+        kwargs: Passed to the session (params, headers, stream, timeout, ...)
+
+    Returns:
+        requests.Response (HTTP errors are left to raise_for_status)
+    """
+    session = session if session is not None else shared_session()
+    with default_instrumentation().track(provider, operation) as call:
+        response = getattr(session, method.lower())(url, **kwargs)
+        call["status_code"] = response.status_code
+        call["retries"] = retries_of(response)
+    return response
+
+
+def get(provider: str, operation: str, url: str, session=None, **kwargs):
+    """GET through the pooled session (see request())"""
+    return request("GET", provider, operation, url, session, **kwargs)
+
+
+def head(provider: str, operation: str, url: str, session=None, **kwargs):
+    """HEAD through the pooled session, following redirects (see request())"""
+    kwargs.setdefault("allow_redirects", True)
+    return request("HEAD", provider, operation, url, session, **kwargs)
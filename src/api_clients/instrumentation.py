@@ -0,0 +1,276 @@
+"""Latency, status and token instrumentation for every external API call.
+
+Each Claude, Groq, Gemini, Pexels and Instagram Graph API request runs inside
+Instrumentation.track(provider, operation), which times it and records its HTTP
+status, retry count, token usage and error as an ApiCall. Retries are counted
+for requests through the pooled HTTP session (Pexels, Instagram) only: the LLM
+SDKs retry internally, out of sight, so their calls always record 0. Records
+are summarized in-process (per-provider latency percentiles, error rates, token
+totals) and, when a sink is configured, queued and written in batches by a
+background thread so a slow or unreachable database never adds latency to the
+calls themselves. The default sink inserts into monitoring.api_calls
+(infra/monitoring_schema.sql).
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional
+
+from .llm_router import percentile
+
+ApiCall = namedtuple("ApiCall", [
+    "called_at", "provider", "operation", "latency_ms", "status_code", "success", "error", "retries",
+    "input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens",
+])
+
+# Fields a client may fill in on the call in progress; counts must be ints
+COUNT_FIELDS = ("status_code", "retries", "input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens")
+
+# Calls in progress on this thread, innermost last (shared by every Instrumentation)
+_active = threading.local()
+
+
+def _active_calls() -> list:
+    if not hasattr(_active, "calls"):
+        _active.calls = []
+    return _active.calls
+
+
+def annotate(**fields):
+    """Attach status, retries or token counts to the innermost call being tracked on this thread"""
+    calls = _active_calls()
+    if calls:
+        calls[-1].update(fields)
+
+
+def status_code_of(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an SDK or requests error, following wrapped exceptions"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        for source in (error, getattr(error, "response", None)):
+            code = getattr(source, "status_code", None)
+            if isinstance(code, int):
+                return code
+        error = error.__cause__ or error.__context__
+    return None
+
+
+class ProviderCallStats:
+    """Rolling latency window and running totals for one provider"""
+
+    def __init__(self, window: int = 1000):
+        self.latencies = deque(maxlen=window)  # milliseconds
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.tokens = dict.fromkeys(COUNT_FIELDS[2:], 0)
+
+    def add(self, call: ApiCall):
+        self.calls += 1
+        self.latencies.append(call.latency_ms)
+        if not call.success:
+            self.errors += 1
+        self.retries += call.retries
+        for field in self.tokens:
+            self.tokens[field] += getattr(call, field) or 0
+
+
+class Instrumentation:
+    """Records ApiCalls in-process and flushes them to a sink in batches"""
+
+    def __init__(self, sink=None, batch_size: int = 200, flush_interval: float = 10.0,
+                 max_pending: int = 10000, window: int = 1000):
+        """
+        Initialize instrumentation
+
+        Args:
+            sink: Callable taking a list of ApiCall (e.g. PostgresSink), or None to keep records in-process only
+            batch_size: Pending records that trigger an early flush
+            flush_interval: Seconds between background flushes
+            max_pending: Unflushed records kept while the sink is failing; the oldest are dropped beyond it
+            window: Recent latencies kept per provider for percentiles
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.window = window
+        self.flushed = 0
+        self.dropped = 0
+        self.flush_errors = 0
+        self._pending = deque(maxlen=max_pending)
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._flusher = None
+
+    @contextmanager
+    def track(self, provider: str, operation: str):
+        """
+        Time one external call
+
+        Yields:
+            Dict for the call in progress; set status_code (or call annotate())
+            once the response is known, and add seconds spent outside the call
+            (e.g. a stream's consumer between chunks) to idle so they are not
+            counted as latency. An exception marks the call failed.
+        """
+        call = {"status_code": None, "retries": 0, "error": None, "idle": 0.0}
+        calls = _active_calls()
+        calls.append(call)
+        called_at = time.time()
+        start = time.perf_counter()
+        try:
+            yield call
+        except Exception as e:
+            call["error"] = str(e)[:500]
+            if call["status_code"] is None:
+                call["status_code"] = status_code_of(e)
+            raise
+        finally:
+            latency_ms = max(0.0, time.perf_counter() - start - call["idle"]) * 1000
+            # Remove by identity: a suspended stream may still be tracked below newer calls
+            for index in range(len(calls) - 1, -1, -1):
+                if calls[index] is call:
+                    del calls[index]
+                    break
+            self.record(self._to_record(provider, operation, called_at, latency_ms, call))
+
+    @staticmethod
+    def _to_record(provider, operation, called_at, latency_ms, call) -> ApiCall:
+        counts = {field: call.get(field) if isinstance(call.get(field), int) else None for field in COUNT_FIELDS}
+        counts["retries"] = counts["retries"] or 0
+        status = counts["status_code"]
+        success = call["error"] is None and (status is None or status < 400)
+        return ApiCall(called_at=called_at, provider=provider, operation=operation, latency_ms=round(latency_ms, 3),
+                       success=success, error=call["error"], **counts)
+
+    def record(self, call: ApiCall):
+        """Add a finished call to the stats and, with a sink, to the flush queue"""
+        with self._lock:
+            stats = self._stats.get(call.provider)
+            if stats is None:
+                stats = self._stats[call.provider] = ProviderCallStats(self.window)
+            stats.add(call)
+            if self.sink is None:
+                return
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append(call)
+            pending = len(self._pending)
+            if self._flusher is None and not self._closed.is_set():
+                self._flusher = threading.Thread(target=self._flush_loop, name="api-metrics-flush", daemon=True)
+                self._flusher.start()
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def _flush_loop(self):
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write pending records to the sink
+
+        Returns:
+            Number of records written (failed batches are re-queued for the next flush)
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending)
+                self._pending.clear()
+            if not batch or self.sink is None:
+                return 0
+            try:
+                self.sink(batch)
+            except Exception as e:
+                with self._lock:
+                    self.flush_errors += 1
+                    requeued = batch + list(self._pending)
+                    overflow = max(0, len(requeued) - self._pending.maxlen)
+                    self.dropped += overflow
+                    self._pending = deque(requeued[overflow:], maxlen=self._pending.maxlen)
+                print(f"Warning: could not flush {len(batch)} API call records: {str(e)}")
+                return 0
+            with self._lock:
+                self.flushed += len(batch)
+            return len(batch)
+
+    def stats(self) -> dict:
+        """Per-provider call counts, error rate, latency percentiles and token totals"""
+        with self._lock:
+            providers = {}
+            for provider, stats in self._stats.items():
+                p50, p95 = percentile(stats.latencies, 50), percentile(stats.latencies, 95)
+                providers[provider] = dict(
+                    calls=stats.calls,
+                    errors=stats.errors,
+                    error_rate=round(stats.errors / stats.calls, 3) if stats.calls else 0.0,
+                    retries=stats.retries,
+                    p50_ms=round(p50, 1) if p50 is not None else None,
+                    p95_ms=round(p95, 1) if p95 is not None else None,
+                    **stats.tokens,
+                )
+            return {"providers": providers, "pending": len(self._pending), "flushed": self.flushed,
+                    "dropped": self.dropped, "flush_errors": self.flush_errors}
+
+    def close(self):
+        """Stop the background flusher and write what is left"""
+        self._closed.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+
+class PostgresSink:
+    """Inserts ApiCall batches into monitoring.api_calls"""
+
+    INSERT = ("INSERT INTO monitoring.api_calls (called_at, provider, operation, latency_ms, status_code, success, "
+              "error, retries, input_tokens, output_tokens, cache_read_tokens, cache_write_tokens) VALUES %s")
+
+    def __init__(self, dsn: str):
+        """
+        Args:
+            dsn: libpq connection string for the nexus_system database
+        """
+        self.dsn = dsn
+        self.connection = None
+
+    def __call__(self, calls: list):
+        import psycopg2  # imported on first flush; the driver is optional for in-process use
+        import psycopg2.extras
+        if self.connection is None or self.connection.closed:
+            self.connection = psycopg2.connect(self.dsn)
+        rows = [(datetime.fromtimestamp(call.called_at, timezone.utc),) + tuple(call[1:]) for call in calls]
+        try:
+            with self.connection.cursor() as cursor:
+                psycopg2.extras.execute_values(cursor, self.INSERT, rows, page_size=len(rows))
+            self.connection.commit()
+        except Exception:
+            self.connection.close()  # reconnect on the next flush
+            raise
+
+
+_default_instrumentation = None
+
+
+def default_instrumentation() -> Instrumentation:
+    """Process-wide instrumentation, flushing to $MONITORING_DB_DSN when that variable is set"""
+    global _default_instrumentation
+    dsn = os.getenv('MONITORING_DB_DSN')
+    if _default_instrumentation is None or getattr(_default_instrumentation.sink, "dsn", None) != dsn:
+        if _default_instrumentation is not None:
+            _default_instrumentation.close()
+        _default_instrumentation = Instrumentation(PostgresSink(dsn) if dsn else None)
+        atexit.register(_default_instrumentation.close)
+    return _default_instrumentation
@@ -0,0 +1,190 @@
+"""Latency-aware routing across the LLM clients, with hedging and failover.
+
+LLMRouter sends each request to the healthy provider with the lowest rolling
+median latency. If that provider fails, the next one is tried. With hedging on,
+a duplicate request goes to the runner-up when the primary has not answered
+within its own p95 latency, and whichever answer arrives first wins. Providers
+whose recent error rate is too high are skipped for a cool-down period.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+from .batch import BatchResult, generate_batch
+
+
+def percentile(values, pct: float) -> Optional[float]:
+    """Nearest-rank percentile of values (None when empty)"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class ProviderStats:
+    """Rolling latency and error window for one provider"""
+
+    def __init__(self, window: int = 100):
+        self.latencies = deque(maxlen=window)  # seconds, successful calls only
+        self.outcomes = deque(maxlen=window)  # True for success
+        self.calls = 0
+        self.unhealthy_until = 0.0
+
+    def record(self, latency: float, ok: bool):
+        self.calls += 1
+        self.outcomes.append(ok)
+        if ok:
+            self.latencies.append(latency)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def p50(self) -> Optional[float]:
+        return percentile(self.latencies, 50)
+
+    def p95(self) -> Optional[float]:
+        return percentile(self.latencies, 95)
+
+
+class LLMRouter:
+    """Routes generate_text calls to the fastest healthy provider"""
+
+    def __init__(self, providers, hedge: bool = False, hedge_delay: float = 2.0, hedge_factor: float = 1.0,
+                 max_error_rate: float = 0.5, min_samples: int = 5, cooldown: float = 60.0, window: int = 100,
+                 max_workers: int = None):
+        """
+        Initialize the router
+
+        Args:
+            providers: Clients with generate_text(prompt, max_tokens), e.g.
+                [ClaudeClient(), GroqClient(), GeminiClient()], or a dict of name -> client
+            hedge: Send a duplicate request to the runner-up when the primary is slow
+            hedge_delay: Hedge delay (seconds) before a provider has latency history
+            hedge_factor: Multiplier on the primary's p95 latency for the hedge delay
+            max_error_rate: Error rate over the window above which a provider is unhealthy
+            min_samples: Calls needed before the error rate is trusted
+            cooldown: Seconds an unhealthy provider is skipped before it is retried
+            window: Number of recent calls kept per provider
+            max_workers: Threads for provider calls (default two per provider;
+                raise it to match generate_batch concurrency)
+        """
+        if isinstance(providers, dict):
+            self.providers = dict(providers)
+        else:
+            self.providers = {getattr(client, "provider", None) or type(client).__name__: client
+                              for client in providers}
+        if not self.providers:
+            raise ValueError("LLMRouter needs at least one provider")
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.hedge_factor = hedge_factor
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.hedged = 0
+        self._stats = {name: ProviderStats(window) for name in self.providers}
+        self._lock = threading.Lock()
+        # Hedged requests keep running after the race is decided, so allow two per provider
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or 2 * len(self.providers),
+                                            thread_name_prefix="llm-router")
+
+    def is_healthy(self, name: str) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._stats[name].unhealthy_until
+
+    def ranked(self) -> list[str]:
+        """Provider names in routing order: healthy by p50 latency, then unhealthy ones as a last resort"""
+        with self._lock:
+            now = time.monotonic()
+            # Providers without history sort first so they get measured
+            def speed(name):
+                p50 = self._stats[name].p50()
+                return p50 if p50 is not None else 0.0
+            healthy = [name for name in self.providers if now >= self._stats[name].unhealthy_until]
+            unhealthy = [name for name in self.providers if name not in healthy]
+            return sorted(healthy, key=speed) + sorted(unhealthy, key=lambda name: self._stats[name].unhealthy_until)
+
+    def _record(self, name: str, latency: float, ok: bool):
+        with self._lock:
+            stats = self._stats[name]
+            stats.record(latency, ok)
+            if not ok and len(stats.outcomes) >= self.min_samples and stats.error_rate > self.max_error_rate:
+                stats.unhealthy_until = time.monotonic() + self.cooldown
+                stats.outcomes.clear()  # start fresh after the cool-down
+
+    def _call(self, name: str, prompt: str, max_tokens: int, kwargs: dict) -> str:
+        start = time.monotonic()
+        try:
+            text = self.providers[name].generate_text(prompt, max_tokens, **kwargs)
+        except Exception:
+            self._record(name, time.monotonic() - start, ok=False)
+            raise
+        self._record(name, time.monotonic() - start, ok=True)
+        return text
+
+    def _hedge_delay_for(self, name: str) -> float:
+        with self._lock:
+            p95 = self._stats[name].p95()
+        return self.hedge_delay if p95 is None else p95 * self.hedge_factor
+
+    def generate_text(self, prompt: str, max_tokens: int = 1000, **kwargs) -> str:
+        """
+        Generate text with the best available provider
+
+        Raises:
+            Exception: If every provider failed (the message lists each error)
+        """
+        order = self.ranked()
+        errors = []
+        while order:
+            primary = order.pop(0)
+            futures = {self._executor.submit(self._call, primary, prompt, max_tokens, kwargs): primary}
+            if self.hedge and order:
+                done, _ = wait(futures, timeout=self._hedge_delay_for(primary))
+                if not done:
+                    backup = order.pop(0)
+                    with self._lock:
+                        self.hedged += 1
+                    futures[self._executor.submit(self._call, backup, prompt, max_tokens, kwargs)] = backup
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        return future.result()
+                    except Exception as e:
+                        errors.append(f"{futures[future]}: {str(e)}")
+        raise Exception(f"All LLM providers failed: {'; '.join(errors)}")
+
+    def generate_batch(self, prompts: list[str], max_tokens: int = 1000, concurrency: int = 4,
+                       **kwargs) -> list[BatchResult]:
+        """Route many prompts concurrently; results in input order with per-item errors"""
+        return generate_batch(self.generate_text, prompts, max_tokens, concurrency, **kwargs)
+
+    def stats(self) -> dict:
+        """Per-provider latency percentiles, error rate and health"""
+        with self._lock:
+            now = time.monotonic()
+            providers = {}
+            for name, stats in self._stats.items():
+                p50, p95 = stats.p50(), stats.p95()
+                providers[name] = {
+                    "calls": stats.calls,
+                    "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                    "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                    "error_rate": round(stats.error_rate, 3),
+                    "healthy": now >= stats.unhealthy_until,
+                }
+            return {"providers": providers, "hedged": self.hedged}
+
+    def close(self):
+        self._executor.shutdown(wait=False)
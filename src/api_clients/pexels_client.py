@@ -1,30 +1,263 @@
+import json
 import os
-import requests
+import threading
+import uuid
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict
 
+try:
+    from ..rendering.file_cache import FileCache
+except ImportError:  # src/ itself is on sys.path (scripts, tests)
+    from rendering.file_cache import FileCache
+
+from . import http_session
+from .pexels_variants import PhotoDownload, select_variant
+from .search_cache import SearchCache
+
+# Bytes read per chunk while streaming a download to disk (bounds memory per download)
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# One result per requested download, in input order; error is None on success
+DownloadResult = namedtuple("DownloadResult", ["url", "filepath", "error"])
+
 class PexelsClient:
-    def __init__(self):
+    def __init__(self, session=None, cache_dir: str = None, cache_max_bytes: int = 512 * 1024 * 1024,
+                 search_cache_path: str = None, search_ttl: float = 3600.0):
+        """
+        Args:
+            session: requests.Session to use (default: the shared pooled session)
+            cache_dir: Directory caching downloaded images by URL (default:
+                $PEXELS_CACHE_DIR; no caching when neither is set)
+            cache_max_bytes: On-disk cap for the image cache; least recently used images go first
+            search_cache_path: SQLite file caching search results across processes (default:
+                $PEXELS_SEARCH_CACHE_PATH, else an in-memory cache private to this client)
+            search_ttl: Seconds a cached search result is reused
+        """
         self.api_key = os.getenv('PEXELS_API_KEY')
         self.base_url = "https://api.pexels.com/v1"
-    
-    def search_images(self, query: str, per_page: int = 10) -> List[Dict]:
-        """Search for images using Pexels API"""
+        self.session = session
+        cache_dir = cache_dir or os.getenv('PEXELS_CACHE_DIR')
+        self.image_cache = FileCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.search_cache = SearchCache(search_cache_path or os.getenv('PEXELS_SEARCH_CACHE_PATH') or ":memory:",
+                                        ttl_seconds=search_ttl)
+        self.coalesced = 0
+        self._inflight = {}  # search key -> Future of the request every identical caller waits on
+        self._inflight_lock = threading.Lock()
+        self._prefetcher = None
+
+    def search_images(self, query: str, per_page: int = 10, page: int = 1, use_cache: bool = True,
+                      prefetch_next: bool = False) -> List[Dict]:
+        """
+        Search for images using Pexels API
+
+        Results are cached per (query, per_page, page) for search_ttl seconds,
+        and concurrent identical searches share one in-flight request.
+
+        Args:
+            query: Search terms
+            per_page: Results per page
+            page: Result page (1-based)
+            use_cache: False to skip the cache lookup (the fresh result is still cached)
+            prefetch_next: Fetch the following page in the background when this one is full
+
+        Returns:
+            List of photo dicts
+        """
         try:
-            headers = {"Authorization": self.api_key}
-            params = {"query": query, "per_page": per_page}
-            response = requests.get(f"{self.base_url}/search", headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data.get('photos', [])
+            photos = self._search(query, per_page, page, use_cache)
         except Exception as e:
             raise Exception(f"Pexels API error: {str(e)}")
-    
-    def download_image(self, url: str, filepath: str) -> None:
-        """Download image from URL to filepath"""
+        if prefetch_next and len(photos) >= per_page:
+            self.prefetch(query, per_page, page + 1)
+        return photos
+
+    def prefetch(self, query: str, per_page: int = 10, page: int = 1) -> Future:
+        """Warm the search cache for a page in the background"""
+        with self._inflight_lock:
+            if self._prefetcher is None:
+                self._prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pexels-prefetch")
+        return self._prefetcher.submit(self._search, query, per_page, page, True)
+
+    def _search(self, query: str, per_page: int, page: int, use_cache: bool) -> List[Dict]:
+        key = json.dumps([query, per_page, page])
+        if use_cache:
+            cached = self.search_cache.get(key)
+            if cached is not None:
+                return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            if use_cache:
+                # The previous leader may have stored the result between our lookup and taking the lock
+                cached = self.search_cache.get(key, count=False)
+                if cached is not None:
+                    future.set_result(cached)
+                    return cached
+            photos = self._fetch_search(query, per_page, page)
+            self.search_cache.put(key, photos)
+            future.set_result(photos)
+            return photos
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _fetch_search(self, query: str, per_page: int, page: int) -> List[Dict]:
+        headers = {"Authorization": self.api_key}
+        params = {"query": query, "per_page": per_page, "page": page}
+        response = http_session.get("pexels", "search", f"{self.base_url}/search", session=self.session,
+                                    headers=headers, params=params)
+        response.raise_for_status()
+        data = response.json()
+        return data.get('photos', [])
+
+    def search_stats(self) -> Dict:
+        """Search cache hits/misses plus searches that joined an identical in-flight request"""
+        return dict(self.search_cache.stats(), coalesced=self.coalesced)
+
+    def download_image(self, url: str, filepath: str, use_cache: bool = True) -> None:
+        """
+        Download image from URL to filepath
+
+        The body is streamed to a temporary file next to filepath in fixed-size
+        chunks and renamed into place, so memory stays bounded and filepath never
+        holds a partial image. Repeated URLs are served from the image cache.
+
+        Args:
+            url: Image URL
+            filepath: Destination path
+            use_cache: False to always download (the fresh image is still cached)
+        """
+        try:
+            key = FileCache.make_key(url=url)
+            if self.image_cache is not None and use_cache and self.image_cache.fetch(key, filepath):
+                return
+            response = http_session.get("pexels", "download", url, session=self.session, stream=True)
+            try:
+                response.raise_for_status()
+                self._write_atomic(response.iter_content(DOWNLOAD_CHUNK_BYTES), filepath)
+            finally:
+                response.close()
+            if self.image_cache is not None:
+                self.image_cache.store(key, filepath)
         except Exception as e:
-            raise Exception(f"Image download error: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Image download error: {str(e)}")
+
+    @staticmethod
+    def _write_atomic(chunks, filepath: str):
+        # Write to a uniquely named temp file next to filepath, then rename over it. open() applies
+        # the umask like any other output file (mkstemp would leave the image readable by its owner only).
+        tmp_path = f"{filepath}.{uuid.uuid4().hex}.part"
+        try:
+            with open(tmp_path, 'xb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def download_many(self, items, concurrency: int = 4, use_cache: bool = True) -> List[DownloadResult]:
+        """
+        Download several images concurrently (e.g. every image of one carousel)
+
+        Args:
+            items: (url, filepath) pairs
+            concurrency: Downloads in flight at once (keep it within HTTP_POOL_SIZE)
+            use_cache: Passed to download_image
+
+        Returns:
+            DownloadResult per item in input order; a failed download carries
+            its error message instead of aborting the others
+        """
+        def run(item):
+            url, filepath = item
+            try:
+                self.download_image(url, filepath, use_cache=use_cache)
+                return DownloadResult(url, filepath, None)
+            except Exception as e:
+                return DownloadResult(url, filepath, str(e))
+
+        return self._run_concurrently(run, items, concurrency)
+
+    @staticmethod
+    def _run_concurrently(run, items, concurrency: int) -> list:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="pexels-download") as executor:
+            return list(executor.map(run, items))
+
+    def original_bytes(self, photo: Dict):
+        """Size of a photo's original file from a HEAD request (None if unknown)"""
+        try:
+            response = http_session.head("pexels", "original_size", photo["src"]["original"], session=self.session)
+            response.raise_for_status()
+            return int(response.headers["Content-Length"])
+        except Exception:
+            return None
+
+    def download_photo(self, photo: Dict, filepath: str, canvas_size: tuple = (1080, 1080), use_cache: bool = True,
+                       measure_savings: bool = False) -> PhotoDownload:
+        """
+        Download the smallest variant of a search result that covers the canvas
+
+        Args:
+            photo: Photo dict from search_images
+            filepath: Destination path
+            canvas_size: (width, height) of the slide the photo will fill
+            use_cache: Passed to download_image
+            measure_savings: HEAD the original to report the bytes the variant saved
+
+        Returns:
+            PhotoDownload with the chosen variant and bytes downloaded
+        """
+        variant, url, _ = select_variant(photo, canvas_size)
+        self.download_image(url, filepath, use_cache=use_cache)
+        size = os.path.getsize(filepath)
+        if variant == "original":
+            original = size
+        else:
+            original = self.original_bytes(photo) if measure_savings else None
+        return PhotoDownload(photo.get("id"), variant, url, filepath, size, original, None)
+
+    def download_photos(self, photos: List[Dict], output_dir: str, canvas_size: tuple = (1080, 1080),
+                        concurrency: int = 4, use_cache: bool = True,
+                        measure_savings: bool = False) -> List[PhotoDownload]:
+        """
+        Download a carousel's photos concurrently, each at the smallest covering variant
+
+        Returns:
+            PhotoDownload per photo in input order (pexels-<id>.jpg in output_dir);
+            pass them to pexels_variants.savings_report for the bytes saved
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        def run(photo):
+            filepath = os.path.join(output_dir, f"pexels-{photo.get('id')}.jpg")
+            try:
+                return self.download_photo(photo, filepath, canvas_size, use_cache, measure_savings)
+            except Exception as e:
+                return PhotoDownload(photo.get("id"), None, None, filepath, 0, None, str(e))
+
+        return self._run_concurrently(run, photos, concurrency)
+
+    def cache_stats(self) -> Dict:
+        """Image cache hit/miss counters and size (empty when caching is off)"""
+        return self.image_cache.stats() if self.image_cache is not None else {}
+
+    def close(self):
+        """Stop the prefetch thread and close the search cache"""
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(wait=False)
+        self.search_cache.close()
@@ -0,0 +1,100 @@
+"""Choosing the smallest Pexels image variant that still covers a canvas.
+
+Every Pexels photo comes with several `src` URLs (original, large2x, large,
+medium, portrait, landscape, ...). Each variant is the original resized by the
+w/h/dpr/fit query parameters in its URL. Its size can be worked out from those
+parameters and the photo's width and height, without downloading anything.
+Slides are cover-fitted, so a variant is good enough when it is at least as wide
+and as tall as the canvas. The rendering path then only ever downscales it.
+"""
+
+from collections import Counter, namedtuple
+from urllib.parse import parse_qs, urlparse
+
+# One downloaded photo; original_bytes is None when the original's size was not measured
+PhotoDownload = namedtuple("PhotoDownload", ["photo_id", "variant", "url", "filepath", "bytes", "original_bytes",
+                                             "error"])
+
+
+def variant_size(url: str, original_size: tuple) -> tuple:
+    """
+    Pixel size of a Pexels variant URL
+
+    Args:
+        url: Variant URL (its w, h, dpr and fit query parameters describe the resize)
+        original_size: (width, height) of the original photo
+
+    Returns:
+        (width, height) of the image the URL serves; variants never upscale
+    """
+    params = parse_qs(urlparse(url).query)
+    original_width, original_height = original_size
+    dpr = float(params.get("dpr", ["1"])[0])
+    width = float(params["w"][0]) * dpr if "w" in params else None
+    height = float(params["h"][0]) * dpr if "h" in params else None
+    if width is None and height is None:
+        return original_size
+
+    if params.get("fit", ["clip"])[0] == "crop" and width and height:
+        # Exactly width x height, cut from the largest centered region with that aspect ratio
+        region_width = min(original_width, original_height * width / height)
+        scale = min(1.0, region_width / width)
+        return round(width * scale), round(height * scale)
+
+    # Default fit: shrink to fit inside the given bounds, keeping the aspect ratio
+    scale = min(1.0, *(bound / size for bound, size in ((width, original_width), (height, original_height))
+                       if bound))
+    return round(original_width * scale), round(original_height * scale)
+
+
+def select_variant(photo: dict, canvas_size: tuple = (1080, 1080)) -> tuple:
+    """
+    Smallest variant of a photo that covers the canvas
+
+    Args:
+        photo: Photo dict from search_images (uses width, height and src)
+        canvas_size: (width, height) the photo will be cover-fitted to
+
+    Returns:
+        (variant name, url, (width, height)); falls back to the original when no
+        smaller variant covers the canvas or the photo has no dimensions
+    """
+    sources = photo.get("src", {})
+    original = ("original", sources.get("original"), None)
+    if not photo.get("width") or not photo.get("height"):
+        return original
+    original_size = (photo["width"], photo["height"])
+    original = ("original", sources.get("original"), original_size)
+
+    canvas_width, canvas_height = canvas_size
+    best = original
+    for name, url in sources.items():
+        size = variant_size(url, original_size)
+        if size[0] >= canvas_width and size[1] >= canvas_height and size[0] * size[1] < best[2][0] * best[2][1]:
+            best = (name, url, size)
+    return best
+
+
+def savings_report(downloads: list) -> dict:
+    """
+    Bytes downloaded versus the originals for a carousel's PhotoDownloads
+
+    Returns:
+        photos, failed, variants (count per variant), bytes (downloaded),
+        original_bytes and bytes_saved over the photos whose original size was
+        measured (measured), and saved_percent
+    """
+    succeeded = [download for download in downloads if download.error is None]
+    measured = [download for download in succeeded if download.original_bytes is not None]
+    original_bytes = sum(download.original_bytes for download in measured)
+    bytes_saved = original_bytes - sum(download.bytes for download in measured)
+    return {
+        "photos": len(succeeded),
+        "failed": len(downloads) - len(succeeded),
+        "variants": dict(Counter(download.variant for download in succeeded)),
+        "bytes": sum(download.bytes for download in succeeded),
+        "measured": len(measured),
+        "original_bytes": original_bytes,
+        "bytes_saved": bytes_saved,
+        "saved_percent": round(100 * bytes_saved / original_bytes, 1) if original_bytes else 0.0,
+    }
@@ -0,0 +1,98 @@
+"""Token-bucket rate limiting for LLM provider calls.
+
+Each provider gets one RateLimiter per process, shared by every client
+instance, with optional requests-per-minute and tokens-per-minute buckets.
+Limits come from the environment, e.g. GROQ_REQUESTS_PER_MINUTE=30 and
+GROQ_TOKENS_PER_MINUTE=6000; a provider without limits is not throttled.
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a per-minute rate"""
+
+    def __init__(self, per_minute: float, capacity: float = None):
+        """
+        Args:
+            per_minute: Refill rate
+            capacity: Burst size (defaults to one minute's worth)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1) -> float:
+        """
+        Take amount tokens, sleeping until they are available
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(amount, self.capacity)  # larger requests would never fit
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for one provider"""
+
+    def __init__(self, requests_per_minute: float = None, tokens_per_minute: float = None):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def estimate_tokens(prompt: str, max_tokens: int) -> int:
+        """Tokens a call may use: ~4 characters per prompt token plus the full completion budget"""
+        return len(prompt) // 4 + max_tokens
+
+    def acquire(self, prompt: str = "", max_tokens: int = 0) -> float:
+        """Block until a call with this prompt and max_tokens is allowed; returns seconds waited"""
+        waited = 0.0
+        if self.requests is not None:
+            waited += self.requests.acquire(1)
+        if self.tokens is not None:
+            waited += self.tokens.acquire(self.estimate_tokens(prompt, max_tokens))
+        if waited:
+            with self._lock:
+                self.waited += waited
+        return waited
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _env_rate(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+def provider_limiter(provider: str) -> RateLimiter:
+    """Process-wide limiter for a provider, configured from <PROVIDER>_REQUESTS/TOKENS_PER_MINUTE"""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            prefix = provider.upper()
+            limiter = _limiters[provider] = RateLimiter(_env_rate(f"{prefix}_REQUESTS_PER_MINUTE"),
+                                                        _env_rate(f"{prefix}_TOKENS_PER_MINUTE"))
+        return limiter
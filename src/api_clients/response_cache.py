@@ -0,0 +1,156 @@
+"""SQLite-backed cache of LLM responses shared by the text generation clients.
+
+Fact generation often re-sends identical prompts (retries, regenerations of the
+same topic). Responses are stored in a local SQLite file keyed by a hash of
+(provider, model, prompt, max_tokens), expire after a TTL, and the least
+recently used entries are evicted once the stored text exceeds a size cap.
+Counters track hits, misses and the API latency that hits avoided.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class ResponseCache:
+    """Disk-backed LLM response cache with TTL and size-based eviction"""
+
+    def __init__(self, path: str = "llm_cache.sqlite3", ttl_seconds: float = 7 * 24 * 3600,
+                 max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the response cache
+
+        Args:
+            path: SQLite database file (created if missing); ":memory:" for a private cache
+            ttl_seconds: Age after which a cached response is ignored and removed
+            max_bytes: Cap on stored response text; least recently used entries go first
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                latency REAL NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, max_tokens: int) -> str:
+        """Stable SHA-256 of everything that determines a response"""
+        payload = json.dumps([provider, model, prompt, max_tokens])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, provider: str, model: str, prompt: str, max_tokens: int) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Returns:
+            Response text, or None on a miss (or an expired entry)
+        """
+        key = self.make_key(provider, model, prompt, max_tokens)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, latency, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[2] > self.ttl_seconds:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+            self.latency_saved += row[1]
+            return row[0]
+
+    def put(self, provider: str, model: str, prompt: str, max_tokens: int, response: str, latency: float = 0.0):
+        """Store a response along with the API latency it took to produce"""
+        key = self.make_key(provider, model, prompt, max_tokens)
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, response, size, latency, now, now),
+            )
+            self._evict(now)
+            self._db.commit()
+
+    def _evict(self, now: float):
+        self._db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def stats(self) -> dict:
+        """Hit/miss counters, latency saved by hits and current size"""
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "latency_saved_seconds": round(self.latency_saved, 3),
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_default_cache = None
+
+
+def default_cache() -> Optional[ResponseCache]:
+    """Process-wide cache at $LLM_CACHE_PATH, or None when the variable is unset"""
+    global _default_cache
+    path = os.getenv('LLM_CACHE_PATH')
+    if not path:
+        return None
+    if _default_cache is None or _default_cache.path != path:
+        _default_cache = ResponseCache(path)
+    return _default_cache
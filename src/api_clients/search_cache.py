@@ -0,0 +1,83 @@
+"""SQLite-backed TTL cache of Pexels search results.
+
+Searches are stored as JSON under a caller-built key (query, per_page, page)
+and expire after a TTL; expired rows are purged whenever a result is stored.
+A file path shares the cache between processes, ":memory:" keeps it private
+to one client.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class SearchCache:
+    """Search results by key, reused for ttl_seconds"""
+
+    def __init__(self, path: str = ":memory:", ttl_seconds: float = 3600.0):
+        """
+        Args:
+            path: SQLite database file (created if missing); ":memory:" for a private cache
+            ttl_seconds: Age after which a cached result is ignored and removed
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS searches (key TEXT PRIMARY KEY, results TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def get(self, key: str, count: bool = True) -> Optional[list]:
+        """
+        Look up cached results
+
+        Args:
+            count: False to leave the hit/miss counters alone (e.g. re-checking a key just missed)
+
+        Returns:
+            The stored results, or None on a miss (or an expired entry)
+        """
+        with self._lock:
+            row = self._db.execute("SELECT results, created_at FROM searches WHERE key = ?", (key,)).fetchone()
+            if row is not None and time.time() - row[1] > self.ttl_seconds:
+                row = None
+            if count:
+                if row is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, key: str, results: list):
+        """Store results for key, dropping expired entries"""
+        now = time.time()
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO searches VALUES (?, ?, ?)", (key, json.dumps(results), now))
+            self._db.execute("DELETE FROM searches WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._db.commit()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and stored entries"""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": entries,
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,32 @@
+"""Helpers for consuming streamed LLM output incrementally."""
+
+import re
+
+# End of a sentence: terminal punctuation (plus closing quotes/brackets) followed
+# by whitespace, or a blank line between paragraphs
+_BOUNDARY = re.compile(r"[.!?…]+[\"'”’)\]]*\s+|\n\s*\n")
+
+
+def iter_sentences(chunks):
+    """
+    Regroup streamed text chunks into complete sentences
+
+    A sentence is only emitted once the whitespace after its punctuation has
+    arrived, so "3.14" or "e.g.," split across chunks is not cut early.
+    Whatever remains when the stream ends is emitted as the last sentence.
+
+    Yields:
+        Stripped, non-empty sentences in order
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        position = 0
+        for match in _BOUNDARY.finditer(buffer):
+            sentence = buffer[position:match.end()].strip()
+            if sentence:
+                yield sentence
+            position = match.end()
+        buffer = buffer[position:]
+    if buffer.strip():
+        yield buffer.strip()
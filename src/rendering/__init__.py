@@ -0,0 +1,2 @@
+# Nexus Rendering
+# Pillow-based carousel and slide rendering
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""Background photos for slides, decoded once per carousel.
+
+Pexels photos are often 4000px+ JPEGs while slides are 1080px. JPEG sources
+are decoded with Pillow's draft() mode, which lets libjpeg scale by 1/2, 1/4
+or 1/8 during decoding, and are then cover-scaled and center-cropped to the
+canvas. Results are cached per (source content hash, canvas size) so every
+slide of a carousel that uses the same photo shares one decode.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+
+def cover_crop_box(source_size: tuple, target_size: tuple) -> tuple:
+    """Centered region of the source with the target's aspect ratio"""
+    source_width, source_height = source_size
+    target_width, target_height = target_size
+    if source_width * target_height > target_width * source_height:
+        # Wider than the target: use full height, crop the sides
+        crop_width = source_height * target_width / target_height
+        left = (source_width - crop_width) / 2
+        return (left, 0, left + crop_width, source_height)
+    crop_height = source_width * target_height / target_width
+    top = (source_height - crop_height) / 2
+    return (0, top, source_width, top + crop_height)
+
+
+class BackgroundCache:
+    """LRU of decoded, cover-fitted background images"""
+
+    def __init__(self, max_entries: int = 8):
+        """
+        Args:
+            max_entries: Fitted backgrounds kept in memory (~3.5 MB each at 1080x1080)
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.decodes = 0
+        self._images = OrderedDict()
+        self._digests = {}  # (path, mtime, size) -> content hash
+        self._lock = threading.Lock()
+
+    def digest(self, path: str) -> str:
+        """SHA-256 of the file's contents, memoized by path, mtime and size"""
+        stat = os.stat(path)
+        stat_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            if len(self._digests) >= 256:
+                self._digests.clear()
+            self._digests[stat_key] = digest
+        return digest
+
+    def get(self, path: str, size: tuple) -> Image.Image:
+        """
+        Background for a canvas size; callers must copy() before drawing on it
+
+        Raises:
+            FileNotFoundError: If the image does not exist
+        """
+        key = (self.digest(path), tuple(size))
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+
+        image = self.load(path, size)
+        with self._lock:
+            self.decodes += 1
+            self._images[key] = image
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+        return image
+
+    @staticmethod
+    def load(path: str, size: tuple) -> Image.Image:
+        """Decode (at reduced scale for JPEGs) and cover-fit an image to size"""
+        with Image.open(path) as source:
+            if source.format == "JPEG":
+                # libjpeg picks the largest 1/2^n reduction still >= size in both dimensions
+                source.draft("RGB", size)
+            source = source.convert("RGB")
+            return source.resize(size, Image.Resampling.LANCZOS, box=cover_crop_box(source.size, size))
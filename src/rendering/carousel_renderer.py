@@ -1,73 +1,448 @@
 from PIL import Image, ImageDraw, ImageFont
+import io
 import os
 import json
 import argparse
+from contextlib import nullcontext
 from datetime import datetime
 
+try:
+    from .backgrounds import BackgroundCache
+    from .encoders import AsyncSlideWriter, SlideEncoder
+    from .fonts import FontLadder
+    from .render_cache import RenderCache
+    from .preview import contact_sheet
+    from .render_pool import RenderPool
+    from .text_runs import TextRunCache
+    from .video import FFMPEG_BIN, slide_frames, write_video
+except ImportError:  # run as a script: python src/rendering/carousel_renderer.py
+    from backgrounds import BackgroundCache
+    from encoders import AsyncSlideWriter, SlideEncoder
+    from fonts import FontLadder
+    from render_cache import RenderCache
+    from preview import contact_sheet
+    from render_pool import RenderPool
+    from text_runs import TextRunCache
+    from video import FFMPEG_BIN, slide_frames, write_video
+
+# Bump whenever a change alters rendered pixels, so cached slides are not reused
+RENDERER_VERSION = "2"
+
+DEFAULT_BACKGROUND_COLOR = (255, 255, 255)
+DEFAULT_TEXT_COLOR = (0, 0, 0)
+
+
+def _color(value, default):
+    # JSON gives colors as lists; Pillow (and the canvas cache) want tuples
+    if value is None:
+        return default
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _scaled(value: int, scale: float) -> int:
+    return max(1, round(value * scale))
+
+
 class CarouselRenderer:
-    def __init__(self, width=1080, height=1080, font_path=None):
-        self.width = width
-        self.height = height
+    def __init__(self, width=1080, height=1080, font_path=None, cache_dir=None, cache_max_bytes=256 * 1024 * 1024,
+                 output_format="png", quality=None, png_compress_level=6, lossless=False, optimize=False,
+                 async_writes=True, font_size=40, auto_fit=False, min_font_size=24, max_font_size=120,
+                 handle=None, footer=None, slide_counter=False, branding_font_size=28,
+                 text_cache_bytes=16 * 1024 * 1024, scale=1.0):
+        # scale < 1 draws a proportionally smaller slide (canvas, fonts and padding), e.g. for previews
+        self.scale = scale
+        self.width = _scaled(width, scale)
+        self.height = _scaled(height, scale)
+        self.padding = _scaled(100, scale)
         self.font_path = font_path if font_path else "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" # Default font
+        # Constructor arguments, used to build identical renderers in worker processes
+        self.config = {"width": width, "height": height, "font_path": font_path,
+                       "cache_dir": cache_dir, "cache_max_bytes": cache_max_bytes,
+                       "output_format": output_format, "quality": quality, "png_compress_level": png_compress_level,
+                       "lossless": lossless, "optimize": optimize, "async_writes": async_writes,
+                       "font_size": font_size, "auto_fit": auto_fit,
+                       "min_font_size": min_font_size, "max_font_size": max_font_size,
+                       "handle": handle, "footer": footer, "slide_counter": slide_counter,
+                       "branding_font_size": branding_font_size, "text_cache_bytes": text_cache_bytes,
+                       "scale": scale}
+        self._pool = None
+        self._previews = {}  # scale -> preview renderer
+        # Output encoding; async_writes encodes/writes on a background thread in render_carousel
+        self.encoder = SlideEncoder(output_format, quality, png_compress_level, lossless, optimize)
+        self.async_writes = async_writes
+        # Optional content-addressed cache of rendered slides
+        self.cache = RenderCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self._canvases = {}  # background color -> blank canvas, copied for each slide
+        self.backgrounds = BackgroundCache()  # decoded, cover-fitted background photos
+        font_size = _scaled(font_size, scale)
+        self.font_size = font_size
+        # auto_fit picks the largest size in [min_font_size, max_font_size] that fits each slide
+        self.auto_fit = auto_fit
+        self.min_font_size = _scaled(min_font_size, scale)
+        self.max_font_size = _scaled(max_font_size, scale)
+        self.font_fallback = False
         try:
-            self.font = ImageFont.truetype(self.font_path, 40)
+            self.font = ImageFont.truetype(self.font_path, font_size)
         except IOError:
             print(f"Warning: Default font not found at {self.font_path}. Using a generic font.")
             self.font = ImageFont.load_default()
+            self.font_fallback = True
+        # Loaded sizes and their layouts; line height comes from the font metrics
+        self.fonts = FontLadder(self.font_path, self.width - self.padding)
+        self.layout = self.fonts.add(font_size, self.font)
+        # Branding drawn on every slide: handle (top left), slide counter (top right), footer (bottom).
+        # These are the per-slide repeats text_runs caches; off by default, so plain slides are unchanged.
+        self.handle = handle
+        self.footer = footer
+        self.slide_counter = slide_counter
+        self.branding_font_size = _scaled(branding_font_size, scale)
+        # Rasterized text runs, pasted instead of re-drawn (repeated branding and re-rendered lines)
+        self.text_runs = TextRunCache(text_cache_bytes)
+
+    def fit_layout(self, text: str):
+        # Fixed-size layout, or the largest size whose wrapped text fits the slide
+        if not self.auto_fit:
+            return self.layout
+        return self.fonts.fit(text, self.height - self.padding, self.min_font_size, self.max_font_size)
 
-    def create_slide(self, text: str, background_color=(255, 255, 255), text_color=(0, 0, 0)) -> Image.Image:
-        img = Image.new('RGB', (self.width, self.height), color=background_color)
+    def create_slide(self, text: str, background_color=(255, 255, 255), text_color=(0, 0, 0), background_image=None,
+                     branding=None) -> Image.Image:
+        # background_image: path to a photo, cover-fitted to the canvas (replaces background_color)
+        # branding: {"handle", "counter", "footer"} texts drawn in the slide margins
+        if background_image:
+            img = self.backgrounds.get(background_image, (self.width, self.height)).copy()
+        else:
+            img = self.base_canvas(background_color).copy()
         d = ImageDraw.Draw(img)
 
-        # Simple text wrapping and centering
-        lines = []
-        words = text.split()
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if d.textbbox((0,0), test_line, font=self.font)[2] < self.width - 100: # 100px padding
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        lines.append(' '.join(current_line))
+        # Wrap and center using cached word widths
+        layout = self.fit_layout(text)
+        for line in layout.layout(text, self.width, self.height):
+            self.text_runs.draw(d, (line.x, line.y), line.text, layout.font, text_color)
 
-        y_text = (self.height - len(lines) * 50) / 2 # Center vertically, assuming 50px per line
-        for line in lines:
-            text_width = d.textbbox((0,0), line, font=self.font)[2]
-            x_text = (self.width - text_width) / 2
-            d.text((x_text, y_text), line, font=self.font, fill=text_color)
-            y_text += 50 # Line height
+        if branding:
+            self.draw_branding(d, branding, text_color)
 
         return img
 
-    def render_carousel(self, slides_data: list[dict], output_dir: str = "/srv/outputs") -> list[str]:
+    def draw_branding(self, d: ImageDraw.ImageDraw, branding: dict, text_color):
+        layout = self.fonts.layout(self.branding_font_size)
+        margin = self.padding // 2
+        bottom = self.height - margin - layout.line_height
+        for position, text in branding.items():
+            if not text:
+                continue
+            width = layout.line_width(text.split())
+            xy = {"handle": (margin, margin),
+                  "counter": (self.width - margin - width, margin),
+                  "footer": ((self.width - width) // 2, bottom)}[position]
+            self.text_runs.draw(d, xy, text, layout.font, text_color)
+
+    def branding(self, index: int, slide_data: dict) -> dict:
+        # Branding texts for a slide; slide data may override the handle and footer
+        branding = {"handle": slide_data.get("handle", self.handle),
+                    "footer": slide_data.get("footer", self.footer),
+                    "counter": None}
+        if self.slide_counter:
+            count = slide_data.get("slide_count")
+            branding["counter"] = f"{index+1}/{count}" if count else str(index + 1)
+        return {position: text for position, text in branding.items() if text}
+
+    def carousel_items(self, slides_data: list[dict]) -> list[tuple]:
+        # (index, slide data) pairs; with the slide counter on, every slide learns the carousel length
+        if not self.slide_counter:
+            return list(enumerate(slides_data))
+        count = len(slides_data)
+        return [(i, {**slide_data, "slide_count": count}) for i, slide_data in enumerate(slides_data)]
+
+    def base_canvas(self, background_color=(255, 255, 255)) -> Image.Image:
+        # Keep a few blank canvases warm; callers must copy before drawing
+        canvas = self._canvases.get(background_color)
+        if canvas is None:
+            if len(self._canvases) >= 8:
+                self._canvases.clear()
+            canvas = Image.new('RGB', (self.width, self.height), color=background_color)
+            self._canvases[background_color] = canvas
+        return canvas
+
+    def slide_style(self, index: int, slide_data: dict) -> tuple:
+        # (text, background color, text color) a slide is drawn with
+        text = slide_data.get("text", f"Slide {index+1}")
+        background_color = _color(slide_data.get("background_color"), DEFAULT_BACKGROUND_COLOR)
+        text_color = _color(slide_data.get("text_color"), DEFAULT_TEXT_COLOR)
+        return text, background_color, text_color
+
+    def slide_image(self, index: int, slide_data: dict) -> Image.Image:
+        text, background_color, text_color = self.slide_style(index, slide_data)
+        return self.create_slide(text, background_color=background_color, text_color=text_color,
+                                 background_image=slide_data.get("background_image"),
+                                 branding=self.branding(index, slide_data))
+
+    def cache_key(self, index: int, slide_data: dict) -> str:
+        # Everything that affects the pixels of the slide, plus the renderer version
+        text, background_color, text_color = self.slide_style(index, slide_data)
+        background_image = slide_data.get("background_image")
+        return RenderCache.make_key(
+            version=RENDERER_VERSION,
+            size=(self.width, self.height),
+            font={"path": self.font_path, "fallback": self.font_fallback, "size": self.font_size,
+                  "auto_fit": (self.min_font_size, self.max_font_size) if self.auto_fit else None},
+            text=text,
+            background_color=background_color,
+            text_color=text_color,
+            background_image=self.backgrounds.digest(background_image) if background_image else None,
+            branding=self.branding(index, slide_data),
+            branding_font_size=self.branding_font_size,
+            encoding=self.encoder.describe(),
+        )
+
+    def slide_filename(self, index: int) -> str:
+        return f"slide_{index+1}{self.encoder.extension}"
+
+    def encode_slide(self, index: int, slide_data: dict) -> io.BytesIO:
+        return self.encode_image(self.slide_image(index, slide_data))
+
+    def encode_image(self, slide_image: Image.Image) -> io.BytesIO:
+        buffer = io.BytesIO()
+        self.encoder.save(slide_image, buffer)
+        buffer.seek(0)
+        return buffer
+
+    def render_carousel_to_buffers(self, slides_data: list[dict], sink=None, workers: int = None) -> list[io.BytesIO]:
+        # Render and encode slides entirely in memory (no filesystem I/O, and
+        # the render cache is not consulted). Without a sink, returns one
+        # BytesIO per slide, positioned at 0. With a sink, calls
+        # sink(index, filename, memoryview) once per slide in slide order
+        # (from the background writer thread when async_writes is on) and
+        # keeps nothing, so memory does not grow with the number of slides.
+        return self._render_buffers(self.carousel_items(slides_data), sink, workers)
+
+    def _render_buffers(self, items: list[tuple], sink=None, workers: int = None) -> list[io.BytesIO]:
+        # items: (slide index, slide data) pairs; any iterable unless rendering in parallel
+        buffers = []
+
+        def deliver(index: int, buffer: io.BytesIO):
+            if sink is None:
+                buffers.append(buffer)
+            else:
+                sink(index, self.slide_filename(index), buffer.getbuffer())
+
+        # Opt-in parallel mode: workers > 1 renders and encodes slides in a process pool
+        if workers and workers > 1 and len(items) > 1:
+            for index, data in self.get_pool(workers).encode_slides(items):
+                deliver(index, io.BytesIO(data))
+            return buffers
+
+        def encode_and_deliver(index: int, slide_image: Image.Image):
+            deliver(index, self.encode_image(slide_image))
+
+        with AsyncSlideWriter() if self.async_writes else nullcontext() as writer:
+            for index, slide_data in items:
+                slide_image = self.slide_image(index, slide_data)
+                if writer is not None:
+                    writer.submit(encode_and_deliver, index, slide_image)
+                else:
+                    encode_and_deliver(index, slide_image)
+        return buffers
+
+    def render_carousel(self, slides_data: list[dict], output_dir: str = "/srv/outputs", workers: int = None) -> list[str]:
         os.makedirs(output_dir, exist_ok=True)
-        output_paths = []
-        for i, slide_data in enumerate(slides_data):
-            text = slide_data.get("text", f"Slide {i+1}")
-            # You can extend this to handle image backgrounds, different colors, etc.
-            slide_image = self.create_slide(text)
-            output_path = os.path.join(output_dir, f"slide_{i+1}.png")
-            print(f"Saving slide {i+1} to {output_path}")
+        output_paths = [os.path.join(output_dir, self.slide_filename(i)) for i in range(len(slides_data))]
+
+        # Serve unchanged slides from the render cache; only the rest are rendered
+        pending = []
+        cache_keys = {}
+        for i, slide_data in self.carousel_items(slides_data):
+            if self.cache is not None:
+                cache_keys[i] = self.cache_key(i, slide_data)
+                if self.cache.fetch(cache_keys[i], output_paths[i]):
+                    print(f"Reused cached slide {i+1} at {output_paths[i]}")
+                    continue
+                # The old file may be a hard link into the cache; never write through it
+                if os.path.lexists(output_paths[i]):
+                    os.remove(output_paths[i])
+            pending.append((i, slide_data))
+
+        def write_file(index: int, filename: str, data: memoryview):
+            output_path = output_paths[index]
+            print(f"Saving slide {index+1} to {output_path}")
             try:
-                slide_image.save(output_path)
+                with open(output_path, "wb") as f:
+                    f.write(data)
                 print(f"Successfully saved {output_path}")
+                if index in cache_keys:
+                    self.cache.store(cache_keys[index], output_path)
             except Exception as e:
                 print(f"Failed to save {output_path}: {e}")
-            output_paths.append(output_path)
+
+        self._render_buffers(pending, sink=write_file, workers=workers)
+
+        if self.cache is not None:
+            stats = self.cache.stats()
+            print(f"Render cache: {stats['hits']} hits, {stats['misses']} misses")
         return output_paths
 
+    def render_stream(self, slides, output_dir: str = "/srv/outputs") -> list[str]:
+        # Render slides as they arrive from an iterable (e.g. sentences of a streamed LLM
+        # response), so slide 1 is on disk while later slides are still being generated.
+        # The carousel length is unknown up front: a slide counter shows only the slide number.
+        os.makedirs(output_dir, exist_ok=True)
+        output_paths = []
+
+        def items():
+            for i, slide_data in enumerate(slides):
+                output_paths.append(os.path.join(output_dir, self.slide_filename(i)))
+                yield i, slide_data
+
+        def write_file(index: int, filename: str, data: memoryview):
+            output_path = os.path.join(output_dir, filename)
+            with open(output_path, "wb") as f:
+                f.write(data)
+            print(f"Saved streamed slide {index+1} to {output_path}")
+
+        self._render_buffers(items(), sink=write_file)
+        return output_paths
+
+    def render_video(self, slides_data: list[dict], output_path: str, fps: int = 30, slide_seconds: float = 3.0,
+                     transition_seconds: float = 0.5, ffmpeg_bin: str = FFMPEG_BIN, **encode_options) -> str:
+        # Stream slide and crossfade frames into ffmpeg; slides are drawn lazily, one at a time
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        slides = (self.slide_image(i, slide_data) for i, slide_data in self.carousel_items(slides_data))
+        frames = slide_frames(slides, fps, slide_seconds, transition_seconds)
+        print(f"Rendering video {output_path}...")
+        count = write_video(frames, output_path, (self.width, self.height), fps, ffmpeg_bin, **encode_options)
+        print(f"Successfully rendered {output_path} ({count} frames, {count / fps:.1f}s)")
+        return output_path
+
+    def preview_renderer(self, scale: float = 0.25) -> "CarouselRenderer":
+        # Same slide design at a fraction of the size, with a cheap JPEG encoder and no render cache
+        preview = self._previews.get(scale)
+        if preview is None:
+            config = dict(self.config, scale=self.scale * scale, cache_dir=None, output_format="jpeg",
+                          quality=70, optimize=False, async_writes=False)
+            preview = self._previews[scale] = type(self)(**config)
+        return preview
+
+    def render_preview(self, slides_data: list[dict], output_path: str = None, scale: float = 0.25,
+                       columns: int = None) -> Image.Image:
+        # Draw every slide at scale and tile them into one contact sheet (saved as JPEG if output_path)
+        preview = self.preview_renderer(scale)
+        slides = [preview.slide_image(i, slide_data) for i, slide_data in preview.carousel_items(slides_data)]
+        sheet = contact_sheet(slides, columns)
+        if output_path:
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            preview.encoder.save(sheet, output_path)
+            print(f"Saved preview of {len(slides)} slides to {output_path}")
+        return sheet
+
+    def iter_render_batch(self, jobs, output_dir: str = "/srv/outputs", workers: int = None, max_pending: int = None):
+        # Jobs are dicts: {"id": ..., "slides": [...], "output_dir": ...}; id and
+        # output_dir are optional (defaults: position in the batch, output_dir/<id>)
+        def resolved_jobs():
+            for n, job in enumerate(jobs, start=1):
+                job_id = job.get("id", n)
+                job_dir = job.get("output_dir") or os.path.join(output_dir, str(job_id))
+                yield job_id, job.get("slides", []), job_dir
+
+        yield from self.get_pool(workers).map_jobs(resolved_jobs(), max_pending)
+
+    def render_batch(self, jobs, output_dir: str = "/srv/outputs", workers: int = None, max_pending: int = None) -> list[dict]:
+        # Render many carousels through one warm pool; returns per-job results with timings
+        return list(self.iter_render_batch(jobs, output_dir, workers, max_pending))
+
+    def get_pool(self, workers: int = None) -> RenderPool:
+        # Reuse the warm pool across calls unless a different size is requested
+        if self._pool is not None and workers and self._pool.workers != workers:
+            self.close()
+        if self._pool is None:
+            self._pool = RenderPool(self, workers)
+        return self._pool
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+
+def read_jobs(path: str):
+    # Lazily yield carousel jobs from a JSON-lines file, skipping blank lines
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 if __name__ == "__main__":
-    renderer = CarouselRenderer()
-    sample_slides = [
-        {"text": "This is the first slide of our new AI-generated carousel content."}, 
-        {"text": "Pillow allows us to programmatically create and manipulate images with Python."}, 
-        {"text": "We can add text, shapes, and even integrate images from Pexels."}, 
-        {"text": "This replaces the need for Canva's API for automated rendering."}, 
-        {"text": "Excited to see the Nexus project come to life with this new capability!"}
-    ]
-    print("Rendering sample carousel...")
-    rendered_files = renderer.render_carousel(sample_slides, output_dir="./output_carousels")
-    print(f"Rendered files: {rendered_files}")
-    print("Sample carousel rendering complete. Check the ./output_carousels directory.")
+    parser = argparse.ArgumentParser(description="Render Nexus carousels")
+    parser.add_argument("--batch", help="JSON-lines file of carousel jobs ({\"id\", \"slides\", \"output_dir\"})")
+    parser.add_argument("--output-dir", default="./output_carousels", help="Base output directory")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, help="Jobs in flight at once (default: 2x workers)")
+    parser.add_argument("--report", help="Write per-job results as JSON lines to this file")
+    parser.add_argument("--cache-dir", help="Reuse unchanged slides from this render cache directory")
+    parser.add_argument("--format", default="png", choices=["png", "jpeg", "webp"], help="Slide output format")
+    parser.add_argument("--quality", type=int, help="JPEG/WebP quality (1-100)")
+    parser.add_argument("--png-compress-level", type=int, default=6, help="PNG zlib level (0-9)")
+    parser.add_argument("--lossless", action="store_true", help="Lossless WebP")
+    parser.add_argument("--auto-fit", action="store_true", help="Fit the largest font size each slide allows")
+    parser.add_argument("--handle", help="Account handle drawn on every slide")
+    parser.add_argument("--footer", help="Footer text drawn on every slide")
+    parser.add_argument("--slide-counter", action="store_true", help="Draw a 1/N slide counter")
+    parser.add_argument("--preview", help="Save a low-resolution contact sheet of the sample carousel to this path")
+    parser.add_argument("--preview-scale", type=float, default=0.25, help="Preview size relative to the full slide")
+    parser.add_argument("--video", help="Render the sample carousel as an MP4 at this path instead of slides")
+    parser.add_argument("--fps", type=int, default=30, help="Video frames per second")
+    parser.add_argument("--slide-seconds", type=float, default=3.0, help="Seconds each slide is shown in a video")
+    parser.add_argument("--transition-seconds", type=float, default=0.5, help="Video crossfade length in seconds")
+    parser.add_argument("--ffmpeg", default=FFMPEG_BIN, help="ffmpeg executable")
+    args = parser.parse_args()
+
+    renderer = CarouselRenderer(cache_dir=args.cache_dir, output_format=args.format, quality=args.quality,
+                                png_compress_level=args.png_compress_level, lossless=args.lossless,
+                                auto_fit=args.auto_fit, handle=args.handle, footer=args.footer,
+                                slide_counter=args.slide_counter)
+
+    if args.batch:
+        started = datetime.now()
+        report = open(args.report, "w") if args.report else None
+        done = failed = 0
+        try:
+            for result in renderer.iter_render_batch(read_jobs(args.batch), args.output_dir, args.workers, args.max_pending):
+                done += 1
+                if result["error"]:
+                    failed += 1
+                    print(f"Job {result['id']} failed after {result['seconds']:.2f}s: {result['error']}")
+                else:
+                    print(f"Job {result['id']}: {len(result['output_paths'])} slides in {result['seconds']:.2f}s"
+                          f" ({result['cache_hits']} cached)")
+                if report:
+                    report.write(json.dumps(result) + "\n")
+        finally:
+            renderer.close()
+            if report:
+                report.close()
+        elapsed = (datetime.now() - started).total_seconds()
+        print(f"Batch complete: {done} jobs ({failed} failed) in {elapsed:.2f}s")
+    else:
+        sample_slides = [
+            {"text": "This is the first slide of our new AI-generated carousel content."}, 
+            {"text": "Pillow allows us to programmatically create and manipulate images with Python."}, 
+            {"text": "We can add text, shapes, and even integrate images from Pexels."}, 
+            {"text": "This replaces the need for Canva's API for automated rendering."}, 
+            {"text": "Excited to see the Nexus project come to life with this new capability!"}
+        ]
+        if args.preview:
+            renderer.render_preview(sample_slides, args.preview, scale=args.preview_scale)
+        elif args.video:
+            renderer.render_video(sample_slides, args.video, fps=args.fps, slide_seconds=args.slide_seconds,
+                                  transition_seconds=args.transition_seconds, ffmpeg_bin=args.ffmpeg)
+        else:
+            print("Rendering sample carousel...")
+            rendered_files = renderer.render_carousel(sample_slides, output_dir=args.output_dir, workers=args.workers)
+            renderer.close()
+            print(f"Rendered files: {rendered_files}")
+            print(f"Sample carousel rendering complete. Check the {args.output_dir} directory.")
@@ -0,0 +1,122 @@
+"""Slide output encoders and the background slide writer.
+
+SlideEncoder turns the renderer's output options (PNG compress level, JPEG
+quality, WebP quality or lossless) into Pillow save arguments. AsyncSlideWriter
+runs encoding and disk writes on a background thread so the next slide can be
+drawn while the previous one is compressed and flushed.
+"""
+
+import queue
+import threading
+
+from PIL import Image
+
+
+class SlideEncoder:
+    """Output format and encoder settings for rendered slides"""
+
+    # format name -> (Pillow format, file extension)
+    FORMATS = {
+        "png": ("PNG", ".png"),
+        "jpeg": ("JPEG", ".jpg"),
+        "webp": ("WEBP", ".webp"),
+    }
+    DEFAULT_QUALITY = {"jpeg": 90, "webp": 80}
+
+    def __init__(self, output_format: str = "png", quality: int = None, png_compress_level: int = 6,
+                 lossless: bool = False, optimize: bool = False):
+        """
+        Args:
+            output_format: "png", "jpeg" (or "jpg") or "webp"
+            quality: JPEG/WebP quality 1-100 (defaults: JPEG 90, WebP 80)
+            png_compress_level: zlib level 0-9 for PNG (Pillow's default is 6)
+            lossless: Encode WebP losslessly (quality then sets effort)
+            optimize: Extra PNG/JPEG optimization pass (smaller, slower)
+        """
+        output_format = output_format.lower()
+        if output_format == "jpg":
+            output_format = "jpeg"
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format} (expected one of {', '.join(self.FORMATS)})")
+        self.output_format = output_format
+        self.quality = quality if quality is not None else self.DEFAULT_QUALITY.get(output_format)
+        self.png_compress_level = png_compress_level
+        self.lossless = lossless
+        self.optimize = optimize
+
+    @property
+    def pil_format(self) -> str:
+        return self.FORMATS[self.output_format][0]
+
+    @property
+    def extension(self) -> str:
+        return self.FORMATS[self.output_format][1]
+
+    def save_options(self) -> dict:
+        """Keyword arguments for Image.save()"""
+        if self.output_format == "png":
+            return {"compress_level": self.png_compress_level, "optimize": self.optimize}
+        if self.output_format == "jpeg":
+            return {"quality": self.quality, "optimize": self.optimize}
+        return {"quality": self.quality, "lossless": self.lossless}
+
+    def describe(self) -> dict:
+        """Settings that affect encoded bytes (used in render cache keys)"""
+        return {"format": self.output_format, **self.save_options()}
+
+    def save(self, image: Image.Image, fp):
+        """Encode image to a path or file object"""
+        image.save(fp, format=self.pil_format, **self.save_options())
+
+
+class AsyncSlideWriter:
+    """Runs slide saves in order on a background thread
+
+    At most max_pending slides wait to be written, so a slow SD card applies
+    back-pressure to drawing instead of letting decoded canvases pile up.
+    """
+
+    def __init__(self, max_pending: int = 2):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="slide-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, save_fn, *args):
+        """Queue save_fn(*args); blocks while max_pending saves are waiting"""
+        self._queue.put((save_fn, args))
+
+    def _run(self):
+        while True:
+            save_fn, args = self._queue.get()
+            if save_fn is None:
+                break
+            try:
+                save_fn(*args)
+            except Exception as e:  # keep draining the queue; close() re-raises
+                if self._error is None:
+                    self._error = e
+
+    def close(self):
+        """
+        Wait for every queued save to finish
+
+        Raises:
+            The first exception raised by a queued save, if any
+        """
+        self._queue.put((None, None))
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            try:
+                self.close()
+            except Exception:
+                pass  # don't mask the exception already propagating
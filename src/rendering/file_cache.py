@@ -0,0 +1,132 @@
+"""Content-addressed on-disk file cache with a byte budget.
+
+Files are stored under a hash of the caller's key parts. A hit is hard-linked
+(or copied, across filesystems) to the requested path instead of being
+produced again. The cache directory is capped in bytes and evicts the least
+recently used entries first, using file mtimes as the recency clock. It backs
+the rendered-slide cache (render_cache.py) and the Pexels image download cache.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+
+class FileCache:
+    """LRU-evicted directory of files addressed by key"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Directory holding cached files (created if missing)
+            max_bytes: On-disk size cap; least recently used entries go first
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def make_key(**parts) -> str:
+        """Stable SHA-256 of JSON-serializable key parts"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{extension}")
+
+    def _entries(self):
+        # (path, size, mtime) for every cached file
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    @staticmethod
+    def _link_or_copy(source: str, dest: str) -> bool:
+        # Link/copy to a temp name and rename so readers never see partial files; False if dest already is source
+        if os.path.exists(dest) and os.path.samefile(source, dest):
+            return False  # already linked (rename() between hard links is a no-op)
+        tmp_path = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            try:
+                os.link(source, tmp_path)
+            except OSError:  # e.g. cache and outputs on different filesystems
+                shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, dest)
+        finally:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+        return True
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """
+        Place the cached file for key at output_path
+
+        Returns:
+            True on a hit, False on a miss
+        """
+        cached_path = self._path(key, os.path.splitext(output_path)[1])
+        try:
+            self._link_or_copy(cached_path, output_path)
+            now = time.time()
+            os.utime(cached_path, (now, now))  # mark as most recently used
+        except FileNotFoundError:
+            self.record(hit=False)
+            return False
+        self.record(hit=True)
+        return True
+
+    def store(self, key: str, source_path: str):
+        """Add a file to the cache under key and enforce the size cap"""
+        cached_path = self._path(key, os.path.splitext(source_path)[1])
+        try:
+            replaced = os.path.getsize(cached_path)  # an earlier entry for the key is overwritten
+        except FileNotFoundError:
+            replaced = 0
+        if not self._link_or_copy(source_path, cached_path):
+            return  # this very file is already the cached entry
+        with self._lock:
+            self._total_bytes += os.path.getsize(cached_path) - replaced
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+        self._total_bytes = total
+
+    def record(self, hit: bool):
+        """Count one cache lookup"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size of the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
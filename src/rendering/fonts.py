@@ -0,0 +1,95 @@
+"""Font size ladder for auto-fitting slide text.
+
+Auto-fit binary-searches the largest font size whose wrapped text fits the
+slide. Loading a FreeTypeFont per probe is slow, so FontLadder keeps an LRU of
+loaded sizes, each with its own TextLayout (and so its own word width cache).
+"""
+
+from collections import OrderedDict
+
+from PIL import ImageFont
+
+try:
+    from .text_layout import TextLayout
+except ImportError:  # run as a script from src/rendering
+    from text_layout import TextLayout
+
+
+def line_height(font) -> int:
+    """Natural line height of a font (ascent + descent) in pixels"""
+    if hasattr(font, "getmetrics"):
+        ascent, descent = font.getmetrics()
+        return ascent + descent
+    return font.getbbox("Ag")[3]  # legacy bitmap fonts have no metrics
+
+
+def load_font(font_path: str, size: int):
+    """Load a TrueType font, falling back to Pillow's built-in font"""
+    try:
+        return ImageFont.truetype(font_path, size)
+    except IOError:
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:  # Pillow < 10.1: fixed-size bitmap font only
+            return ImageFont.load_default()
+
+
+class FontLadder:
+    """LRU of per-size fonts and layouts for one font file"""
+
+    def __init__(self, font_path: str, max_width: int, max_sizes: int = 16):
+        """
+        Args:
+            font_path: TrueType font file
+            max_width: Line width limit passed to every TextLayout
+            max_sizes: Number of font sizes kept loaded
+        """
+        self.font_path = font_path
+        self.max_width = max_width
+        self.max_sizes = max_sizes
+        self.loads = 0
+        self._layouts = OrderedDict()
+
+    def add(self, size: int, font) -> TextLayout:
+        """Register an already loaded font for a size"""
+        layout = TextLayout(font, self.max_width, line_height=line_height(font))
+        self._layouts[size] = layout
+        self._layouts.move_to_end(size)
+        while len(self._layouts) > self.max_sizes:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def layout(self, size: int) -> TextLayout:
+        """TextLayout for a font size, loading the font on first use"""
+        layout = self._layouts.get(size)
+        if layout is not None:
+            self._layouts.move_to_end(size)
+            return layout
+        self.loads += 1
+        return self.add(size, load_font(self.font_path, size))
+
+    def fits(self, text: str, size: int, max_height: int) -> bool:
+        """Whether text wraps within max_width and max_height at this size"""
+        layout = self.layout(size)
+        lines = layout.wrap(text)
+        if len(lines) * layout.line_height > max_height:
+            return False
+        return all(width < self.max_width for _, width in lines)
+
+    def fit(self, text: str, max_height: int, min_size: int, max_size: int) -> TextLayout:
+        """
+        Binary-search the largest size in [min_size, max_size] that fits
+
+        Returns:
+            TextLayout for that size (min_size if nothing fits)
+        """
+        best = min_size
+        low, high = min_size, max_size
+        while low <= high:
+            mid = (low + high) // 2
+            if self.fits(text, mid, max_height):
+                best = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+        return self.layout(best)
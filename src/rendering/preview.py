@@ -0,0 +1,39 @@
+"""Contact sheets of low-resolution slide previews for editorial review.
+
+Reviewers only glance at thumbnails, so previews are drawn by a renderer at a
+fraction of full size (fonts and padding scaled with the canvas), tiled into a
+single image and saved as a quick, low-quality JPEG.
+"""
+
+import math
+
+from PIL import Image
+
+PREVIEW_BACKGROUND = (32, 32, 32)
+
+
+def sheet_columns(count: int) -> int:
+    """Columns for a roughly square grid of count slides"""
+    return max(1, math.ceil(math.sqrt(count)))
+
+
+def contact_sheet(images: list, columns: int = None, gap: int = 8, background=PREVIEW_BACKGROUND) -> Image.Image:
+    """
+    Tile same-sized slide images into one sheet, left to right and top to bottom
+
+    Args:
+        images: Slide images (all the size of the first)
+        columns: Slides per row (default: a roughly square grid)
+        gap: Pixels between slides and around the edge
+        background: Color behind the slides
+    """
+    if not images:
+        raise ValueError("contact_sheet needs at least one image")
+    columns = columns or sheet_columns(len(images))
+    rows = math.ceil(len(images) / columns)
+    width, height = images[0].size
+    sheet = Image.new("RGB", (gap + columns * (width + gap), gap + rows * (height + gap)), background)
+    for i, image in enumerate(images):
+        row, column = divmod(i, columns)
+        sheet.paste(image, (gap + column * (width + gap), gap + row * (height + gap)))
+    return sheet
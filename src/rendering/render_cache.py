@@ -0,0 +1,16 @@
+"""Content-addressed on-disk cache of rendered slides.
+
+Slides are keyed by a hash of everything that affects their pixels (text,
+canvas size, font, colors and renderer version). A hit is hard-linked (or
+copied, across filesystems) into the output directory instead of being drawn
+and encoded again. Storage and LRU eviction are FileCache's (file_cache.py).
+"""
+
+try:
+    from .file_cache import FileCache
+except ImportError:  # run as a script: python src/rendering/carousel_renderer.py
+    from file_cache import FileCache
+
+
+class RenderCache(FileCache):
+    """LRU-evicted directory of rendered slide files"""
@@ -0,0 +1,105 @@
+"""Process pool that spreads slide rendering across CPU cores.
+
+Each worker process builds a single CarouselRenderer when it starts, so the
+TrueType font is loaded once per worker and reused for every slide it draws.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Renderer owned by the current worker process (set by _init_worker)
+_worker_renderer = None
+
+
+def _init_worker(renderer_cls, config: dict):
+    global _worker_renderer
+    _worker_renderer = renderer_cls(**config)
+
+
+def _encode_slide(index: int, slide_data: dict) -> tuple:
+    return index, _worker_renderer.encode_slide(index, slide_data).getvalue()
+
+
+def _render_job(job_id, slides_data: list[dict], output_dir: str) -> dict:
+    start = time.perf_counter()
+    result = {"id": job_id, "output_dir": output_dir, "output_paths": [], "error": None,
+              "cache_hits": 0, "cache_misses": 0}
+    cache = _worker_renderer.cache
+    before = cache.stats() if cache is not None else None
+    try:
+        result["output_paths"] = _worker_renderer.render_carousel(slides_data, output_dir=output_dir)
+    except Exception as e:
+        result["error"] = str(e)
+    if cache is not None:
+        after = cache.stats()
+        result["cache_hits"] = after["hits"] - before["hits"]
+        result["cache_misses"] = after["misses"] - before["misses"]
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+class RenderPool:
+    """Pool of warm renderer processes configured like a given CarouselRenderer"""
+
+    def __init__(self, renderer, workers: int = None):
+        """
+        Args:
+            renderer: CarouselRenderer whose config every worker copies
+            workers: Number of worker processes (defaults to the CPU count)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(type(renderer), renderer.config),
+        )
+
+    def encode_slides(self, items: list[tuple]):
+        """
+        Render and encode slides in parallel
+
+        Args:
+            items: (slide index, slide data) pairs
+
+        Yields:
+            (slide index, encoded bytes) in the order of items
+        """
+        futures = [self._executor.submit(_encode_slide, index, slide_data) for index, slide_data in items]
+        for future in futures:
+            yield future.result()
+
+    def map_jobs(self, jobs, max_pending: int = None):
+        """
+        Render whole carousels, one job per worker task
+
+        Jobs are pulled from the iterable lazily and at most max_pending are
+        in flight at once, so memory stays bounded however long the batch is.
+
+        Args:
+            jobs: Iterable of (job_id, slides_data, output_dir) tuples
+            max_pending: In-flight job limit (defaults to twice the workers)
+
+        Yields:
+            Result dicts (id, output_dir, output_paths, seconds, error,
+            cache_hits, cache_misses) in input order
+        """
+        max_pending = max_pending or self.workers * 2
+        pending = deque()
+        for job_id, slides_data, output_dir in jobs:
+            pending.append(self._executor.submit(_render_job, job_id, slides_data, output_dir))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def close(self):
+        """Shut down the worker processes"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
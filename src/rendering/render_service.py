@@ -0,0 +1,250 @@
+"""Long-running carousel render service.
+
+Keeps one CarouselRenderer (fonts, layout caches and blank canvases) warm in a
+single process and accepts slide JSON over local HTTP, either on a loopback
+TCP port or on a Unix socket, so callers skip Python/Pillow start-up per render.
+
+Endpoints:
+    POST /render  {"slides": [{"text": ...}, ...], "output_dir": "...", "return": "paths" | "bytes"}
+    GET  /stats   queue depth, completed/failed counts and latency percentiles
+    GET  /health  liveness probe
+
+Run: python src/rendering/render_service.py --port 8765
+     python src/rendering/render_service.py --socket /run/nexus/render.sock
+"""
+
+import argparse
+import base64
+import json
+import math
+import os
+import queue
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from .carousel_renderer import CarouselRenderer
+except ImportError:  # run as a script: python src/rendering/render_service.py
+    from carousel_renderer import CarouselRenderer
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0.0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class RenderService:
+    """Serializes render jobs onto one warm renderer and tracks latency"""
+
+    def __init__(self, renderer: CarouselRenderer = None, max_queue: int = 64, latency_window: int = 500):
+        """
+        Args:
+            renderer: Renderer to keep warm (a default CarouselRenderer if None)
+            max_queue: Jobs allowed to wait before submit() rejects new ones
+            latency_window: Number of recent jobs used for latency percentiles
+        """
+        self.renderer = renderer or CarouselRenderer()
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._latencies = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.started_at = time.time()
+        self._worker = threading.Thread(target=self._run, name="render-worker", daemon=True)
+        self._worker.start()
+
+    def submit(self, request: dict) -> Future:
+        """
+        Queue a render request
+
+        Raises:
+            queue.Full: If max_queue jobs are already waiting
+        """
+        future = Future()
+        self._queue.put_nowait((request, future, time.perf_counter()))
+        return future
+
+    def render(self, request: dict, timeout: float = None) -> dict:
+        """Queue a request and wait for its result"""
+        return self.submit(request).result(timeout)
+
+    def _run(self):
+        while True:
+            request, future, queued_at = self._queue.get()
+            if request is None:
+                break
+            with self._lock:
+                self._in_flight += 1
+            try:
+                result = self._render(request)
+                result["latency_ms"] = round((time.perf_counter() - queued_at) * 1000, 2)
+                future.set_result(result)
+                ok = True
+            except Exception as e:
+                future.set_exception(e)
+                ok = False
+            with self._lock:
+                self._in_flight -= 1
+                self._latencies.append((time.perf_counter() - queued_at) * 1000)
+                if ok:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    def _render(self, request: dict) -> dict:
+        slides = request.get("slides") if isinstance(request, dict) else None
+        if not isinstance(slides, list):
+            raise ValueError("'slides' must be a list of slide objects")
+
+        if request.get("return", "paths") == "bytes":
+            encoded = [
+                base64.b64encode(buffer.getbuffer()).decode("ascii")
+                for buffer in self.renderer.render_carousel_to_buffers(slides)
+            ]
+            return {"format": self.renderer.encoder.output_format, "slides": encoded}
+
+        output_dir = request.get("output_dir", "/srv/outputs")
+        return {"output_paths": self.renderer.render_carousel(slides, output_dir=output_dir)}
+
+    def stats(self) -> dict:
+        """Queue depth, job counts and latency percentiles (milliseconds)"""
+        with self._lock:
+            latencies = list(self._latencies)
+            return {
+                "queue_depth": self._queue.qsize(),
+                "in_flight": self._in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "latency_ms": {
+                    "p50": round(percentile(latencies, 50), 2),
+                    "p95": round(percentile(latencies, 95), 2),
+                    "max": round(max(latencies, default=0.0), 2),
+                },
+            }
+
+    def close(self):
+        """Stop the worker thread once queued jobs have been rendered"""
+        self._queue.put((None, None, None))
+        self._worker.join()
+        self.renderer.close()
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """JSON-over-HTTP front end for the server's RenderService"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send_json(200, self.server.service.stats())
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid JSON: {str(e)}"})
+            return
+
+        try:
+            future = self.server.service.submit(request)
+        except queue.Full:
+            self._send_json(503, {"error": "Render queue is full"})
+            return
+
+        try:
+            self._send_json(200, future.result())
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"error": f"Render failed: {str(e)}"})
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    """Loopback TCP server bound to a RenderService"""
+
+    daemon_threads = True
+
+    def __init__(self, address, service: RenderService, quiet: bool = False):
+        super().__init__(address, RenderRequestHandler)
+        self.service = service
+        self.quiet = quiet
+
+
+class UnixRenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server bound to a RenderService"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: RenderService, quiet: bool = False):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, RenderRequestHandler)
+        self.service = service
+        self.quiet = quiet
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nexus carousel render service")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address for TCP mode")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (ignored with --socket)")
+    parser.add_argument("--socket", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("--max-queue", type=int, default=64, help="Maximum queued render jobs")
+    parser.add_argument("--quiet", action="store_true", help="Disable per-request logging")
+    args = parser.parse_args()
+
+    service = RenderService(max_queue=args.max_queue)
+    if args.socket:
+        server = UnixRenderServer(args.socket, service, quiet=args.quiet)
+        print(f"Render service listening on unix:{args.socket}")
+    else:
+        server = RenderHTTPServer((args.host, args.port), service, quiet=args.quiet)
+        print(f"Render service listening on http://{args.host}:{server.server_address[1]}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Cached text layout for carousel slides.
+
+Wrapping by re-measuring the whole candidate line with ``ImageDraw.textbbox``
+after every word is quadratic in line length. ``TextLayout`` measures each
+distinct word once per font and builds line widths from the cached advances,
+producing exactly the same line breaks as the original measure-the-line loop.
+"""
+
+import math
+from collections import namedtuple
+
+LineBox = namedtuple("LineBox", ["text", "x", "y", "width"])
+
+
+class TextLayout:
+    """Greedy word wrapper backed by a per-font word advance cache"""
+
+    MAX_CACHED_WORDS = 20000
+
+    def __init__(self, font, max_width: int, line_height: int = 50, verify_margin: int = 2):
+        """
+        Args:
+            font: Loaded Pillow font (FreeTypeFont or the bitmap fallback)
+            max_width: Lines must be strictly narrower than this (pixels)
+            line_height: Vertical advance between lines (pixels)
+            verify_margin: Candidate widths within this many pixels of
+                max_width are re-measured exactly with the font
+        """
+        self.font = font
+        self.max_width = max_width
+        self.line_height = line_height
+        self.verify_margin = verify_margin
+        self._space = font.getlength(" ")
+        self._words = {}
+
+    def measure(self, word: str) -> tuple:
+        """Return (advance, ink right edge) of a single word, cached"""
+        metrics = self._words.get(word)
+        if metrics is None:
+            if len(self._words) >= self.MAX_CACHED_WORDS:
+                self._words.clear()
+            metrics = (self.font.getlength(word), self.font.getbbox(word)[2])
+            self._words[word] = metrics
+        return metrics
+
+    def _fits(self, pen: float, words: list, word: str) -> bool:
+        # textbbox()[2] of a line is its rounded pen position before the last
+        # word plus that word's ink extent.
+        width = math.floor(pen + 0.5) + self.measure(word)[1]
+        if abs(width - self.max_width) <= self.verify_margin:
+            width = self.font.getbbox(" ".join(words + [word]))[2]
+        return width < self.max_width
+
+    def wrap(self, text: str) -> list[tuple[str, int]]:
+        """
+        Break text into lines that fit max_width
+
+        Returns:
+            List of (line text, line width) tuples. Like the original wrapper,
+            a first word wider than max_width yields an empty leading line.
+        """
+        lines = []
+        current_line = []
+        pen = 0.0  # advance of current_line plus its trailing space
+        for word in text.split():
+            advance = self.measure(word)[0]
+            if self._fits(pen, current_line, word):
+                current_line.append(word)
+                pen += advance + self._space
+            else:
+                lines.append(current_line)
+                current_line = [word]
+                pen = advance + self._space
+        lines.append(current_line)
+        return [(" ".join(words), self.line_width(words)) for words in lines]
+
+    def line_width(self, words: list) -> int:
+        """Width of the words joined by single spaces, as textbbox reports it"""
+        if not words:
+            return 0
+        pen = sum(self.measure(word)[0] for word in words[:-1]) + self._space * (len(words) - 1)
+        return math.floor(pen + 0.5) + self.measure(words[-1])[1]
+
+    def layout(self, text: str, width: int, height: int) -> list[LineBox]:
+        """
+        Wrap text and center the block on a width x height canvas
+
+        Returns:
+            LineBox per line with the top-left position to draw it at
+        """
+        lines = self.wrap(text)
+        y_text = (height - len(lines) * self.line_height) / 2
+        boxes = []
+        for line, line_width in lines:
+            boxes.append(LineBox(line, (width - line_width) / 2, y_text, line_width))
+            y_text += self.line_height
+        return boxes
@@ -0,0 +1,94 @@
+"""Cache of rasterized text runs, blitted instead of re-drawn.
+
+Carousels repeat the same text on every slide (the handle, footer and slide
+counter that CarouselRenderer draws as branding) and re-renders repeat every
+line. ImageDraw.text rasterizes the glyphs each time;
+TextRunCache keeps an "L" coverage mask of each run and blits it with
+ImageDraw.bitmap in the fill color, giving the same pixels several times faster.
+Masks are drawn with ImageDraw.text itself at the same sub-pixel start, and do
+not depend on the fill color, so one mask serves every color. The cache is an
+LRU bounded by the total bytes of its masks.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+class TextRunCache:
+    """Byte-bounded LRU of (font, text, sub-pixel start) -> coverage mask"""
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Total mask bytes kept (one 40px line across a 1080px slide is ~45 KB)
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._runs = OrderedDict()  # (id(font), text, start) -> (font, mask, offset)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def rasterize(font, text: str, start: tuple = (0.0, 0.0)) -> tuple:
+        """
+        Render text into an "L" coverage mask, as ImageDraw.text does at a sub-pixel start
+
+        Args:
+            start: Fractional part of the text origin, each in [0, 1)
+
+        Returns:
+            (mask image, (dx, dy) offset of the mask from the integer text origin)
+        """
+        if isinstance(font, ImageFont.FreeTypeFont):
+            glyphs, (dx, dy) = font.getmask2(text, "L", start=start)
+        else:
+            glyphs, (dx, dy) = font.getmask(text, "L"), (0, 0)  # bitmap fonts have no sub-pixel start
+        # Glyphs may reach left of or above the origin; pad so the whole run lands inside the mask
+        pad_x, pad_y = max(0, -dx), max(0, -dy)
+        mask = Image.new("L", (pad_x + dx + glyphs.size[0], pad_y + dy + glyphs.size[1]))
+        ImageDraw.Draw(mask).text((pad_x + start[0], pad_y + start[1]), text, font=font, fill=255)
+        return mask, (-pad_x, -pad_y)
+
+    def get(self, font, text: str, start: tuple = (0.0, 0.0)) -> tuple:
+        """Cached (mask, offset) for a run, rasterizing it on a miss"""
+        # Entries hold a reference to the font, so its id() cannot be reused while cached
+        key = (id(font), text, start)
+        with self._lock:
+            entry = self._runs.get(key)
+            if entry is not None:
+                self._runs.move_to_end(key)
+                self.hits += 1
+                return entry[1], entry[2]
+
+        mask, offset = self.rasterize(font, text, start)
+        size = mask.size[0] * mask.size[1]
+        with self._lock:
+            self.misses += 1
+            if size <= self.max_bytes and key not in self._runs:
+                self._runs[key] = (font, mask, offset)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, (_, evicted, _) = self._runs.popitem(last=False)
+                    self._bytes -= evicted.size[0] * evicted.size[1]
+        return mask, offset
+
+    def draw(self, draw: ImageDraw.ImageDraw, xy: tuple, text: str, font, fill):
+        """Same result as draw.text(xy, text, font=font, fill=fill) for a single line"""
+        if not text:
+            return
+        if xy[0] < 0 or xy[1] < 0:
+            # ImageDraw.text rasterizes these with a negative sub-pixel start that a mask cannot reproduce
+            draw.text(xy, text, font=font, fill=fill)
+            return
+        start = (math.modf(xy[0])[0], math.modf(xy[1])[0])
+        mask, (dx, dy) = self.get(font, text, start)
+        draw.bitmap((int(xy[0]) + dx, int(xy[1]) + dy), mask, fill=fill)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"runs": len(self._runs), "bytes": self._bytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses}
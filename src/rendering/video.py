@@ -0,0 +1,104 @@
+"""Short videos from carousel slides, streamed straight into ffmpeg.
+
+Frames are produced by a generator and written to ffmpeg's stdin as raw RGB24
+buffers, so nothing touches the disk except the finished video. At most two
+slides (the current one and the one being faded in) are held in memory, which
+keeps memory use flat no matter how many slides or seconds the video has.
+"""
+
+import os
+import subprocess
+import threading
+from collections import deque
+
+from PIL import Image
+
+FFMPEG_BIN = os.environ.get("FFMPEG_BIN", "ffmpeg")
+
+
+def slide_frames(slides, fps: int = 30, slide_seconds: float = 3.0, transition_seconds: float = 0.5):
+    """
+    Raw RGB frames for a sequence of slide images with crossfades between them
+
+    Args:
+        slides: Iterable of same-sized PIL images (consumed lazily)
+        fps: Frames per second
+        slide_seconds: How long each slide is fully shown
+        transition_seconds: Crossfade length between consecutive slides (0 for hard cuts)
+
+    Yields:
+        bytes of one RGB24 frame; held frames reuse the same buffer
+    """
+    hold_frames = max(1, round(slide_seconds * fps))
+    fade_frames = max(0, round(transition_seconds * fps))
+    previous = None
+    for slide in slides:
+        slide = slide.convert("RGB")
+        if previous is not None:
+            for step in range(1, fade_frames + 1):
+                yield Image.blend(previous, slide, step / (fade_frames + 1)).tobytes()
+        frame = slide.tobytes()
+        for _ in range(hold_frames):
+            yield frame
+        previous = slide
+
+
+def ffmpeg_command(output_path: str, size: tuple, fps: int = 30, ffmpeg_bin: str = FFMPEG_BIN,
+                   codec: str = "libx264", crf: int = 23, preset: str = "veryfast") -> list[str]:
+    """ffmpeg arguments that read raw RGB24 frames from stdin and encode an MP4"""
+    width, height = size
+    return [
+        ffmpeg_bin, "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+        "-c:v", codec, "-preset", preset, "-crf", str(crf),
+        "-pix_fmt", "yuv420p", "-movflags", "+faststart",
+        output_path,
+    ]
+
+
+def write_video(frames, output_path: str, size: tuple, fps: int = 30, ffmpeg_bin: str = FFMPEG_BIN, **encode_options) -> int:
+    """
+    Pipe raw RGB frames into an ffmpeg subprocess
+
+    Args:
+        frames: Iterable of RGB24 frame buffers (e.g. from slide_frames)
+        output_path: Video file to write
+        size: (width, height) of every frame
+        encode_options: codec, crf or preset overrides for ffmpeg_command
+
+    Returns:
+        Number of frames written
+
+    Raises:
+        RuntimeError: If ffmpeg cannot be started or exits with an error
+    """
+    command = ffmpeg_command(output_path, size, fps, ffmpeg_bin, **encode_options)
+    try:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise RuntimeError(f"Could not start ffmpeg ({ffmpeg_bin}): {str(e)}")
+
+    # Drain stderr on a thread so a chatty ffmpeg can never block on a full pipe
+    stderr_tail = deque(maxlen=20)
+    reader = threading.Thread(target=lambda: stderr_tail.extend(process.stderr), daemon=True)
+    reader.start()
+
+    written = 0
+    try:
+        for frame in frames:
+            process.stdin.write(frame)
+            written += 1
+    except BrokenPipeError:
+        pass  # ffmpeg exited early; its return code and stderr explain why
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        return_code = process.wait()
+        reader.join()
+
+    if return_code != 0:
+        message = b"".join(stderr_tail).decode("utf-8", "replace").strip()
+        raise RuntimeError(f"ffmpeg exited with status {return_code}: {message}")
+    return written
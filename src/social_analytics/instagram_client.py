@@ -5,19 +5,47 @@ Handles authentication, data collection, and token refresh for Instagram.
 
 import os
 import json
-import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
-import psycopg2
-from psycopg2.extras import RealDictCursor
+
+try:
+    from ..api_clients import http_session
+except ImportError:  # src/ itself is on sys.path (scripts, tests)
+    from api_clients import http_session
+
+
+# psycopg2 is imported on first use, so importing the package (e.g. for
+# MetricsEngine) stays fast and works without the DB driver installed.
+def _psycopg2():
+    import psycopg2
+    import psycopg2.extras
+    return psycopg2
+
+
+def _dict_cursor():
+    return _psycopg2().extras.RealDictCursor
+
+
+def _parse_timestamp(value) -> datetime:
+    """Timezone-aware datetime from a Graph API timestamp ("2024-01-15T10:30:00+0000"),
+    an ISO 8601 string, a Unix timestamp or a datetime (naive values are taken as UTC)"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    if isinstance(value, str):
+        try:
+            value = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+        except ValueError:
+            value = datetime.fromisoformat(value)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
 
 
 class InstagramClient:
     """Instagram Graph API client with automatic token refresh"""
 
     BASE_URL = "https://graph.instagram.com/v18.0"
+    MEDIA_FIELDS = "id,media_type,media_product_type,caption,media_url,permalink,timestamp,like_count,comments_count,shares_count,ig_reels_aggregated_stats"
 
-    def __init__(self, access_token: str, app_id: str, app_secret: str):
+    def __init__(self, access_token: str, app_id: str, app_secret: str, session=None):
         """
         Initialize Instagram client
 
@@ -25,13 +53,19 @@ class InstagramClient:
             access_token: Instagram user access token
             app_id: Meta app ID
             app_secret: Meta app secret
+            session: requests.Session to use (default: the shared pooled session)
         """
         self.access_token = access_token
         self.app_id = app_id
         self.app_secret = app_secret
+        self.session = session
         self.ig_user_id = None
         self.username = None
 
+    def _get(self, operation: str, url: str, **kwargs):
+        # Every Graph API request goes through the pooled session and is timed and recorded
+        return http_session.get("instagram", operation, url, session=self.session, **kwargs)
+
     def refresh_long_lived_token(self) -> str:
         """
         Exchange short-lived token for long-lived token (60 days)
@@ -46,7 +80,7 @@ class InstagramClient:
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self._get("refresh_token", url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -72,7 +106,7 @@ class InstagramClient:
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self._get("user_info", url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -98,18 +132,60 @@ class InstagramClient:
 
         url = f"{self.BASE_URL}/{self.ig_user_id}/media"
         params = {
-            "fields": "id,media_type,media_product_type,caption,media_url,permalink,timestamp,like_count,comments_count,shares_count,ig_reels_aggregated_stats",
+            "fields": self.MEDIA_FIELDS,
             "limit": limit,
             "access_token": self.access_token,
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self._get("recent_posts", url, params=params)
             response.raise_for_status()
             return response.json().get("data", [])
         except Exception as e:
             raise Exception(f"Failed to get recent posts: {str(e)}")
 
+    def iter_media(self, page_size: int = 100, since=None):
+        """
+        Iterate over every post, newest first, following the paging cursors lazily
+
+        Only one page is held at a time, so memory stays flat however many posts
+        the account has. Pages are requested as the caller consumes posts.
+
+        Args:
+            page_size: Posts requested per page (the Graph API caps it at 100)
+            since: Watermark (datetime, ISO 8601 string or Unix timestamp); iteration
+                stops at the first post published at or before it
+
+        Yields:
+            Post dictionaries with the same fields as get_recent_posts
+        """
+        if not self.ig_user_id:
+            self.get_user_info()
+
+        watermark = _parse_timestamp(since) if since is not None else None
+        url = f"{self.BASE_URL}/{self.ig_user_id}/media"
+        params = {
+            "fields": self.MEDIA_FIELDS,
+            "limit": page_size,
+            "access_token": self.access_token,
+        }
+        while url:
+            try:
+                response = self._get("media_page", url, params=params)
+                response.raise_for_status()
+                page = response.json()
+            except Exception as e:
+                raise Exception(f"Failed to get media page: {str(e)}")
+
+            for post in page.get("data", []):
+                if watermark is not None and post.get("timestamp") and _parse_timestamp(post["timestamp"]) <= watermark:
+                    return
+                yield post
+
+            # The next URL already carries the cursor, fields, limit and token
+            url = page.get("paging", {}).get("next")
+            params = None
+
     def get_post_insights(self, post_id: str) -> Dict:
         """
         Get detailed insights for a specific post
@@ -127,7 +203,7 @@ class InstagramClient:
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self._get("post_insights", url, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -154,7 +230,7 @@ class InstagramClient:
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self._get("account_insights", url, params=params)
             response.raise_for_status()
             return response.json().get("data", [])
         except Exception as e:
@@ -173,7 +249,7 @@ class InstagramClient:
                 "input_token": self.access_token,
                 "access_token": self.access_token,
             }
-            response = requests.get(url, params=params)
+            response = self._get("validate_token", url, params=params)
             response.raise_for_status()
             data = response.json()
             return data.get("data", {}).get("is_valid", False)
@@ -204,7 +280,7 @@ class InstagramDatabaseManager:
     def connect(self):
         """Connect to PostgreSQL"""
         try:
-            self.connection = psycopg2.connect(
+            self.connection = _psycopg2().connect(
                 host=self.db_host,
                 user=self.db_user,
                 password=self.db_password,
@@ -232,7 +308,7 @@ class InstagramDatabaseManager:
         Returns:
             Account ID in database
         """
-        cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+        cursor = self.connection.cursor(cursor_factory=_dict_cursor())
 
         try:
             cursor.execute(
@@ -312,7 +388,7 @@ class InstagramDatabaseManager:
         Returns:
             Post ID in database
         """
-        cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+        cursor = self.connection.cursor(cursor_factory=_dict_cursor())
 
         try:
             cursor.execute(
@@ -387,7 +463,7 @@ class InstagramDatabaseManager:
 
     def get_latest_account_data(self, account_id: int) -> Dict:
         """Get latest account stats for FactsMind"""
-        cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+        cursor = self.connection.cursor(cursor_factory=_dict_cursor())
 
         try:
             cursor.execute(
@@ -406,7 +482,7 @@ class InstagramDatabaseManager:
 
     def get_top_posts_30d(self, account_id: int, limit: int = 5) -> List[Dict]:
         """Get top performing posts from last 30 days"""
-        cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+        cursor = self.connection.cursor(cursor_factory=_dict_cursor())
 
         try:
             cursor.execute(
@@ -426,7 +502,7 @@ class InstagramDatabaseManager:
 
     def get_content_strategy_insights(self, account_id: int) -> List[Dict]:
         """Get content type performance for strategy decisions"""
-        cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+        cursor = self.connection.cursor(cursor_factory=_dict_cursor())
 
         try:
             cursor.execute(
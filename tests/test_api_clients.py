@@ -13,7 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 class TestPexelsClient:
     """Test suite for PexelsClient."""
 
-    @patch('src.api_clients.pexels_client.requests.get')
+    @patch('requests.Session.get')
     def test_search_images_success(self, mock_get, mock_env_vars, mock_pexels_response):
         """Test successful image search."""
         from api_clients.pexels_client import PexelsClient
@@ -33,7 +33,7 @@ class TestPexelsClient:
         assert 'src' in results[0]
         mock_get.assert_called_once()
 
-    @patch('src.api_clients.pexels_client.requests.get')
+    @patch('requests.Session.get')
     def test_search_images_api_error(self, mock_get, mock_env_vars):
         """Test handling of API errors."""
         from api_clients.pexels_client import PexelsClient
@@ -48,15 +48,14 @@ class TestPexelsClient:
 
         assert "Pexels API error" in str(exc_info.value)
 
-    @patch('src.api_clients.pexels_client.requests.get')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_download_image_success(self, mock_file, mock_get, mock_env_vars, temp_dir):
+    @patch('requests.Session.get')
+    def test_download_image_success(self, mock_get, mock_env_vars, temp_dir):
         """Test successful image download."""
         from api_clients.pexels_client import PexelsClient
 
         # Setup mock
         mock_response = Mock()
-        mock_response.content = b'fake_image_data'
+        mock_response.iter_content.return_value = iter([b'fake_', b'image_data'])
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -65,15 +64,16 @@ class TestPexelsClient:
         filepath = os.path.join(temp_dir, "downloaded.jpg")
         client.download_image("https://example.com/image.jpg", filepath)
 
-        mock_get.assert_called_once_with("https://example.com/image.jpg")
-        mock_file.assert_called_once_with(filepath, 'wb')
+        mock_get.assert_called_once_with("https://example.com/image.jpg", stream=True)
+        with open(filepath, 'rb') as f:
+            assert f.read() == b'fake_image_data'
 
 
 @pytest.mark.unit
 class TestGroqClient:
     """Test suite for GroqClient."""
 
-    @patch('src.api_clients.groq_client.Groq')
+    @patch('groq.Groq')
     def test_generate_text_success(self, mock_groq_class, mock_env_vars, mock_llm_response):
         """Test successful text generation."""
         from api_clients.groq_client import GroqClient
@@ -92,7 +92,7 @@ class TestGroqClient:
         assert result == mock_llm_response
         mock_client.chat.completions.create.assert_called_once()
 
-    @patch('src.api_clients.groq_client.Groq')
+    @patch('groq.Groq')
     def test_generate_text_api_error(self, mock_groq_class, mock_env_vars):
         """Test handling of API errors."""
         from api_clients.groq_client import GroqClient
@@ -114,8 +114,8 @@ class TestGroqClient:
 class TestGeminiClient:
     """Test suite for GeminiClient."""
 
-    @patch('src.api_clients.gemini_client.genai.GenerativeModel')
-    @patch('src.api_clients.gemini_client.genai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    @patch('google.generativeai.configure')
     def test_generate_text_success(self, mock_configure, mock_model_class, mock_env_vars, mock_llm_response):
         """Test successful text generation."""
         from api_clients.gemini_client import GeminiClient
@@ -133,8 +133,8 @@ class TestGeminiClient:
         assert result == mock_llm_response
         mock_model.generate_content.assert_called_once_with("Test prompt")
 
-    @patch('src.api_clients.gemini_client.genai.GenerativeModel')
-    @patch('src.api_clients.gemini_client.genai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    @patch('google.generativeai.configure')
     def test_generate_text_api_error(self, mock_configure, mock_model_class, mock_env_vars):
         """Test handling of API errors."""
         from api_clients.gemini_client import GeminiClient
@@ -156,7 +156,7 @@ class TestGeminiClient:
 class TestClaudeClient:
     """Test suite for ClaudeClient."""
 
-    @patch('src.api_clients.claude_client.Anthropic')
+    @patch('anthropic.Anthropic')
     def test_generate_text_success(self, mock_anthropic_class, mock_env_vars, mock_llm_response):
         """Test successful text generation."""
         from api_clients.claude_client import ClaudeClient
@@ -175,7 +175,7 @@ class TestClaudeClient:
         assert result == mock_llm_response
         mock_client.messages.create.assert_called_once()
 
-    @patch('src.api_clients.claude_client.Anthropic')
+    @patch('anthropic.Anthropic')
     def test_generate_text_api_error(self, mock_anthropic_class, mock_env_vars):
         """Test handling of API errors."""
         from api_clients.claude_client import ClaudeClient
@@ -0,0 +1,92 @@
+"""Tests for background photo decoding and caching (backgrounds.py)."""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.backgrounds import BackgroundCache, cover_crop_box
+from rendering.carousel_renderer import CarouselRenderer
+
+
+@pytest.fixture
+def photo_path(temp_dir):
+    """A large landscape JPEG with a distinct center stripe, like a Pexels original."""
+    img = Image.new('RGB', (4000, 2000), color=(0, 128, 255))
+    ImageDraw.Draw(img).rectangle((1900, 0, 2100, 2000), fill=(255, 0, 0))
+    path = os.path.join(temp_dir, 'photo.jpg')
+    img.save(path, quality=90)
+    return path
+
+
+@pytest.mark.unit
+class TestBackgrounds:
+    """Test suite for BackgroundCache and cover fitting."""
+
+    def test_cover_crop_box_wide_and_tall(self):
+        """Test centered cover crops for wide and tall sources."""
+        assert cover_crop_box((2000, 1000), (1080, 1080)) == (500, 0, 1500, 1000)
+        assert cover_crop_box((1000, 2000), (1080, 1080)) == (0, 500, 1000, 1500)
+        assert cover_crop_box((1080, 1080), (1080, 1080)) == (0, 0, 1080, 1080)
+
+    def test_load_uses_jpeg_draft_decoding(self, photo_path, monkeypatch):
+        """Test that JPEGs are decoded at reduced scale before resizing."""
+        decoded_sizes = []
+        original_convert = Image.Image.convert
+
+        def spy_convert(self, *args, **kwargs):
+            decoded_sizes.append(self.size)
+            return original_convert(self, *args, **kwargs)
+
+        monkeypatch.setattr(Image.Image, 'convert', spy_convert)
+
+        background = BackgroundCache.load(photo_path, (540, 540))
+
+        assert background.size == (540, 540)
+        assert decoded_sizes[0] == (2000, 1000)  # 1/2 scale; 1/4 (1000x500) would not cover 540px
+
+    def test_fitted_background_is_center_cropped(self, photo_path):
+        """Test that the center of the photo ends up in the center of the slide."""
+        background = BackgroundCache.load(photo_path, (1080, 1080))
+
+        red, _, _ = background.getpixel((540, 540))
+        _, _, blue = background.getpixel((10, 540))
+        assert red > 200
+        assert blue > 200
+
+    def test_cache_shares_one_decode_per_carousel(self, photo_path, temp_dir):
+        """Test that all slides using the same photo share a single decode."""
+        renderer = CarouselRenderer(width=540, height=540)
+        slides = [{"text": f"Slide {i}", "background_image": photo_path} for i in range(5)]
+
+        paths = renderer.render_carousel(slides, output_dir=temp_dir)
+
+        assert renderer.backgrounds.decodes == 1
+        assert renderer.backgrounds.hits == 4
+        assert Image.open(paths[0]).getpixel((270, 5))[0] > 200
+
+    def test_cache_is_keyed_by_canvas_size(self, photo_path):
+        """Test that different canvas sizes get separate fitted backgrounds."""
+        cache = BackgroundCache()
+
+        cache.get(photo_path, (540, 540))
+        cache.get(photo_path, (1080, 1080))
+        cache.get(photo_path, (540, 540))
+
+        assert cache.decodes == 2
+        assert cache.hits == 1
+
+    def test_background_content_is_part_of_render_cache_key(self, photo_path, temp_dir):
+        """Test that replacing the photo file changes the render cache key."""
+        renderer = CarouselRenderer(width=540, height=540)
+        slide = {"text": "Same", "background_image": photo_path}
+        before = renderer.cache_key(0, slide)
+
+        Image.new('RGB', (800, 800), color='green').save(photo_path)
+
+        assert renderer.cache_key(0, slide) != before
+        assert renderer.cache_key(0, slide) != renderer.cache_key(0, {"text": "Same"})
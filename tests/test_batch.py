@@ -0,0 +1,106 @@
+"""Tests for batch generation (batch.py) and per-provider rate limiting (rate_limit.py)."""
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.batch import BatchResult, generate_batch
+from api_clients.rate_limit import RateLimiter, TokenBucket, provider_limiter
+
+
+@pytest.mark.unit
+class TestRateLimit:
+    """Test suite for TokenBucket and RateLimiter."""
+
+    def test_bucket_allows_burst_then_throttles(self):
+        """A full bucket serves its capacity at once, then refills at the per-minute rate."""
+        bucket = TokenBucket(per_minute=600, capacity=2)  # 10 per second
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+        assert 0.15 <= elapsed < 1.0
+
+    def test_oversized_request_is_clamped_to_capacity(self):
+        bucket = TokenBucket(per_minute=60000, capacity=10)
+        assert bucket.acquire(1000) == 0.0
+
+    def test_limiter_counts_prompt_and_completion_tokens(self):
+        assert RateLimiter.estimate_tokens("x" * 400, 200) == 300
+        limiter = RateLimiter(tokens_per_minute=600)
+        limiter.acquire("x" * 400, 200)
+        assert limiter.tokens.tokens == pytest.approx(300, abs=1)
+
+    def test_unlimited_limiter_never_waits(self):
+        limiter = RateLimiter()
+        assert limiter.acquire("prompt", 1000) == 0.0
+
+    def test_provider_limiter_reads_environment(self, monkeypatch):
+        monkeypatch.setenv('TESTPROVIDER_REQUESTS_PER_MINUTE', '30')
+        limiter = provider_limiter('testprovider')
+        assert limiter is provider_limiter('testprovider')
+        assert limiter.requests.rate == 0.5
+        assert limiter.tokens is None
+
+
+@pytest.mark.unit
+class TestGenerateBatch:
+    """Test suite for concurrent batch generation."""
+
+    def test_results_in_input_order_with_per_item_errors(self):
+        """Failures are reported per prompt and do not abort the batch."""
+        def generate_text(prompt, max_tokens):
+            time.sleep(0.01 * (5 - int(prompt)))  # later prompts finish first
+            if prompt == "2":
+                raise Exception("Groq API error: rate limited")
+            return f"fact {prompt}"
+
+        results = generate_batch(generate_text, [str(i) for i in range(5)], concurrency=5)
+
+        assert [result.index for result in results] == list(range(5))
+        assert results[0] == BatchResult(0, "0", "fact 0", None)
+        assert results[2].text is None and "rate limited" in results[2].error
+        assert all(result.error is None for i, result in enumerate(results) if i != 2)
+
+    def test_concurrency_is_bounded(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def generate_text(prompt, max_tokens):
+            with lock:
+                active.append(prompt)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(prompt)
+            return prompt
+
+        generate_batch(generate_text, [str(i) for i in range(12)], concurrency=3)
+        assert max(peak) == 3
+
+    @patch('groq.Groq')
+    def test_client_batch_respects_provider_rate_limit(self, mock_groq_class, mock_env_vars):
+        """generate_batch on a client goes through its request bucket."""
+        from api_clients.groq_client import GroqClient
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = lambda **kwargs: Mock(
+            choices=[Mock(message=Mock(content=kwargs["messages"][0]["content"].upper()))])
+        mock_groq_class.return_value = mock_client
+        limiter = RateLimiter(requests_per_minute=1200)  # 20 per second, burst of 1200
+        limiter.requests.tokens = 1  # start nearly empty
+
+        client = GroqClient(rate_limiter=limiter)
+        start = time.monotonic()
+        results = client.generate_batch(["a", "b", "c", "d"], concurrency=4)
+
+        assert [result.text for result in results] == ["A", "B", "C", "D"]
+        assert time.monotonic() - start >= 0.12
+        assert limiter.waited > 0
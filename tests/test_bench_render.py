@@ -0,0 +1,92 @@
+"""Tests for the rendering benchmark suite's regression gate (benchmarks/bench_render.py)."""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add benchmarks to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+from bench_render import benchmark_cases, compare, load_baseline, main, run_case, save_baseline
+
+
+@pytest.mark.unit
+class TestBenchRender:
+    """Test suite for benchmark cases and baseline comparison."""
+
+    def test_case_matrix(self):
+        """Full matrix covers every length, canvas and format; quick is a subset."""
+        cases = benchmark_cases()
+        assert len(cases) == 3 * 2 * 3
+        assert cases["long-portrait-webp"] == {"words": 300, "size": (1080, 1350), "format": "webp"}
+        quick = benchmark_cases(quick=True)
+        assert 0 < len(quick) < len(cases)
+        assert set(quick) <= set(cases)
+
+    def test_compare_flags_drops_past_tolerance(self):
+        """Only cases slower than baseline * (1 - tolerance) are regressions."""
+        baseline = {"cases": {
+            "a": {"slides_per_sec": 10.0},
+            "b": {"slides_per_sec": 10.0},
+            "c": {"slides_per_sec": 10.0},
+        }}
+        results = {
+            "a": {"slides_per_sec": 8.6},   # -14%: within 15%
+            "b": {"slides_per_sec": 8.0},   # -20%: regression
+            "c": {"slides_per_sec": 12.0},  # faster
+            "new": {"slides_per_sec": 1.0},  # no baseline: ignored
+        }
+        assert compare(results, baseline, tolerance=0.15) == [("b", 10.0, 8.0)]
+        assert compare(results, baseline, tolerance=0.25) == []
+
+    def test_baseline_round_trip(self, temp_dir):
+        """Saved baselines load back with their cases and machine info."""
+        path = os.path.join(temp_dir, 'baseline.json')
+        results = {"a": {"slides_per_sec": 5.0, "peak_rss_mb": 40.0}}
+        save_baseline(results, path)
+        baseline = load_baseline(path)
+        assert baseline["cases"] == results
+        assert "machine" in baseline and "recorded_at" in baseline
+
+    def test_run_case_reports_throughput_and_rss(self):
+        """A single small case renders and reports positive metrics."""
+        result = run_case({"words": 10, "size": (200, 200), "format": "jpeg"}, slides=2, runs=1)
+        assert result["slides_per_sec"] > 0
+        assert result["peak_rss_mb"] > 0
+
+    def test_check_exits_nonzero_on_regression(self, temp_dir, monkeypatch):
+        """--check returns 1 when a case falls below the baseline."""
+        import bench_render
+        monkeypatch.setattr(bench_render, 'run_isolated',
+                            lambda params, slides, runs, timeout: {"slides_per_sec": 5.0, "peak_rss_mb": 40.0})
+        path = os.path.join(temp_dir, 'baseline.json')
+        with open(path, 'w') as f:
+            json.dump({"cases": {"short-square-png": {"slides_per_sec": 10.0}}}, f)
+
+        args = ['--baseline', path, '--cases', 'short-square-png', '--check']
+        assert main(args) == 1
+        assert main(args + ['--tolerance', '0.6']) == 0
+
+    def test_crashed_case_raises_instead_of_hanging(self):
+        """A case process that dies without a result is reported, not waited on forever."""
+        import bench_render
+        with pytest.raises(RuntimeError, match="exited with code 1"):
+            bench_render.run_isolated({"words": 10, "size": (200, 200), "format": "bogus"}, timeout=60)
+
+    def test_slow_case_times_out(self):
+        import bench_render
+        with pytest.raises(RuntimeError, match="timed out"):
+            bench_render.run_isolated({"words": 10, "size": (200, 200), "format": "jpeg"}, timeout=0.05)
+
+    def test_failed_case_fails_the_check(self, temp_dir, monkeypatch):
+        import bench_render
+
+        def crash(params, slides, runs, timeout):
+            raise RuntimeError("benchmark process exited with code -9 without a result")
+        monkeypatch.setattr(bench_render, 'run_isolated', crash)
+        path = os.path.join(temp_dir, 'baseline.json')
+        with open(path, 'w') as f:
+            json.dump({"cases": {}}, f)
+        assert main(['--baseline', path, '--cases', 'short-square-png', '--check']) == 1
@@ -2,13 +2,16 @@
 import pytest
 import sys
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageDraw
+import io
 import os
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from rendering.carousel_renderer import CarouselRenderer
+from rendering.fonts import FontLadder
+from rendering.text_layout import TextLayout
 
 
 @pytest.mark.unit
@@ -125,3 +128,271 @@ class TestCarouselRenderer:
 
         slide = renderer.create_slide("Test")
         assert isinstance(slide, Image.Image)
+
+    def test_render_carousel_parallel_matches_sequential(self, temp_dir, carousel_slides_data):
+        """Test that parallel rendering returns the same paths, order and pixels."""
+        renderer = CarouselRenderer()
+        sequential_dir = os.path.join(temp_dir, "sequential")
+        parallel_dir = os.path.join(temp_dir, "parallel")
+
+        sequential = renderer.render_carousel(carousel_slides_data, output_dir=sequential_dir)
+        try:
+            parallel = renderer.render_carousel(carousel_slides_data, output_dir=parallel_dir, workers=2)
+        finally:
+            renderer.close()
+
+        assert parallel == [p.replace(sequential_dir, parallel_dir) for p in sequential]
+        for seq_path, par_path in zip(sequential, parallel):
+            assert Image.open(seq_path).tobytes() == Image.open(par_path).tobytes()
+
+    def test_render_pool_is_reused_between_calls(self, temp_dir):
+        """Test that the worker pool stays warm across render_carousel calls."""
+        renderer = CarouselRenderer()
+        slides = [{"text": "One"}, {"text": "Two"}]
+
+        try:
+            renderer.render_carousel(slides, output_dir=temp_dir, workers=2)
+            pool = renderer._pool
+            renderer.render_carousel(slides, output_dir=temp_dir, workers=2)
+            assert renderer._pool is pool
+        finally:
+            renderer.close()
+
+        assert renderer._pool is None
+
+    def test_render_pool_worker_builds_renderer_once(self, temp_dir):
+        """Test that a worker renders every slide with the renderer built at startup."""
+        from rendering import render_pool
+
+        renderer = CarouselRenderer(width=540, height=540)
+        render_pool._init_worker(CarouselRenderer, renderer.config)
+        worker_renderer = render_pool._worker_renderer
+
+        index, data = render_pool._encode_slide(0, {"text": "Worker"})
+
+        assert render_pool._worker_renderer is worker_renderer
+        assert worker_renderer.width == 540
+        assert index == 0
+        assert Image.open(io.BytesIO(data)).size == (540, 540)
+
+        result = render_pool._render_job("job", [{"text": "A"}, {"text": "B"}], os.path.join(temp_dir, "job"))
+
+        assert render_pool._worker_renderer is worker_renderer
+        assert result["error"] is None
+        assert len(result["output_paths"]) == 2
+
+    def test_render_batch_returns_results_in_order(self, temp_dir):
+        """Test batch rendering of several carousels through one pool."""
+        renderer = CarouselRenderer(width=540, height=540)
+        jobs = [
+            {"id": f"job{n}", "slides": [{"text": f"Carousel {n} slide {i}"} for i in range(2)]}
+            for n in range(5)
+        ]
+
+        try:
+            results = renderer.render_batch(jobs, output_dir=temp_dir, workers=2, max_pending=2)
+        finally:
+            renderer.close()
+
+        assert [r["id"] for r in results] == [f"job{n}" for n in range(5)]
+        for result in results:
+            assert result["error"] is None
+            assert result["seconds"] >= 0
+            assert result["output_dir"] == os.path.join(temp_dir, result["id"])
+            assert [os.path.basename(p) for p in result["output_paths"]] == ["slide_1.png", "slide_2.png"]
+            assert all(os.path.exists(p) for p in result["output_paths"])
+
+    def test_render_batch_reports_per_job_errors(self, temp_dir):
+        """Test that a failing job is reported without aborting the batch."""
+        renderer = CarouselRenderer(width=540, height=540)
+        blocker = os.path.join(temp_dir, "not_a_dir")
+        open(blocker, "w").close()
+        jobs = [
+            {"slides": [{"text": "Fine"}]},
+            {"slides": [{"text": "Broken"}], "output_dir": os.path.join(blocker, "out")},
+            {"slides": [{"text": "Also fine"}]},
+        ]
+
+        try:
+            results = renderer.render_batch(jobs, output_dir=temp_dir, workers=2)
+        finally:
+            renderer.close()
+
+        assert [r["id"] for r in results] == [1, 2, 3]
+        assert results[0]["error"] is None and results[2]["error"] is None
+        assert results[1]["error"]
+        assert results[1]["output_paths"] == []
+
+    def test_read_jobs_skips_blank_lines(self, temp_dir):
+        """Test reading carousel jobs from a JSON-lines file."""
+        from rendering.carousel_renderer import read_jobs
+
+        path = os.path.join(temp_dir, "jobs.jsonl")
+        with open(path, "w") as f:
+            f.write('{"id": "a", "slides": [{"text": "A"}]}\n\n{"id": "b", "slides": []}\n')
+
+        assert [job["id"] for job in read_jobs(path)] == ["a", "b"]
+
+    def test_render_carousel_to_buffers_matches_files(self, temp_dir, carousel_slides_data):
+        """Test that in-memory buffers hold exactly the bytes written to disk."""
+        renderer = CarouselRenderer()
+
+        buffers = renderer.render_carousel_to_buffers(carousel_slides_data)
+        paths = renderer.render_carousel(carousel_slides_data, output_dir=temp_dir)
+
+        assert len(buffers) == len(paths) == 5
+        for buffer, path in zip(buffers, paths):
+            assert buffer.tell() == 0
+            with open(path, 'rb') as f:
+                assert buffer.getvalue() == f.read()
+
+    def test_render_carousel_to_buffers_streams_to_sink(self, carousel_slides_data):
+        """Test that a sink receives every slide in order and nothing is retained."""
+        renderer = CarouselRenderer(width=540, height=540)
+        received = []
+
+        def sink(index, filename, data):
+            assert isinstance(data, memoryview)
+            received.append((index, filename, Image.open(io.BytesIO(data)).size))
+
+        result = renderer.render_carousel_to_buffers(carousel_slides_data, sink=sink)
+
+        assert result == []
+        assert received == [(i, f"slide_{i+1}.png", (540, 540)) for i in range(5)]
+
+    def test_render_carousel_to_buffers_parallel(self, carousel_slides_data):
+        """Test that parallel in-memory rendering keeps slide order."""
+        renderer = CarouselRenderer(width=540, height=540)
+
+        try:
+            parallel = renderer.render_carousel_to_buffers(carousel_slides_data, workers=2)
+        finally:
+            renderer.close()
+        sequential = renderer.render_carousel_to_buffers(carousel_slides_data)
+
+        assert [b.getvalue() for b in parallel] == [b.getvalue() for b in sequential]
+
+
+def legacy_wrap(draw, font, text, max_width):
+    """Reference implementation: the original per-word textbbox wrapping loop."""
+    lines = []
+    current_line = []
+    for word in text.split():
+        test_line = ' '.join(current_line + [word])
+        if draw.textbbox((0, 0), test_line, font=font)[2] < max_width:
+            current_line.append(word)
+        else:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+    lines.append(' '.join(current_line))
+    return [(line, draw.textbbox((0, 0), line, font=font)[2]) for line in lines]
+
+
+@pytest.mark.unit
+class TestTextLayout:
+    """Test suite for the cached TextLayout wrapper."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "Short",
+        "This is a very long text that should be wrapped " * 10,
+        "Supercalifragilisticexpialidociousandthensomemoretomakeitoverflowthecanvaswidth word",
+        "Mixed 123 punctuation, quotes \"like this\" and emoji-free symbols & stuff! " * 6,
+    ])
+    def test_wrap_matches_legacy_wrapping(self, text):
+        """Test that cached wrapping produces the same lines and widths as textbbox."""
+        renderer = CarouselRenderer()
+        draw = ImageDraw.Draw(Image.new('RGB', (renderer.width, renderer.height)))
+
+        expected = legacy_wrap(draw, renderer.font, text, renderer.width - 100)
+
+        assert renderer.layout.wrap(text) == expected
+
+    def test_wrap_matches_legacy_with_fallback_font(self):
+        """Test wrapping equivalence with the generic fallback font."""
+        renderer = CarouselRenderer(font_path="/nonexistent/font.ttf")
+        draw = ImageDraw.Draw(Image.new('RGB', (renderer.width, renderer.height)))
+        text = "The fallback font must wrap exactly like before " * 20
+
+        assert renderer.layout.wrap(text) == legacy_wrap(draw, renderer.font, text, renderer.width - 100)
+
+    def test_word_measurements_are_cached(self):
+        """Test that each distinct word is measured once."""
+        renderer = CarouselRenderer()
+        layout = TextLayout(renderer.font, 980)
+
+        layout.wrap("repeat repeat repeat other")
+
+        assert set(layout._words) == {"repeat", "other"}
+
+    def test_layout_centers_lines(self):
+        """Test that line boxes are centered and spaced by the font's line height."""
+        renderer = CarouselRenderer()
+        ascent, descent = renderer.font.getmetrics()
+
+        boxes = renderer.layout.layout("one two three " * 30, renderer.width, renderer.height)
+
+        assert renderer.layout.line_height == ascent + descent
+        assert len(boxes) > 1
+        assert boxes[0].y == (renderer.height - len(boxes) * (ascent + descent)) / 2
+        assert boxes[1].y - boxes[0].y == ascent + descent
+        for box in boxes:
+            assert box.x == (renderer.width - box.width) / 2
+            assert box.width < renderer.width - 100
+
+
+@pytest.mark.unit
+class TestAutoFit:
+    """Test suite for auto-fit font sizing."""
+
+    def test_short_text_gets_larger_font_than_long_text(self):
+        """Test that auto-fit scales the font to the amount of text."""
+        renderer = CarouselRenderer(auto_fit=True)
+
+        short = renderer.fit_layout("Honey never spoils.")
+        long = renderer.fit_layout("Octopuses have three hearts and blue blood. " * 30)
+
+        assert short.font.size > renderer.font_size > long.font.size
+        assert renderer.min_font_size <= long.font.size
+
+    def test_fitted_text_stays_inside_canvas(self):
+        """Test that the chosen size fits and the next size up does not."""
+        renderer = CarouselRenderer(auto_fit=True)
+        text = "The Eiffel Tower grows about fifteen centimeters taller in summer. " * 5
+
+        layout = renderer.fit_layout(text)
+        size = layout.font.size
+
+        assert renderer.fonts.fits(text, size, renderer.height - 100)
+        assert not renderer.fonts.fits(text, size + 1, renderer.height - 100)
+        boxes = layout.layout(text, renderer.width, renderer.height)
+        assert boxes[0].y >= 50
+        assert boxes[-1].y + layout.line_height <= renderer.height - 50
+
+    def test_font_ladder_reuses_loaded_sizes(self):
+        """Test that repeated fitting does not reload fonts."""
+        renderer = CarouselRenderer(auto_fit=True)
+        renderer.fit_layout("First slide text")
+        loads = renderer.fonts.loads
+
+        renderer.fit_layout("First slide text")
+
+        assert renderer.fonts.loads == loads
+
+    def test_font_ladder_evicts_least_recently_used(self):
+        """Test that the ladder keeps at most max_sizes fonts."""
+        renderer = CarouselRenderer()
+        ladder = FontLadder(renderer.font_path, 980, max_sizes=2)
+
+        ladder.layout(20)
+        ladder.layout(30)
+        ladder.layout(20)
+        ladder.layout(40)
+
+        assert list(ladder._layouts) == [20, 40]
+
+    def test_auto_fit_is_part_of_cache_key(self):
+        """Test that auto-fit and fixed-size slides are cached separately."""
+        slide = {"text": "Same"}
+
+        assert CarouselRenderer().cache_key(0, slide) != CarouselRenderer(auto_fit=True).cache_key(0, slide)
@@ -0,0 +1,118 @@
+"""Tests for slide encoders and the background slide writer (encoders.py)."""
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.carousel_renderer import CarouselRenderer
+from rendering.encoders import AsyncSlideWriter, SlideEncoder
+
+
+@pytest.mark.unit
+class TestSlideEncoder:
+    """Test suite for SlideEncoder."""
+
+    def test_defaults_match_plain_png_save(self):
+        """Test that the default encoder is Pillow's default PNG."""
+        encoder = SlideEncoder()
+
+        assert encoder.extension == '.png'
+        assert encoder.save_options() == {'compress_level': 6, 'optimize': False}
+
+    @pytest.mark.parametrize("output_format,extension,pil_format", [
+        ("png", ".png", "PNG"),
+        ("jpeg", ".jpg", "JPEG"),
+        ("jpg", ".jpg", "JPEG"),
+        ("webp", ".webp", "WEBP"),
+    ])
+    def test_formats(self, temp_dir, sample_image, output_format, extension, pil_format):
+        """Test encoding to each supported format."""
+        encoder = SlideEncoder(output_format)
+        path = os.path.join(temp_dir, f'slide{encoder.extension}')
+
+        encoder.save(sample_image, path)
+
+        assert encoder.extension == extension
+        assert Image.open(path).format == pil_format
+
+    def test_quality_defaults(self):
+        """Test per-format quality defaults and overrides."""
+        assert SlideEncoder('jpeg').save_options()['quality'] == 90
+        assert SlideEncoder('webp').save_options() == {'quality': 80, 'lossless': False}
+        assert SlideEncoder('webp', quality=50, lossless=True).save_options() == {'quality': 50, 'lossless': True}
+
+    def test_unsupported_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            SlideEncoder('gif')
+
+
+@pytest.mark.unit
+class TestAsyncSlideWriter:
+    """Test suite for AsyncSlideWriter."""
+
+    def test_runs_saves_in_order_off_thread(self):
+        """Test that queued saves run in order on the writer thread."""
+        calls = []
+
+        with AsyncSlideWriter() as writer:
+            for i in range(5):
+                writer.submit(lambda n: calls.append((n, threading.current_thread().name)), i)
+
+        assert [n for n, _ in calls] == list(range(5))
+        assert all(name == 'slide-writer' for _, name in calls)
+
+    def test_errors_are_raised_on_close(self):
+        """Test that a failing save does not block later saves and surfaces on close."""
+        calls = []
+
+        def boom():
+            raise RuntimeError("disk full")
+
+        writer = AsyncSlideWriter()
+        writer.submit(boom)
+        writer.submit(calls.append, 'after')
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            writer.close()
+        assert calls == ['after']
+
+
+@pytest.mark.unit
+class TestRendererOutputFormats:
+    """Test CarouselRenderer output format options."""
+
+    def test_render_carousel_webp(self, temp_dir, carousel_slides_data):
+        """Test rendering a carousel as WebP files."""
+        renderer = CarouselRenderer(output_format='webp', quality=70)
+
+        output_paths = renderer.render_carousel(carousel_slides_data, output_dir=temp_dir)
+
+        assert [os.path.basename(p) for p in output_paths] == [f'slide_{i+1}.webp' for i in range(5)]
+        assert all(Image.open(p).format == 'WEBP' for p in output_paths)
+
+    def test_async_and_sync_writes_match(self, temp_dir, carousel_slides_data):
+        """Test that background writes produce the same files as synchronous saves."""
+        sync_paths = CarouselRenderer(async_writes=False).render_carousel(
+            carousel_slides_data, output_dir=os.path.join(temp_dir, 'sync'))
+        async_paths = CarouselRenderer(async_writes=True).render_carousel(
+            carousel_slides_data, output_dir=os.path.join(temp_dir, 'async'))
+
+        for sync_path, async_path in zip(sync_paths, async_paths):
+            with open(sync_path, 'rb') as a, open(async_path, 'rb') as b:
+                assert a.read() == b.read()
+
+    def test_encoding_is_part_of_cache_key(self):
+        """Test that cached slides are not shared across encoder settings."""
+        slide = {'text': 'Same slide'}
+
+        png_key = CarouselRenderer().cache_key(0, slide)
+
+        assert png_key != CarouselRenderer(png_compress_level=1).cache_key(0, slide)
+        assert png_key != CarouselRenderer(output_format='jpeg').cache_key(0, slide)
@@ -0,0 +1,145 @@
+"""Tests for the pooled, retrying HTTP session (http_session.py) against a local stand-in server."""
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients import http_session
+from api_clients.instrumentation import Instrumentation
+from api_clients.pexels_client import PexelsClient
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+        time.sleep(self.server.handshake_delay)  # stands in for TCP + TLS setup over the tailnet
+
+    def do_GET(self):
+        status, headers = self.server.responses.pop(0) if self.server.responses else (200, {})
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+        body = b'{"photos": [{"id": 1}]}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.requests += 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = 0
+    server.handshake_delay = 0.0
+    server.responses = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session():
+    session = http_session.make_session(pool_size=4, retries=2, backoff_factor=0)
+    yield session
+    session.close()
+
+
+@pytest.mark.unit
+class TestPooledSession:
+    """Test suite for make_session connection reuse and timeouts."""
+
+    def test_connections_are_reused(self, server, session):
+        for _ in range(10):
+            assert session.get(f"{server.url}/search").status_code == 200
+        assert server.connections == 1
+
+    def test_module_level_get_opens_a_connection_per_call(self, server):
+        for _ in range(10):
+            requests.get(f"{server.url}/search")
+        assert server.connections == 10
+
+    def test_pooling_avoids_repeated_handshake_latency(self, server, session):
+        server.handshake_delay = 0.02
+        start = time.perf_counter()
+        for _ in range(10):
+            requests.get(f"{server.url}/search")
+        unpooled = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(10):
+            session.get(f"{server.url}/search")
+        pooled = time.perf_counter() - start
+        assert pooled < unpooled / 2
+
+    def test_default_timeout_applies(self, server):
+        session = http_session.make_session(retries=0, timeout=(1.0, 0.1))
+        with pytest.raises(requests.exceptions.RequestException):
+            session.get(f"{server.url}/slow")
+        session.close()
+
+    def test_shared_session_is_reused(self):
+        assert http_session.shared_session() is http_session.shared_session()
+
+
+@pytest.mark.unit
+class TestRetries:
+    """Test suite for retry, backoff and Retry-After handling."""
+
+    def test_429_with_retry_after_is_retried(self, server, session):
+        server.responses = [(429, {"Retry-After": "0"})]
+        response = session.get(f"{server.url}/search")
+        assert response.status_code == 200
+        assert http_session.retries_of(response) == 1
+        assert server.requests == 2
+
+    def test_5xx_exhausts_retries_and_returns_last_response(self, server, session):
+        server.responses = [(503, {}), (502, {}), (500, {})]
+        response = session.get(f"{server.url}/search")
+        assert response.status_code == 500
+        assert http_session.retries_of(response) == 2
+
+    def test_retry_after_is_capped(self, server):
+        session = http_session.make_session(retries=1, backoff_factor=0, max_retry_after=0.05)
+        server.responses = [(429, {"Retry-After": "120"})]
+        start = time.perf_counter()
+        assert session.get(f"{server.url}/search").status_code == 200
+        assert time.perf_counter() - start < 5
+        session.close()
+
+    def test_client_errors_are_not_retried(self, server, session):
+        server.responses = [(404, {})]
+        assert session.get(f"{server.url}/search").status_code == 404
+        assert server.requests == 1
+
+    def test_pexels_client_records_retries(self, server, session, mock_env_vars):
+        server.responses = [(429, {"Retry-After": "0"})]
+        instrumentation = Instrumentation()
+        client = PexelsClient(session=session)
+        client.base_url = server.url
+        with patch('api_clients.http_session.default_instrumentation', return_value=instrumentation):
+            assert client.search_images("ocean") == [{"id": 1}]
+        stats = instrumentation.stats()["providers"]["pexels"]
+        assert stats["calls"] == 1 and stats["retries"] == 1 and stats["errors"] == 0
@@ -0,0 +1,72 @@
+"""Tests for lazy SDK imports and the import-time benchmark (benchmarks/bench_import.py)."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add benchmarks to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+from bench_import import attributed_entries, check, measure_import, parse_importtime
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:       300 |        300 | site
+import time:        50 |         50 |       json.decoder
+import time:        40 |         90 |     json
+import time:       200 |        290 |   social_analytics.instagram_client
+import time:        10 |        300 | social_analytics
+"""
+
+
+@pytest.mark.unit
+class TestImportTime:
+    """Test suite for import-time parsing and startup checks."""
+
+    def test_parse_importtime(self):
+        """Lines are parsed into name, self, cumulative and nesting depth."""
+        entries = parse_importtime(SAMPLE)
+        assert entries[0] == ("_io", 120, 120, 0)
+        assert entries[2] == ("json.decoder", 50, 50, 3)
+        assert entries[-1] == ("social_analytics", 10, 300, 0)
+
+    def test_startup_modules_are_not_attributed(self):
+        """Interpreter startup imports are excluded from an entry point's cost."""
+        entries = attributed_entries(parse_importtime(SAMPLE), "social_analytics")
+        assert [name for name, _, _, _ in entries] == [
+            "json.decoder", "json", "social_analytics.instagram_client", "social_analytics"]
+
+    def test_check_reports_heavy_imports_and_budget(self):
+        results = [
+            {"module": "a", "error": None, "total_ms": 5.0, "heavy": []},
+            {"module": "b", "error": None, "total_ms": 900.0, "heavy": ["anthropic"]},
+            {"module": "c", "error": "ModuleNotFoundError", "heavy": []},
+        ]
+        problems = check(results, budget_ms=100)
+        assert len(problems) == 3
+        assert "imports anthropic" in problems[0]
+        assert "budget" in problems[1]
+        assert check(results[:1], budget_ms=100) == []
+
+    @pytest.mark.parametrize("module", ["api_clients.claude_client", "api_clients.gemini_client",
+                                        "api_clients.groq_client", "api_clients.pexels_client",
+                                        "social_analytics"])
+    def test_entry_points_defer_heavy_imports(self, module):
+        """Provider SDKs, requests and psycopg2 load on first use, not at import."""
+        result = measure_import(module)
+        assert result["error"] is None
+        assert result["heavy"] == []
+
+
+@pytest.mark.unit
+class TestRepoRootImports:
+    """Test suite for importing packages as src.<package> with only the repo root on sys.path."""
+
+    @pytest.mark.parametrize("module", ["src.social_analytics", "src.social_analytics.metrics_engine",
+                                        "src.social_analytics.instagram_client", "src.api_clients.pexels_client"])
+    def test_import_from_repo_root(self, module):
+        root = Path(__file__).parent.parent
+        result = subprocess.run([sys.executable, "-c", f"import {module}"], cwd=root,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,96 @@
+"""Tests for paginated media iteration in InstagramClient (iter_media)."""
+import sys
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from social_analytics.instagram_client import InstagramClient
+
+
+def media_page(posts, next_url=None):
+    data = {"data": posts, "paging": {"cursors": {"after": "cursor"}}}
+    if next_url:
+        data["paging"]["next"] = next_url
+    return Mock(status_code=200, json=Mock(return_value=data))
+
+
+def post(post_id, day):
+    return {"id": str(post_id), "timestamp": f"2024-01-{day:02d}T10:30:00+0000", "like_count": post_id}
+
+
+@pytest.fixture
+def session():
+    """Three pages of posts, newest first: 30th-21st, 20th-11th, 10th-1st of January."""
+    pages = {
+        "media": media_page([post(day, day) for day in range(30, 20, -1)], "https://graph/next-2"),
+        "https://graph/next-2": media_page([post(day, day) for day in range(20, 10, -1)], "https://graph/next-3"),
+        "https://graph/next-3": media_page([post(day, day) for day in range(10, 0, -1)]),
+    }
+    session = Mock()
+    session.get.side_effect = lambda url, **kwargs: pages["media" if url.endswith("/media") else url]
+    return session
+
+
+@pytest.fixture
+def client(session):
+    client = InstagramClient("token", "app", "secret", session=session)
+    client.ig_user_id = "17841400000000000"
+    return client
+
+
+@pytest.mark.unit
+class TestIterMedia:
+    """Test suite for InstagramClient.iter_media."""
+
+    def test_follows_paging_next_to_the_end(self, client, session):
+        posts = list(client.iter_media(page_size=10))
+        assert [p["id"] for p in posts] == [str(day) for day in range(30, 0, -1)]
+        assert session.get.call_count == 3
+
+    def test_first_request_carries_fields_and_page_size(self, client, session):
+        next(client.iter_media(page_size=100))
+        url, kwargs = session.get.call_args.args[0], session.get.call_args.kwargs
+        assert url.endswith("/17841400000000000/media")
+        assert kwargs["params"]["limit"] == 100
+        assert "timestamp" in kwargs["params"]["fields"]
+
+    def test_next_pages_use_the_cursor_url_as_is(self, client, session):
+        list(client.iter_media())
+        assert session.get.call_args_list[1].args[0] == "https://graph/next-2"
+        assert session.get.call_args_list[1].kwargs["params"] is None
+
+    def test_pages_are_fetched_lazily(self, client, session):
+        first_page = list(islice(client.iter_media(), 10))
+        assert len(first_page) == 10 and session.get.call_count == 1
+        list(islice(client.iter_media(), 11))
+        assert session.get.call_count == 3
+
+    @pytest.mark.parametrize("since", [
+        "2024-01-15T10:30:00+0000",
+        "2024-01-15T10:30:00+00:00",
+        datetime(2024, 1, 15, 10, 30),
+        datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc).timestamp(),
+    ])
+    def test_stops_at_watermark(self, client, session, since):
+        posts = list(client.iter_media(since=since))
+        assert [p["id"] for p in posts] == [str(day) for day in range(30, 15, -1)]
+        assert session.get.call_count == 2  # the third page is never requested
+
+    def test_fetches_user_id_when_unknown(self, session):
+        session.get.side_effect = [Mock(status_code=200, json=Mock(return_value={"id": "42", "username": "factsmind"})),
+                                   media_page([post(1, 1)])]
+        client = InstagramClient("token", "app", "secret", session=session)
+        assert [p["id"] for p in client.iter_media()] == ["1"]
+        assert session.get.call_args.args[0].endswith("/42/media")
+
+    def test_errors_are_wrapped(self, client, session):
+        session.get.side_effect = None
+        session.get.return_value = Mock(status_code=500, raise_for_status=Mock(side_effect=Exception("500 Server Error")))
+        with pytest.raises(Exception, match="Failed to get media page: 500"):
+            next(client.iter_media())
@@ -0,0 +1,208 @@
+"""Tests for external API call instrumentation (instrumentation.py) and its use by the clients."""
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.instrumentation import ApiCall, Instrumentation, PostgresSink, annotate, status_code_of
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.response = Mock(status_code=status_code)
+
+
+@pytest.fixture
+def instrumentation():
+    return Instrumentation()
+
+
+@pytest.fixture
+def recorded():
+    """Instrumentation with a list sink that is flushed by hand."""
+    batches = []
+    instrumentation = Instrumentation(sink=batches.append, batch_size=1000, flush_interval=60)
+    yield instrumentation, batches
+    instrumentation.close()
+
+
+@pytest.mark.unit
+class TestInstrumentation:
+    """Test suite for Instrumentation."""
+
+    def test_track_records_latency_status_and_tokens(self, instrumentation):
+        with instrumentation.track("claude", "generate") as call:
+            call["status_code"] = 200
+            annotate(input_tokens=120, output_tokens=30, cache_read_tokens=2000)
+        stats = instrumentation.stats()["providers"]["claude"]
+        assert stats["calls"] == 1 and stats["errors"] == 0
+        assert stats["input_tokens"] == 120
+        assert stats["output_tokens"] == 30
+        assert stats["cache_read_tokens"] == 2000
+        assert stats["p50_ms"] is not None
+
+    def test_exception_marks_failure_with_wrapped_status(self, recorded):
+        instrumentation, batches = recorded
+        with pytest.raises(Exception, match="Groq API error"):
+            with instrumentation.track("groq", "generate"):
+                try:
+                    raise HTTPError(429)
+                except Exception as e:
+                    raise Exception(f"Groq API error: {str(e)}")
+        instrumentation.flush()
+        call = batches[0][0]
+        assert not call.success
+        assert call.status_code == 429
+        assert "Groq API error" in call.error
+        assert instrumentation.stats()["providers"]["groq"]["error_rate"] == 1.0
+
+    def test_error_status_without_exception_is_a_failure(self, recorded):
+        instrumentation, batches = recorded
+        with instrumentation.track("instagram", "user_info") as call:
+            call["status_code"] = 500
+        instrumentation.flush()
+        assert batches[0][0].success is False
+
+    def test_non_integer_annotations_are_ignored(self, recorded):
+        instrumentation, batches = recorded
+        with instrumentation.track("gemini", "generate"):
+            annotate(input_tokens=Mock(), output_tokens=None)
+        instrumentation.flush()
+        assert batches[0][0].input_tokens is None and batches[0][0].retries == 0
+
+    def test_annotate_targets_innermost_call(self, recorded):
+        instrumentation, batches = recorded
+        with instrumentation.track("claude", "stream"):
+            with instrumentation.track("pexels", "search"):
+                annotate(retries=2)
+            annotate(output_tokens=5)
+        instrumentation.flush()
+        by_provider = {call.provider: call for call in batches[0]}
+        assert by_provider["pexels"].retries == 2 and by_provider["pexels"].output_tokens is None
+        assert by_provider["claude"].output_tokens == 5 and by_provider["claude"].retries == 0
+
+    def test_annotate_outside_a_call_is_a_no_op(self):
+        annotate(input_tokens=1)
+
+    def test_no_sink_keeps_records_in_process_only(self, instrumentation):
+        with instrumentation.track("pexels", "search"):
+            pass
+        assert instrumentation.flush() == 0
+        assert instrumentation.stats()["pending"] == 0
+
+    def test_batch_size_triggers_background_flush(self):
+        batches = []
+        instrumentation = Instrumentation(sink=batches.append, batch_size=3, flush_interval=60)
+        for _ in range(3):
+            with instrumentation.track("groq", "generate"):
+                pass
+        deadline = time.monotonic() + 2
+        while not batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        instrumentation.close()
+        assert sum(len(batch) for batch in batches) == 3
+        assert instrumentation.stats()["flushed"] == 3
+
+    def test_failed_flush_requeues_and_drops_oldest(self, capsys):
+        sink = Mock(side_effect=[Exception("db down"), None])
+        instrumentation = Instrumentation(sink=sink, batch_size=1000, flush_interval=60, max_pending=2)
+        for operation in ["a", "b"]:
+            with instrumentation.track("instagram", operation):
+                pass
+        assert instrumentation.flush() == 0
+        assert "db down" in capsys.readouterr().out
+        with instrumentation.track("instagram", "c"):
+            pass
+        assert instrumentation.flush() == 2
+        assert [call.operation for call in sink.call_args.args[0]] == ["b", "c"]
+        stats = instrumentation.stats()
+        assert stats["dropped"] == 1 and stats["flush_errors"] == 1
+        instrumentation.close()
+
+    def test_status_code_of_direct_and_missing(self):
+        assert status_code_of(Mock(status_code=503, __cause__=None, __context__=None)) == 503
+        assert status_code_of(ValueError("no status")) is None
+
+
+@pytest.mark.unit
+class TestPostgresSink:
+    """Test suite for PostgresSink."""
+
+    @patch('psycopg2.extras.execute_values')
+    @patch('psycopg2.connect')
+    def test_inserts_batch_into_api_calls(self, mock_connect, mock_execute_values):
+        call = ApiCall(1700000000.0, "claude", "generate", 812.5, 200, True, None, 0, 100, 20, 0, 0)
+        PostgresSink("dbname=nexus_system")([call])
+        sql, rows = mock_execute_values.call_args.args[1:3]
+        assert "monitoring.api_calls" in sql
+        assert rows[0][0].year == 2023 and rows[0][1:] == call[1:]
+        mock_connect.return_value.commit.assert_called_once()
+
+
+@pytest.mark.unit
+class TestClientInstrumentation:
+    """Test suite for the instrumented clients."""
+
+    @patch('groq.Groq')
+    def test_llm_client_records_generate_and_tokens(self, mock_groq_class, mock_env_vars, instrumentation):
+        from api_clients.groq_client import GroqClient
+
+        mock_client = Mock()
+        response = Mock(usage=Mock(prompt_tokens=11, completion_tokens=7))
+        response.choices = [Mock(message=Mock(content="fact"))]
+        mock_client.chat.completions.create.return_value = response
+        mock_groq_class.return_value = mock_client
+
+        client = GroqClient()
+        client.instrumentation = instrumentation
+        assert client.generate_text("prompt", use_cache=False) == "fact"
+        stats = instrumentation.stats()["providers"]["groq"]
+        assert stats["calls"] == 1 and stats["input_tokens"] == 11 and stats["output_tokens"] == 7
+
+    @patch('requests.Session.get')
+    def test_pexels_search_records_status(self, mock_get, mock_env_vars, instrumentation):
+        from api_clients.pexels_client import PexelsClient
+
+        mock_get.return_value = Mock(status_code=200, json=Mock(return_value={"photos": []}))
+        with patch('api_clients.http_session.default_instrumentation', return_value=instrumentation):
+            PexelsClient().search_images("ocean")
+        assert instrumentation.stats()["providers"]["pexels"]["calls"] == 1
+
+    @patch('requests.Session.get')
+    def test_instagram_calls_are_tracked(self, mock_get, instrumentation):
+        from social_analytics.instagram_client import InstagramClient
+
+        mock_get.return_value = Mock(status_code=400, json=Mock(return_value={}))
+        mock_get.return_value.raise_for_status.side_effect = Exception("400 Bad Request")
+        with patch('api_clients.http_session.default_instrumentation', return_value=instrumentation):
+            with pytest.raises(Exception, match="Failed to get user info"):
+                InstagramClient("token", "app", "secret").get_user_info()
+        stats = instrumentation.stats()["providers"]["instagram"]
+        assert stats["calls"] == 1 and stats["errors"] == 1
+
+    @patch('groq.Groq')
+    def test_stream_latency_excludes_consumer_time(self, mock_groq_class, mock_env_vars, instrumentation):
+        from api_clients.groq_client import GroqClient
+
+        chunks = [Mock(choices=[Mock(delta=Mock(content=text))]) for text in ("One. ", "Two. ", "Three.")]
+        mock_groq_class.return_value.chat.completions.create.return_value = iter(chunks)
+
+        client = GroqClient()
+        client.instrumentation = instrumentation
+        for _ in client.generate_stream("prompt", use_cache=False):
+            time.sleep(0.1)  # stands in for rendering a slide per sentence
+        stats = instrumentation.stats()["providers"]["groq"]
+        assert stats["calls"] == 1 and stats["errors"] == 0
+        assert stats["p50_ms"] < 100
+
+    def test_idle_time_is_left_out_of_latency(self, instrumentation):
+        with instrumentation.track("claude", "stream") as call:
+            time.sleep(0.05)
+            call["idle"] += 0.05
+        assert instrumentation.stats()["providers"]["claude"]["p50_ms"] < 40
@@ -41,7 +41,7 @@ class TestCarouselGenerationPipeline:
             file_size = os.path.getsize(path)
             assert file_size > 1000  # At least 1KB
 
-    @patch('src.api_clients.pexels_client.requests.get')
+    @patch('requests.Session.get')
     def test_carousel_with_pexels_images(self, mock_get, temp_dir, mock_env_vars, mock_pexels_response):
         """Test carousel generation with Pexels image integration."""
         from api_clients.pexels_client import PexelsClient
@@ -71,7 +71,7 @@ class TestCarouselGenerationPipeline:
         for path in output_paths:
             assert os.path.exists(path)
 
-    @patch('src.api_clients.groq_client.Groq')
+    @patch('groq.Groq')
     def test_carousel_with_ai_content_generation(self, mock_groq_class, temp_dir, mock_env_vars):
         """Test carousel generation with AI-generated content."""
         from api_clients.groq_client import GroqClient
@@ -0,0 +1,147 @@
+"""Tests for the latency-aware LLM router (llm_router.py) against local fake providers."""
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.llm_router import LLMRouter, percentile
+
+
+class FakeProvider:
+    """Stand-in LLM client with a fixed latency and optional failures."""
+
+    def __init__(self, provider, delay=0.0, fail=False):
+        self.provider = provider
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_text(self, prompt, max_tokens=1000):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise Exception(f"{self.provider} API error: unavailable")
+        return f"{self.provider}: {prompt}"
+
+
+@pytest.fixture
+def router_factory():
+    routers = []
+
+    def make(*providers, **kwargs):
+        router = LLMRouter(list(providers), **kwargs)
+        routers.append(router)
+        return router
+
+    yield make
+    for router in routers:
+        router.close()
+
+
+@pytest.mark.unit
+class TestLLMRouter:
+    """Test suite for LLMRouter."""
+
+    def test_percentile(self):
+        assert percentile([], 50) is None
+        assert percentile([3, 1, 2], 50) == 2
+        assert percentile(range(1, 101), 95) == 95
+
+    def test_routes_to_fastest_provider(self, router_factory):
+        """After every provider has history, requests go to the lowest p50."""
+        slow = FakeProvider("claude", delay=0.05)
+        fast = FakeProvider("groq", delay=0.0)
+        router = router_factory(slow, fast)
+        router.generate_text("warm up")  # untested providers are tried first
+        router.generate_text("warm up")
+
+        assert router.ranked() == ["groq", "claude"]
+        assert router.generate_text("fact") == "groq: fact"
+        stats = router.stats()["providers"]
+        assert stats["claude"]["p50_ms"] >= 50 > stats["groq"]["p50_ms"]
+
+    def test_fails_over_to_next_provider(self, router_factory):
+        broken = FakeProvider("claude", fail=True)
+        backup = FakeProvider("gemini")
+        router = router_factory(broken, backup)
+
+        assert router.generate_text("fact") == "gemini: fact"
+        assert router.stats()["providers"]["claude"]["error_rate"] == 1.0
+
+    def test_all_providers_failing_raises(self, router_factory):
+        router = router_factory(FakeProvider("claude", fail=True), FakeProvider("groq", fail=True))
+        with pytest.raises(Exception) as exc_info:
+            router.generate_text("fact")
+        assert "All LLM providers failed" in str(exc_info.value)
+        assert "claude" in str(exc_info.value) and "groq" in str(exc_info.value)
+
+    def test_unhealthy_provider_is_skipped_until_cooldown(self, router_factory):
+        """A provider over the error-rate limit is routed last until its cool-down ends."""
+        flaky = FakeProvider("claude", fail=True)
+        steady = FakeProvider("groq", delay=0.01)
+        router = router_factory(flaky, steady, min_samples=2, cooldown=60)
+        router.generate_text("a")
+        router.generate_text("b")
+
+        assert not router.is_healthy("claude")
+        assert router.ranked() == ["groq", "claude"]
+        calls = flaky.calls
+        router.generate_text("c")
+        assert flaky.calls == calls
+
+    def test_hedged_request_takes_first_answer(self, router_factory):
+        """A slow primary triggers a duplicate to the runner-up after the hedge delay."""
+        stalled = FakeProvider("claude", delay=1.0)
+        quick = FakeProvider("groq", delay=0.0)
+        router = router_factory(stalled, quick, hedge=True, hedge_delay=0.05)
+
+        start = time.monotonic()
+        result = router.generate_text("fact")
+        elapsed = time.monotonic() - start
+
+        assert result == "groq: fact"
+        assert elapsed < 0.5
+        assert router.stats()["hedged"] == 1
+
+    def test_hedge_delay_follows_p95(self, router_factory):
+        provider = FakeProvider("claude", delay=0.02)
+        router = router_factory(provider, FakeProvider("groq"), hedge=True, hedge_delay=5.0, hedge_factor=2.0)
+        assert router._hedge_delay_for("claude") == 5.0
+        router._record("claude", 0.1, ok=True)
+        assert router._hedge_delay_for("claude") == pytest.approx(0.2)
+
+    def test_accepts_named_providers(self, router_factory):
+        router = LLMRouter({"primary": FakeProvider("x")})
+        assert router.generate_text("hi") == "x: hi"
+        router.close()
+        with pytest.raises(ValueError):
+            LLMRouter([])
+
+    @patch('google.generativeai.GenerativeModel')
+    @patch('google.generativeai.configure')
+    @patch('groq.Groq')
+    def test_system_option_reaches_groq_and_gemini(self, mock_groq_class, mock_configure, mock_model_class,
+                                                   router_factory, mock_env_vars):
+        from api_clients.gemini_client import GeminiClient
+        from api_clients.groq_client import GroqClient
+
+        groq_sdk = mock_groq_class.return_value
+        groq_sdk.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content="groq fact"))])
+        mock_model_class.return_value.generate_content.return_value = Mock(text="gemini fact")
+        router = router_factory(GroqClient(), GeminiClient())
+
+        assert router.generate_text("Topic?", system="style guide") == "groq fact"
+        assert groq_sdk.chat.completions.create.call_args.kwargs["messages"][0] == {
+            "role": "system", "content": "style guide"}
+
+        groq_sdk.chat.completions.create.side_effect = Exception("unavailable")
+        assert router.generate_text("Topic?", system="style guide", use_cache=False) == "gemini fact"
+        assert mock_model_class.call_args.kwargs["system_instruction"] == "style guide"
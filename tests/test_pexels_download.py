@@ -0,0 +1,162 @@
+"""Tests for streamed, cached and concurrent Pexels image downloads."""
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.pexels_client import DOWNLOAD_CHUNK_BYTES, PexelsClient
+
+
+def image_response(*chunks, fail_after=None):
+    """Response streaming chunks (raising after fail_after chunks, if set)."""
+    def iter_content(chunk_size):
+        for index, chunk in enumerate(chunks):
+            if fail_after is not None and index == fail_after:
+                raise IOError("connection reset")
+            yield chunk
+    response = Mock(status_code=200)
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+@pytest.fixture
+def session():
+    return Mock()
+
+
+@pytest.mark.unit
+class TestDownloadImage:
+    """Test suite for PexelsClient.download_image."""
+
+    def test_streams_chunks_and_leaves_no_temp_files(self, session, temp_dir, mock_env_vars):
+        session.get.return_value = image_response(b"a" * 10, b"b" * 10)
+        path = os.path.join(temp_dir, "photo.jpg")
+        PexelsClient(session=session).download_image("https://images.pexels.com/1.jpeg", path)
+
+        with open(path, 'rb') as f:
+            assert f.read() == b"a" * 10 + b"b" * 10
+        assert os.listdir(temp_dir) == ["photo.jpg"]
+        session.get.return_value.iter_content.assert_called_once_with(DOWNLOAD_CHUNK_BYTES)
+        session.get.return_value.close.assert_called_once()
+
+    def test_downloaded_file_mode_follows_umask(self, session, temp_dir, mock_env_vars):
+        session.get.return_value = image_response(b"jpeg")
+        path = os.path.join(temp_dir, "photo.jpg")
+        umask = os.umask(0o022)
+        try:
+            PexelsClient(session=session).download_image("https://images.pexels.com/1.jpeg", path)
+        finally:
+            os.umask(umask)
+        assert os.stat(path).st_mode & 0o777 == 0o644
+
+    def test_failed_stream_keeps_previous_file(self, session, temp_dir, mock_env_vars):
+        path = os.path.join(temp_dir, "photo.jpg")
+        with open(path, 'wb') as f:
+            f.write(b"old")
+        session.get.return_value = image_response(b"new", b"more", fail_after=1)
+
+        with pytest.raises(Exception, match="Image download error"):
+            PexelsClient(session=session).download_image("https://images.pexels.com/1.jpeg", path)
+        with open(path, 'rb') as f:
+            assert f.read() == b"old"
+        assert os.listdir(temp_dir) == ["photo.jpg"]
+
+    def test_http_error_writes_nothing(self, session, temp_dir, mock_env_vars):
+        session.get.return_value = image_response(b"not found")
+        session.get.return_value.raise_for_status.side_effect = Exception("404 Not Found")
+        path = os.path.join(temp_dir, "photo.jpg")
+
+        with pytest.raises(Exception, match="404"):
+            PexelsClient(session=session).download_image("https://images.pexels.com/1.jpeg", path)
+        assert not os.path.exists(path)
+
+
+@pytest.mark.unit
+class TestImageCache:
+    """Test suite for the URL-keyed download cache."""
+
+    def test_repeated_url_is_served_from_cache(self, session, temp_dir, mock_env_vars):
+        session.get.side_effect = lambda *args, **kwargs: image_response(b"pixels")
+        client = PexelsClient(session=session, cache_dir=os.path.join(temp_dir, "cache"))
+        first, second = os.path.join(temp_dir, "1.jpg"), os.path.join(temp_dir, "2.jpg")
+
+        client.download_image("https://images.pexels.com/1.jpeg", first)
+        client.download_image("https://images.pexels.com/1.jpeg", second)
+
+        assert session.get.call_count == 1
+        with open(second, 'rb') as f:
+            assert f.read() == b"pixels"
+        assert client.cache_stats()["hits"] == 1
+
+    def test_use_cache_false_downloads_again(self, session, temp_dir, mock_env_vars):
+        session.get.side_effect = lambda *args, **kwargs: image_response(b"pixels")
+        client = PexelsClient(session=session, cache_dir=os.path.join(temp_dir, "cache"))
+        path = os.path.join(temp_dir, "1.jpg")
+        client.download_image("https://images.pexels.com/1.jpeg", path)
+        client.download_image("https://images.pexels.com/1.jpeg", path, use_cache=False)
+        assert session.get.call_count == 2
+
+    def test_cache_evicts_least_recently_used(self, session, temp_dir, mock_env_vars):
+        session.get.side_effect = lambda *args, **kwargs: image_response(b"x" * 100)
+        cache_dir = os.path.join(temp_dir, "cache")
+        client = PexelsClient(session=session, cache_dir=cache_dir, cache_max_bytes=250)
+        for index in range(3):
+            client.download_image(f"https://images.pexels.com/{index}.jpeg", os.path.join(temp_dir, f"{index}.jpg"))
+        assert client.cache_stats()["bytes"] <= 250
+        assert len(os.listdir(cache_dir)) == 2
+
+    def test_cache_dir_from_environment(self, monkeypatch, temp_dir, mock_env_vars):
+        monkeypatch.setenv('PEXELS_CACHE_DIR', os.path.join(temp_dir, "cache"))
+        assert PexelsClient().image_cache is not None
+        monkeypatch.delenv('PEXELS_CACHE_DIR')
+        assert PexelsClient().image_cache is None
+        assert PexelsClient().cache_stats() == {}
+
+
+@pytest.mark.unit
+class TestDownloadMany:
+    """Test suite for PexelsClient.download_many."""
+
+    def test_results_in_order_with_per_item_errors(self, session, temp_dir, mock_env_vars):
+        def get(url, **kwargs):
+            if "broken" in url:
+                raise IOError("connection refused")
+            return image_response(url.encode())
+        session.get.side_effect = get
+        items = [(f"https://images.pexels.com/{name}.jpeg", os.path.join(temp_dir, f"{name}.jpg"))
+                 for name in ["a", "broken", "c"]]
+
+        results = PexelsClient(session=session).download_many(items)
+
+        assert [result.url for result in results] == [url for url, _ in items]
+        assert results[0].error is None and results[2].error is None
+        assert "connection refused" in results[1].error
+        with open(items[2][1], 'rb') as f:
+            assert f.read() == items[2][0].encode()
+
+    def test_downloads_run_concurrently(self, session, temp_dir, mock_env_vars):
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def get(url, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return image_response(b"pixels")
+        session.get.side_effect = get
+        items = [(f"https://images.pexels.com/{index}.jpeg", os.path.join(temp_dir, f"{index}.jpg"))
+                 for index in range(6)]
+
+        results = PexelsClient(session=session).download_many(items, concurrency=3)
+        assert all(result.error is None for result in results)
+        assert peak[0] == 3
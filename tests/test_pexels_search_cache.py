@@ -0,0 +1,198 @@
+"""Tests for the PexelsClient search cache, request coalescing and page prefetch."""
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.pexels_client import PexelsClient
+from api_clients.search_cache import SearchCache
+
+
+def search_response(page, count=2):
+    photos = [{"id": page * 100 + index} for index in range(count)]
+    return Mock(status_code=200, json=Mock(return_value={"photos": photos}))
+
+
+@pytest.fixture
+def session():
+    session = Mock()
+    session.get.side_effect = lambda url, **kwargs: search_response(kwargs["params"]["page"])
+    return session
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.mark.unit
+class TestSearchCache:
+    """Test suite for cached search_images."""
+
+    def test_repeated_search_is_cached(self, session, mock_env_vars):
+        client = PexelsClient(session=session)
+        assert client.search_images("ocean", per_page=2) == [{"id": 100}, {"id": 101}]
+        assert client.search_images("ocean", per_page=2) == [{"id": 100}, {"id": 101}]
+        assert session.get.call_count == 1
+        assert client.search_stats()["hits"] == 1
+
+    def test_key_includes_query_per_page_and_page(self, session, mock_env_vars):
+        client = PexelsClient(session=session)
+        client.search_images("ocean", per_page=2)
+        client.search_images("ocean", per_page=2, page=2)
+        client.search_images("ocean", per_page=3)
+        client.search_images("forest", per_page=2)
+        assert session.get.call_count == 4
+        assert session.get.call_args_list[1].kwargs["params"] == {"query": "ocean", "per_page": 2, "page": 2}
+
+    def test_expired_results_are_refetched(self, session, mock_env_vars):
+        client = PexelsClient(session=session, search_ttl=0)
+        client.search_images("ocean")
+        time.sleep(0.01)
+        client.search_images("ocean")
+        assert session.get.call_count == 2
+
+    def test_use_cache_false_refetches(self, session, mock_env_vars):
+        client = PexelsClient(session=session)
+        client.search_images("ocean")
+        client.search_images("ocean", use_cache=False)
+        assert session.get.call_count == 2
+
+    def test_cache_file_is_shared_between_clients(self, session, temp_dir, mock_env_vars):
+        path = os.path.join(temp_dir, "pexels_search.sqlite3")
+        PexelsClient(session=session, search_cache_path=path).search_images("ocean")
+        PexelsClient(session=session, search_cache_path=path).search_images("ocean")
+        assert session.get.call_count == 1
+
+    def test_errors_are_not_cached(self, session, mock_env_vars):
+        session.get.side_effect = [Exception("503 Service Unavailable"), search_response(1)]
+        client = PexelsClient(session=session)
+        with pytest.raises(Exception, match="Pexels API error: 503"):
+            client.search_images("ocean")
+        assert client.search_images("ocean") == [{"id": 100}, {"id": 101}]
+
+
+@pytest.mark.unit
+class TestSearchCacheStore:
+    """Test suite for the SearchCache TTL store."""
+
+    def test_round_trip_and_stats(self):
+        cache = SearchCache()
+        assert cache.get("k") is None
+        cache.put("k", [{"id": 1}])
+        assert cache.get("k") == [{"id": 1}]
+        assert cache.get("k", count=False) == [{"id": 1}]
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+        cache.close()
+
+    def test_expired_entries_are_purged_on_put(self):
+        cache = SearchCache(ttl_seconds=0)
+        cache.put("old", [])
+        time.sleep(0.01)
+        cache.put("new", [])
+        assert cache.get("old") is None
+        assert cache.stats()["entries"] == 1
+        cache.close()
+
+@pytest.mark.unit
+class TestSearchCoalescing:
+    """Test suite for single-flight search requests."""
+
+    def run_concurrently(self, client, callers=5):
+        results, errors = [], []
+
+        def search():
+            try:
+                results.append(client.search_images("ocean"))
+            except Exception as e:
+                errors.append(str(e))
+        threads = [threading.Thread(target=search) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def test_concurrent_identical_searches_share_one_request(self, session, mock_env_vars):
+        release = threading.Event()
+        session.get.side_effect = lambda url, **kwargs: release.wait() and search_response(1)
+        client = PexelsClient(session=session)
+
+        threads, results, errors = self.run_concurrently(client)
+        assert wait_for(lambda: client.coalesced == 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert session.get.call_count == 1
+        assert errors == [] and results == [[{"id": 100}, {"id": 101}]] * 5
+
+    def test_waiters_share_the_error(self, session, mock_env_vars):
+        release = threading.Event()
+
+        def fail(url, **kwargs):
+            release.wait()
+            raise IOError("connection reset")
+        session.get.side_effect = fail
+        client = PexelsClient(session=session)
+
+        threads, results, errors = self.run_concurrently(client, callers=3)
+        assert wait_for(lambda: client.coalesced == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert session.get.call_count == 1
+        assert len(errors) == 3 and all("connection reset" in error for error in errors)
+
+    def test_result_stored_after_the_lookup_is_not_fetched_again(self, session, mock_env_vars):
+        """A caller that missed the cache just before the previous leader stored its result."""
+        client = PexelsClient(session=session)
+        client.search_images("ocean", per_page=2)
+        lookup = client.search_cache.get
+        lookups = []
+
+        def stale_then_current(*args, **kwargs):
+            lookups.append(kwargs.get("count", True))
+            return None if len(lookups) == 1 else lookup(*args, **kwargs)
+        client.search_cache.get = stale_then_current
+
+        assert client.search_images("ocean", per_page=2) == [{"id": 100}, {"id": 101}]
+        assert session.get.call_count == 1
+        assert lookups == [True, False]
+
+@pytest.mark.unit
+class TestPrefetch:
+    """Test suite for next-page prefetching."""
+
+    def test_full_page_prefetches_the_next(self, session, mock_env_vars):
+        client = PexelsClient(session=session)
+        client.search_images("ocean", per_page=2, prefetch_next=True)
+        assert wait_for(lambda: session.get.call_count == 2)
+        client._prefetcher.shutdown(wait=True)
+
+        assert client.search_images("ocean", per_page=2, page=2) == [{"id": 200}, {"id": 201}]
+        assert session.get.call_count == 2
+
+    def test_partial_page_does_not_prefetch(self, session, mock_env_vars):
+        client = PexelsClient(session=session)
+        client.search_images("ocean", per_page=5, prefetch_next=True)
+        assert client._prefetcher is None
+
+    def test_prefetch_returns_future(self, session, mock_env_vars):
+        client = PexelsClient(session=session)
+        assert client.prefetch("ocean", per_page=2, page=3).result() == [{"id": 300}, {"id": 301}]
+
+    def test_close_stops_the_prefetcher(self, session, mock_env_vars):
+        client = PexelsClient(session=session)
+        client.prefetch("ocean", per_page=2).result()
+        client.close()
+        with pytest.raises(RuntimeError):
+            client.prefetch("ocean", per_page=2, page=2)
@@ -0,0 +1,126 @@
+"""Tests for Pexels variant selection and bytes-saved reporting (pexels_variants.py)."""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.pexels_client import PexelsClient
+from api_clients.pexels_variants import PhotoDownload, savings_report, select_variant, variant_size
+
+BASE = "https://images.pexels.com/photos/2014422/pexels-photo-2014422.jpeg"
+
+
+def pexels_photo(photo_id=2014422, width=6000, height=4000):
+    """Photo dict shaped like a Pexels search result."""
+    return {
+        "id": photo_id,
+        "width": width,
+        "height": height,
+        "src": {
+            "original": BASE,
+            "large2x": f"{BASE}?auto=compress&cs=tinysrgb&dpr=2&h=650&w=940",
+            "large": f"{BASE}?auto=compress&cs=tinysrgb&h=650&w=940",
+            "medium": f"{BASE}?auto=compress&cs=tinysrgb&h=350",
+            "small": f"{BASE}?auto=compress&cs=tinysrgb&h=130",
+            "portrait": f"{BASE}?auto=compress&cs=tinysrgb&fit=crop&h=1200&w=800",
+            "landscape": f"{BASE}?auto=compress&cs=tinysrgb&fit=crop&h=627&w=1200",
+            "tiny": f"{BASE}?auto=compress&cs=tinysrgb&dpr=1&fit=crop&h=200&w=280",
+        },
+    }
+
+
+@pytest.mark.unit
+class TestVariantSize:
+    """Test suite for variant_size."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("original", (6000, 4000)),
+        ("large2x", (1880, 1253)),
+        ("large", (940, 627)),
+        ("medium", (525, 350)),
+        ("portrait", (800, 1200)),
+        ("landscape", (1200, 627)),
+        ("tiny", (280, 200)),
+    ])
+    def test_sizes_from_url_parameters(self, name, expected):
+        assert variant_size(pexels_photo()["src"][name], (6000, 4000)) == expected
+
+    def test_variants_never_upscale(self):
+        src = pexels_photo()["src"]
+        assert variant_size(src["large2x"], (1000, 600)) == (1000, 600)
+        assert variant_size(src["portrait"], (400, 300)) == (200, 300)
+
+
+@pytest.mark.unit
+class TestSelectVariant:
+    """Test suite for select_variant."""
+
+    def test_smallest_covering_variant_for_square_slide(self):
+        assert select_variant(pexels_photo(), (1080, 1080))[0] == "large2x"
+
+    def test_preview_canvas_uses_smaller_variant(self):
+        assert select_variant(pexels_photo(), (540, 540))[:2] == ("large", pexels_photo()["src"]["large"])
+
+    def test_falls_back_to_original_when_nothing_smaller_covers(self):
+        name, url, size = select_variant(pexels_photo(width=4000, height=6000), (1080, 1350))
+        assert (name, url, size) == ("original", BASE, (4000, 6000))
+
+    def test_missing_dimensions_use_original(self, mock_pexels_response):
+        assert select_variant(mock_pexels_response["photos"][0])[:2] == (
+            "original", "https://images.pexels.com/photos/12345/pexels-photo-12345.jpeg")
+
+
+@pytest.mark.unit
+class TestSavingsReport:
+    """Test suite for savings_report and PexelsClient.download_photos."""
+
+    def test_report_totals(self):
+        downloads = [
+            PhotoDownload(1, "large2x", "u1", "f1", 400_000, 2_000_000, None),
+            PhotoDownload(2, "original", "u2", "f2", 1_000_000, 1_000_000, None),
+            PhotoDownload(3, "large2x", "u3", "f3", 300_000, None, None),
+            PhotoDownload(4, None, None, "f4", 0, None, "timeout"),
+        ]
+        report = savings_report(downloads)
+        assert report["photos"] == 3 and report["failed"] == 1
+        assert report["variants"] == {"large2x": 2, "original": 1}
+        assert report["bytes"] == 1_700_000
+        assert report["measured"] == 2
+        assert report["bytes_saved"] == 1_600_000
+        assert report["saved_percent"] == pytest.approx(53.3)
+
+    def test_empty_report(self):
+        assert savings_report([])["saved_percent"] == 0.0
+
+    def test_download_photos_fetches_variants_and_measures_originals(self, temp_dir, mock_env_vars):
+        session = Mock()
+        session.get.side_effect = lambda url, **kwargs: Mock(status_code=200,
+                                                             iter_content=Mock(return_value=iter([b"x" * 500])))
+        session.head.return_value = Mock(status_code=200, headers={"Content-Length": "4000"})
+        photos = [pexels_photo(photo_id=1), pexels_photo(photo_id=2, width=4000, height=6000)]
+
+        downloads = PexelsClient(session=session).download_photos(photos, temp_dir, (1080, 1080),
+                                                                  measure_savings=True)
+
+        assert [download.variant for download in downloads] == ["large2x", "original"]
+        assert os.path.getsize(downloads[0].filepath) == 500
+        assert downloads[0].original_bytes == 4000
+        assert downloads[1].original_bytes == downloads[1].bytes == 500
+        session.head.assert_called_once_with(BASE, allow_redirects=True)
+        assert savings_report(downloads)["bytes_saved"] == 3500
+
+    def test_download_photos_reports_failures(self, temp_dir, mock_env_vars):
+        session = Mock()
+        session.get.side_effect = IOError("connection reset")
+        downloads = PexelsClient(session=session).download_photos([pexels_photo()], temp_dir)
+        assert "connection reset" in downloads[0].error
+
+    def test_original_bytes_unknown_on_error(self, mock_env_vars):
+        session = Mock()
+        session.head.return_value = Mock(status_code=200, headers={})
+        assert PexelsClient(session=session).original_bytes(pexels_photo()) is None
@@ -0,0 +1,63 @@
+"""Tests for low-resolution previews and contact sheets (preview.py)."""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.carousel_renderer import CarouselRenderer
+from rendering.preview import contact_sheet, sheet_columns
+
+
+@pytest.mark.unit
+class TestPreview:
+    """Test suite for preview rendering and contact sheets."""
+
+    def test_contact_sheet_grid(self):
+        """Slides are tiled in a near-square grid with gaps around them."""
+        images = [Image.new('RGB', (30, 20), (i * 40, 0, 0)) for i in range(5)]
+        sheet = contact_sheet(images, gap=2)
+
+        assert sheet_columns(5) == 3
+        assert sheet.size == (2 + 3 * 32, 2 + 2 * 22)
+        assert sheet.getpixel((2, 2)) == (0, 0, 0)
+        assert sheet.getpixel((2 + 32, 2 + 22)) == (160, 0, 0)  # slide 5: row 2, column 2
+        assert sheet.getpixel((0, 0)) == (32, 32, 32)
+
+    def test_contact_sheet_requires_images(self):
+        with pytest.raises(ValueError):
+            contact_sheet([])
+
+    def test_scaled_renderer_scales_canvas_and_fonts(self):
+        """scale shrinks the canvas, fonts and padding together."""
+        renderer = CarouselRenderer(width=1080, height=1350, scale=0.25)
+        assert (renderer.width, renderer.height) == (270, 338)
+        assert renderer.font_size == 10
+        assert renderer.padding == 25
+        assert renderer.fonts.max_width == 245
+
+    def test_render_preview_writes_contact_sheet(self, temp_dir, carousel_slides_data):
+        """render_preview saves one small JPEG holding every slide."""
+        renderer = CarouselRenderer(handle="@factsmind", slide_counter=True)
+        output_path = os.path.join(temp_dir, 'previews', 'sheet.jpg')
+
+        sheet = renderer.render_preview(carousel_slides_data, output_path, scale=0.25, columns=len(carousel_slides_data))
+
+        assert sheet.size == (8 + len(carousel_slides_data) * (270 + 8), 8 + 270 + 8)
+        with Image.open(output_path) as saved:
+            assert saved.format == 'JPEG'
+            assert saved.size == sheet.size
+        assert not os.path.exists(os.path.join(temp_dir, 'slide_1.png'))
+
+    def test_preview_renderer_is_reused(self):
+        """Each preview scale builds its renderer (and loads fonts) once."""
+        renderer = CarouselRenderer()
+        preview = renderer.preview_renderer(0.25)
+        assert renderer.preview_renderer(0.25) is preview
+        assert preview.encoder.output_format == 'jpeg'
+        assert preview.cache is None
+        assert renderer.preview_renderer(0.5) is not preview
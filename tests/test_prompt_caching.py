@@ -0,0 +1,154 @@
+"""Tests for Anthropic prompt caching of system and prefix blocks in ClaudeClient."""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.response_cache import ResponseCache
+
+STYLE_GUIDE = "You write FactsMind carousels. Short, surprising, sourced facts."
+BRIEF = "Top posts this month: space facts (8.1% engagement), animal facts (6.4%)."
+
+
+def claude_response(text, **usage):
+    return Mock(content=[Mock(text=text)], usage=Mock(**usage))
+
+
+@pytest.fixture
+def claude(mock_env_vars):
+    with patch('anthropic.Anthropic') as mock_anthropic_class:
+        mock_client = Mock()
+        mock_anthropic_class.return_value = mock_client
+        yield mock_client
+
+
+@pytest.mark.unit
+class TestPromptCaching:
+    """Test suite for ClaudeClient system/prefix cache blocks and usage reporting."""
+
+    def test_plain_prompt_request_is_unchanged(self, claude):
+        from api_clients.claude_client import ClaudeClient
+
+        claude.messages.create.return_value = claude_response("fact")
+        ClaudeClient().generate_text("Tell me a fact")
+        request = claude.messages.create.call_args.kwargs
+        assert request["messages"] == [{"role": "user", "content": "Tell me a fact"}]
+        assert "system" not in request
+
+    def test_system_and_prefix_are_marked_for_caching(self, claude):
+        from api_clients.claude_client import ClaudeClient
+
+        claude.messages.create.return_value = claude_response("fact")
+        ClaudeClient(system=STYLE_GUIDE).generate_text("Topic: octopuses", prefix=BRIEF)
+        request = claude.messages.create.call_args.kwargs
+        assert request["system"] == [{"type": "text", "text": STYLE_GUIDE, "cache_control": {"type": "ephemeral"}}]
+        assert request["messages"][0]["content"] == [
+            {"type": "text", "text": BRIEF, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "Topic: octopuses"},
+        ]
+
+    def test_system_list_has_one_breakpoint_on_last_block(self, claude):
+        from api_clients.claude_client import ClaudeClient
+
+        claude.messages.create.return_value = claude_response("fact")
+        ClaudeClient().generate_text("ask", system=["guide", "examples"])
+        blocks = claude.messages.create.call_args.kwargs["system"]
+        assert [block.get("cache_control") for block in blocks] == [None, {"type": "ephemeral"}]
+
+    def test_usage_report_splits_cached_and_uncached_tokens(self, claude):
+        from api_clients.claude_client import ClaudeClient
+
+        claude.messages.create.side_effect = [
+            claude_response("a", input_tokens=20, cache_creation_input_tokens=3000,
+                            cache_read_input_tokens=0, output_tokens=100),
+            claude_response("b", input_tokens=25, cache_creation_input_tokens=0,
+                            cache_read_input_tokens=3000, output_tokens=90),
+        ]
+        client = ClaudeClient(system=STYLE_GUIDE)
+        client.generate_text("first", prefix=BRIEF)
+        client.generate_text("second", prefix=BRIEF)
+
+        report = client.usage_report()
+        assert report["requests"] == 2
+        assert report["input_tokens"] == 45
+        assert report["cache_creation_input_tokens"] == 3000
+        assert report["cache_read_input_tokens"] == 3000
+        assert report["output_tokens"] == 190
+        assert report["cache_hit_rate"] == pytest.approx(3000 / 6045, abs=0.001)
+
+    def test_stream_records_final_usage(self, claude):
+        from api_clients.claude_client import ClaudeClient
+
+        stream = MagicMock()
+        stream.__enter__.return_value.text_stream = iter(["Hi."])
+        stream.__enter__.return_value.get_final_message.return_value = Mock(
+            usage=Mock(input_tokens=5, cache_creation_input_tokens=0, cache_read_input_tokens=2000, output_tokens=2))
+        claude.messages.stream.return_value = stream
+
+        client = ClaudeClient(system=STYLE_GUIDE)
+        assert list(client.generate_stream("Say hi", prefix=BRIEF)) == ["Hi."]
+        assert client.usage_report()["cache_read_input_tokens"] == 2000
+        assert "system" in claude.messages.stream.call_args.kwargs
+
+    def test_response_cache_key_includes_prefix(self, claude, temp_dir):
+        from api_clients.claude_client import ClaudeClient
+
+        cache = ResponseCache(os.path.join(temp_dir, 'llm_cache.sqlite3'))
+        claude.messages.create.side_effect = [claude_response("space"), claude_response("animals")]
+        client = ClaudeClient(cache=cache)
+        assert client.generate_text("Topic?", prefix="space brief") == "space"
+        assert client.generate_text("Topic?", prefix="animal brief") == "animals"
+        assert client.generate_text("Topic?", prefix="space brief") == "space"
+        assert claude.messages.create.call_count == 2
+        cache.close()
+
+    def test_response_cache_key_includes_default_system(self, claude, temp_dir):
+        from api_clients.claude_client import ClaudeClient
+
+        cache = ResponseCache(os.path.join(temp_dir, 'llm_cache.sqlite3'))
+        claude.messages.create.side_effect = [claude_response("plain"), claude_response("styled")]
+        assert ClaudeClient(cache=cache).generate_text("Topic?") == "plain"
+        assert ClaudeClient(cache=cache, system=STYLE_GUIDE).generate_text("Topic?") == "styled"
+        cache.close()
+
+
+@pytest.mark.unit
+class TestSystemAndPrefixOnOtherProviders:
+    """Test suite for the system/prefix options on Groq and Gemini, and their rate-limit cost."""
+
+    @patch('groq.Groq')
+    def test_groq_sends_system_message_and_prefix(self, mock_groq_class, mock_env_vars):
+        from api_clients.groq_client import GroqClient
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content="fact"))])
+        mock_groq_class.return_value = mock_client
+
+        GroqClient().generate_text("Topic: octopuses", system=["guide", "examples"], prefix=BRIEF)
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages == [{"role": "system", "content": "guide\n\nexamples"},
+                            {"role": "user", "content": f"{BRIEF}\n\nTopic: octopuses"}]
+
+    @patch('google.generativeai.GenerativeModel')
+    @patch('google.generativeai.configure')
+    def test_gemini_uses_system_instruction_and_prefix(self, mock_configure, mock_model_class, mock_env_vars):
+        from api_clients.gemini_client import GeminiClient
+
+        mock_model_class.return_value.generate_content.return_value = Mock(text="fact")
+        assert GeminiClient().generate_text("Topic: octopuses", system=STYLE_GUIDE, prefix=BRIEF) == "fact"
+        assert mock_model_class.call_args.kwargs["system_instruction"] == STYLE_GUIDE
+        assert mock_model_class.return_value.generate_content.call_args.args[0] == [BRIEF, "Topic: octopuses"]
+
+    def test_rate_limiter_counts_system_and_prefix(self, claude):
+        from api_clients.claude_client import ClaudeClient
+
+        limiter = Mock()
+        claude.messages.create.return_value = claude_response("fact")
+        ClaudeClient(rate_limiter=limiter, system=STYLE_GUIDE).generate_text("Topic?", prefix=BRIEF)
+        counted = limiter.acquire.call_args.args[0]
+        assert STYLE_GUIDE in counted and BRIEF in counted and "Topic?" in counted
@@ -0,0 +1,125 @@
+"""Tests for the content-addressed render cache (render_cache.py)."""
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.carousel_renderer import CarouselRenderer
+from rendering.render_cache import RenderCache
+
+
+def write_file(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return path
+
+
+@pytest.mark.unit
+class TestRenderCache:
+    """Test suite for RenderCache."""
+
+    def test_make_key_is_stable_and_content_sensitive(self):
+        """Test that keys depend only on the key parts."""
+        key = RenderCache.make_key(text="A", size=(1080, 1080))
+
+        assert key == RenderCache.make_key(size=(1080, 1080), text="A")
+        assert key != RenderCache.make_key(text="B", size=(1080, 1080))
+
+    def test_fetch_miss_then_hit(self, temp_dir):
+        """Test storing a file and fetching it into another location."""
+        cache = RenderCache(os.path.join(temp_dir, 'cache'))
+        source = write_file(os.path.join(temp_dir, 'slide.png'), 100)
+        dest = os.path.join(temp_dir, 'out.png')
+
+        assert cache.fetch('abc', dest) is False
+        cache.store('abc', source)
+        assert cache.fetch('abc', dest) is True
+
+        assert os.path.getsize(dest) == 100
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_storing_the_same_key_again_keeps_byte_count(self, temp_dir):
+        """Re-storing an entry, linked or replaced, does not inflate the tracked size."""
+        cache = RenderCache(os.path.join(temp_dir, 'cache'), max_bytes=250)
+        source = write_file(os.path.join(temp_dir, 'slide.png'), 100)
+        cache.store('abc', source)
+        cache.store('abc', source)  # already hard-linked to the cached entry
+        assert cache.stats()["bytes"] == 100
+
+        cache.store('abc', write_file(os.path.join(temp_dir, 'redrawn.png'), 120))
+        assert cache.stats()["bytes"] == 120
+        assert cache.fetch('abc', os.path.join(temp_dir, 'out.png')) is True
+
+    def test_eviction_removes_least_recently_used(self, temp_dir):
+        """Test that the size cap evicts the entries used longest ago."""
+        cache = RenderCache(os.path.join(temp_dir, 'cache'), max_bytes=250)
+        for name in ('old', 'mid'):
+            cache.store(name, write_file(os.path.join(temp_dir, f'{name}.png'), 100))
+        past = time.time() - 100
+        os.utime(os.path.join(temp_dir, 'cache', 'old.png'), (past, past))
+        os.utime(os.path.join(temp_dir, 'cache', 'mid.png'), (past + 50, past + 50))
+
+        cache.store('new', write_file(os.path.join(temp_dir, 'new.png'), 100))
+
+        assert sorted(os.listdir(os.path.join(temp_dir, 'cache'))) == ['mid.png', 'new.png']
+        assert cache.stats()['bytes'] == 200
+
+    def test_renderer_reuses_unchanged_slides(self, temp_dir, carousel_slides_data):
+        """Test that regenerating a carousel only re-renders changed slides."""
+        renderer = CarouselRenderer(cache_dir=os.path.join(temp_dir, 'cache'))
+        output_dir = os.path.join(temp_dir, 'out')
+
+        first = renderer.render_carousel(carousel_slides_data, output_dir=output_dir)
+        first_pixels = Image.open(first[0]).tobytes()
+        edited = [dict(slide) for slide in carousel_slides_data]
+        edited[2]['text'] = 'Third slide: rewritten'
+        second = renderer.render_carousel(edited, output_dir=output_dir)
+
+        assert second == first
+        assert renderer.cache.stats()['hits'] == 4
+        assert renderer.cache.stats()['misses'] == 6
+        assert Image.open(second[0]).tobytes() == first_pixels
+
+    def test_rerender_does_not_corrupt_cached_entry(self, temp_dir):
+        """Test that writing a new slide over a cache hard link leaves the cache intact."""
+        renderer = CarouselRenderer(width=540, height=540, cache_dir=os.path.join(temp_dir, 'cache'))
+        output_dir = os.path.join(temp_dir, 'out')
+
+        renderer.render_carousel([{'text': 'Original'}], output_dir=output_dir)
+        renderer.render_carousel([{'text': 'Original'}], output_dir=output_dir)
+        renderer.render_carousel([{'text': 'Changed'}], output_dir=output_dir)
+        fresh = CarouselRenderer(width=540, height=540).create_slide('Original')
+        renderer.render_carousel([{'text': 'Original'}], output_dir=output_dir)
+
+        assert Image.open(os.path.join(output_dir, 'slide_1.png')).tobytes() == fresh.tobytes()
+
+    def test_cache_key_includes_colors(self):
+        """Test that per-slide colors are part of the cache key."""
+        renderer = CarouselRenderer()
+
+        plain = renderer.cache_key(0, {'text': 'Same'})
+        colored = renderer.cache_key(0, {'text': 'Same', 'background_color': [255, 0, 0]})
+
+        assert plain != colored
+        assert renderer.slide_image(0, {'text': 'Same', 'background_color': [255, 0, 0]}).getpixel((0, 0)) == (255, 0, 0)
+
+    def test_parallel_render_counts_cache_hits(self, temp_dir, carousel_slides_data):
+        """Test that the parent looks up the cache before handing slides to workers."""
+        renderer = CarouselRenderer(width=540, height=540, cache_dir=os.path.join(temp_dir, 'cache'))
+        output_dir = os.path.join(temp_dir, 'out')
+
+        try:
+            renderer.render_carousel(carousel_slides_data, output_dir=output_dir, workers=2)
+            renderer.render_carousel(carousel_slides_data, output_dir=output_dir, workers=2)
+        finally:
+            renderer.close()
+
+        assert renderer.cache.stats()['hits'] == 5
+        assert renderer.cache.stats()['misses'] == 5
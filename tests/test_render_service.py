@@ -0,0 +1,103 @@
+"""Tests for the long-running render service (render_service.py)."""
+import base64
+import io
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.carousel_renderer import CarouselRenderer
+from rendering.render_service import RenderHTTPServer, RenderService, percentile
+
+
+@pytest.fixture
+def service():
+    """Render service with a small canvas to keep tests fast."""
+    service = RenderService(CarouselRenderer(width=540, height=540))
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def server_url(service):
+    """Serve the render service on an ephemeral loopback port."""
+    server = RenderHTTPServer(("127.0.0.1", 0), service, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def post_json(url, payload):
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+@pytest.mark.unit
+class TestRenderService:
+    """Test suite for RenderService and its HTTP front end."""
+
+    def test_render_returns_output_paths(self, service, temp_dir):
+        """Test rendering a carousel to files through the service queue."""
+        result = service.render({"slides": [{"text": "One"}, {"text": "Two"}], "output_dir": temp_dir})
+
+        assert result["output_paths"] == [os.path.join(temp_dir, "slide_1.png"), os.path.join(temp_dir, "slide_2.png")]
+        assert result["latency_ms"] >= 0
+        assert service.stats()["completed"] == 1
+
+    def test_render_returns_png_bytes(self, service):
+        """Test rendering slides to base64 PNG bytes without output paths."""
+        result = service.render({"slides": [{"text": "Bytes please"}], "return": "bytes"})
+
+        image = Image.open(io.BytesIO(base64.b64decode(result["slides"][0])))
+        assert image.format == "PNG"
+        assert image.size == (540, 540)
+
+    def test_invalid_request_counts_as_failure(self, service):
+        """Test that a request without a slides list is rejected."""
+        with pytest.raises(ValueError):
+            service.render({"slides": "not a list"})
+
+        assert service.stats()["failed"] == 1
+
+    def test_http_render_and_stats(self, server_url, temp_dir):
+        """Test the /render, /stats and /health endpoints."""
+        result = post_json(f"{server_url}/render", {"slides": [{"text": "HTTP"}], "output_dir": temp_dir})
+        assert os.path.exists(result["output_paths"][0])
+
+        with urllib.request.urlopen(f"{server_url}/stats") as response:
+            stats = json.loads(response.read())
+        assert stats["queue_depth"] == 0
+        assert stats["completed"] == 1
+        assert stats["latency_ms"]["p95"] >= stats["latency_ms"]["p50"] > 0
+
+        with urllib.request.urlopen(f"{server_url}/health") as response:
+            assert json.loads(response.read()) == {"status": "ok"}
+
+    def test_http_rejects_bad_json(self, server_url):
+        """Test that malformed request bodies get a 400 response."""
+        request = urllib.request.Request(f"{server_url}/render", data=b"{not json")
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(request)
+
+        assert exc_info.value.code == 400
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        assert percentile([], 95) == 0.0
+        assert percentile([5, 1, 3, 2, 4], 50) == 3
+        assert percentile(list(range(1, 101)), 95) == 95
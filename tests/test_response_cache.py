@@ -0,0 +1,123 @@
+"""Tests for the SQLite LLM response cache (response_cache.py) and its use by the clients."""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.response_cache import ResponseCache, default_cache
+
+
+@pytest.fixture
+def cache(temp_dir):
+    cache = ResponseCache(os.path.join(temp_dir, 'llm_cache.sqlite3'))
+    yield cache
+    cache.close()
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_miss_then_hit(self, cache):
+        """Stored responses are returned for the same provider, model, prompt and max_tokens."""
+        assert cache.get("groq", "llama", "prompt", 100) is None
+        cache.put("groq", "llama", "prompt", 100, "answer", latency=1.5)
+
+        assert cache.get("groq", "llama", "prompt", 100) == "answer"
+        assert cache.get("groq", "llama", "prompt", 200) is None
+        assert cache.get("claude", "llama", "prompt", 100) is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 3)
+        assert stats["latency_saved_seconds"] == 1.5
+
+    def test_entries_persist_across_instances(self, temp_dir):
+        path = os.path.join(temp_dir, 'nested', 'cache.sqlite3')
+        first = ResponseCache(path)
+        first.put("gemini", "flash", "p", 10, "persisted")
+        first.close()
+        second = ResponseCache(path)
+        assert second.get("gemini", "flash", "p", 10) == "persisted"
+        second.close()
+
+    def test_expired_entries_are_ignored(self, cache):
+        """Entries older than the TTL miss and are removed."""
+        cache.put("groq", "llama", "prompt", 100, "stale")
+        with patch('api_clients.response_cache.time.time', return_value=cache._db.execute(
+                "SELECT created_at FROM responses").fetchone()[0] + cache.ttl_seconds + 1):
+            assert cache.get("groq", "llama", "prompt", 100) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_size_eviction_drops_least_recently_used(self, temp_dir):
+        """Once stored text exceeds max_bytes, least recently used responses go first."""
+        cache = ResponseCache(os.path.join(temp_dir, 'small.sqlite3'), max_bytes=350)
+        times = iter(range(1000, 2000))
+        with patch('api_clients.response_cache.time.time', side_effect=lambda: next(times)):
+            for i in range(3):
+                cache.put("groq", "llama", f"prompt {i}", 100, "x" * 100)
+            cache.get("groq", "llama", "prompt 0", 100)  # now more recent than prompt 1
+            cache.put("groq", "llama", "prompt 3", 100, "x" * 100)
+
+            assert cache.stats()["bytes"] <= 350
+            assert cache.get("groq", "llama", "prompt 0", 100) is not None
+            assert cache.get("groq", "llama", "prompt 1", 100) is None
+        cache.close()
+
+    def test_default_cache_follows_environment(self, temp_dir, monkeypatch):
+        monkeypatch.delenv('LLM_CACHE_PATH', raising=False)
+        assert default_cache() is None
+        monkeypatch.setenv('LLM_CACHE_PATH', os.path.join(temp_dir, 'shared.sqlite3'))
+        assert default_cache() is default_cache()
+
+
+@pytest.mark.unit
+class TestClientResponseCaching:
+    """Test suite for response caching in the LLM clients."""
+
+    @patch('groq.Groq')
+    def test_repeated_prompt_served_from_cache(self, mock_groq_class, mock_env_vars, cache):
+        from api_clients.groq_client import GroqClient
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content="fact"))])
+        mock_groq_class.return_value = mock_client
+
+        client = GroqClient(cache=cache)
+        assert client.generate_text("Tell me a fact") == "fact"
+        assert client.generate_text("Tell me a fact") == "fact"
+        assert mock_client.chat.completions.create.call_count == 1
+        assert cache.stats()["hits"] == 1
+
+    @patch('anthropic.Anthropic')
+    def test_use_cache_false_bypasses_lookup(self, mock_anthropic_class, mock_env_vars, cache):
+        from api_clients.claude_client import ClaudeClient
+
+        mock_client = Mock()
+        mock_client.messages.create.side_effect = [Mock(content=[Mock(text="first")]),
+                                                   Mock(content=[Mock(text="second")])]
+        mock_anthropic_class.return_value = mock_client
+
+        client = ClaudeClient(cache=cache)
+        assert client.generate_text("Regenerate") == "first"
+        assert client.generate_text("Regenerate", use_cache=False) == "second"
+        assert client.generate_text("Regenerate") == "second"  # fresh answer replaced the entry
+        assert mock_client.messages.create.call_count == 2
+
+    @patch('google.generativeai.GenerativeModel')
+    @patch('google.generativeai.configure')
+    def test_errors_are_not_cached(self, mock_configure, mock_model_class, mock_env_vars, cache):
+        from api_clients.gemini_client import GeminiClient
+
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = [Exception("API Error"), Mock(text="recovered")]
+        mock_model_class.return_value = mock_model
+
+        client = GeminiClient(cache=cache)
+        with pytest.raises(Exception, match="Gemini API error"):
+            client.generate_text("prompt")
+        assert client.generate_text("prompt") == "recovered"
+        assert cache.stats()["entries"] == 1
@@ -0,0 +1,117 @@
+"""Tests for streamed LLM output (generate_stream, iter_sentences) and streamed slide rendering."""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from api_clients.response_cache import ResponseCache
+from api_clients.streaming import iter_sentences
+
+
+@pytest.mark.unit
+class TestIterSentences:
+    """Test suite for the sentence-boundary helper."""
+
+    def test_sentences_split_across_chunks(self):
+        chunks = ["Honey never", " spoils. Octopuses have", " three hearts! Why? Pi is 3.", "14 roughly"]
+        assert list(iter_sentences(chunks)) == [
+            "Honey never spoils.", "Octopuses have three hearts!", "Why?", "Pi is 3.14 roughly"]
+
+    def test_sentence_waits_for_following_whitespace(self):
+        """A sentence is emitted as soon as the space after its punctuation arrives."""
+        sentences = iter_sentences(iter(["First fact.", " Second", " fact."]))
+        assert next(sentences) == "First fact."
+        assert list(sentences) == ["Second fact."]
+
+    def test_paragraph_breaks_and_quotes(self):
+        chunks = ['He said "stop." Then', " left\n\nSlide two\n", "\nSlide three"]
+        assert list(iter_sentences(chunks)) == ['He said "stop."', "Then left", "Slide two", "Slide three"]
+
+
+@pytest.mark.unit
+class TestGenerateStream:
+    """Test suite for generate_stream on each client."""
+
+    @patch('anthropic.Anthropic')
+    def test_claude_stream(self, mock_anthropic_class, mock_env_vars):
+        from api_clients.claude_client import ClaudeClient
+
+        mock_client = Mock()
+        stream = MagicMock()
+        stream.__enter__.return_value.text_stream = iter(["Hello", " world."])
+        mock_client.messages.stream.return_value = stream
+        mock_anthropic_class.return_value = mock_client
+
+        assert list(ClaudeClient().generate_stream("Say hello")) == ["Hello", " world."]
+        assert mock_client.messages.stream.call_args.kwargs["messages"][0]["content"] == "Say hello"
+
+    @patch('groq.Groq')
+    def test_groq_stream_skips_empty_deltas(self, mock_groq_class, mock_env_vars):
+        from api_clients.groq_client import GroqClient
+
+        mock_client = Mock()
+        chunks = [Mock(choices=[Mock(delta=Mock(content=text))]) for text in ["A", None, "B"]]
+        mock_client.chat.completions.create.return_value = iter(chunks + [Mock(choices=[])])
+        mock_groq_class.return_value = mock_client
+
+        assert list(GroqClient().generate_stream("prompt")) == ["A", "B"]
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @patch('google.generativeai.GenerativeModel')
+    @patch('google.generativeai.configure')
+    def test_gemini_stream_errors_are_wrapped(self, mock_configure, mock_model_class, mock_env_vars):
+        from api_clients.gemini_client import GeminiClient
+
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = Exception("quota")
+        mock_model_class.return_value = mock_model
+
+        with pytest.raises(Exception, match="Gemini API error: quota"):
+            list(GeminiClient().generate_stream("prompt"))
+
+    @patch('groq.Groq')
+    def test_completed_stream_is_cached(self, mock_groq_class, mock_env_vars, temp_dir):
+        """A fully consumed stream is stored; the next identical request replays it."""
+        from api_clients.groq_client import GroqClient
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = iter(
+            [Mock(choices=[Mock(delta=Mock(content=text))]) for text in ["Fact one. ", "Fact two."]])
+        mock_groq_class.return_value = mock_client
+        cache = ResponseCache(os.path.join(temp_dir, 'cache.sqlite3'))
+
+        client = GroqClient(cache=cache)
+        assert "".join(client.generate_stream("facts")) == "Fact one. Fact two."
+        assert list(client.generate_stream("facts")) == ["Fact one. Fact two."]
+        assert client.generate_text("facts") == "Fact one. Fact two."
+        assert mock_client.chat.completions.create.call_count == 1
+        cache.close()
+
+
+@pytest.mark.unit
+class TestRenderStream:
+    """Test suite for rendering slides while text is still streaming."""
+
+    def test_first_slide_rendered_before_stream_ends(self, temp_dir):
+        from rendering.carousel_renderer import CarouselRenderer
+
+        renderer = CarouselRenderer(width=400, height=400, async_writes=False, slide_counter=True)
+        seen_on_disk = []
+
+        def chunks():
+            yield "Honey never spoils. "
+            yield "Octopuses have "
+            seen_on_disk.append(os.path.exists(os.path.join(temp_dir, 'slide_1.png')))
+            yield "three hearts. Bananas are berries."
+
+        slides = ({"text": sentence} for sentence in iter_sentences(chunks()))
+        output_paths = renderer.render_stream(slides, output_dir=temp_dir)
+
+        assert seen_on_disk == [True]
+        assert [os.path.basename(path) for path in output_paths] == ['slide_1.png', 'slide_2.png', 'slide_3.png']
+        assert all(os.path.exists(path) for path in output_paths)
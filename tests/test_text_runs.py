@@ -0,0 +1,98 @@
+"""Tests for the rasterized text-run cache (text_runs.py) and slide branding."""
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.carousel_renderer import CarouselRenderer
+from rendering.text_runs import TextRunCache
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+def load_fonts():
+    try:
+        return [ImageFont.truetype(FONT_PATH, 24), ImageFont.truetype(FONT_PATH, 40), ImageFont.load_default()]
+    except IOError:
+        return [ImageFont.load_default()]
+
+
+@pytest.mark.unit
+class TestTextRunCache:
+    """Test suite for TextRunCache."""
+
+    @pytest.mark.parametrize("xy", [(20, 30), (20.5, 30.5), (-7.25, 12.3), (133.75, -4.5)])
+    def test_draw_matches_imagedraw_text(self, xy):
+        """Cached runs produce exactly the pixels ImageDraw.text does, at sub-pixel positions too."""
+        cache = TextRunCache()
+        for font in load_fonts():
+            for text, fill in [("@factsmind", (0, 0, 0)), ("gjpqy 3/7", (250, 100, 7)), ("Hello", "white")]:
+                expected = Image.new('RGB', (400, 120), (10, 200, 30))
+                ImageDraw.Draw(expected).text(xy, text, font=font, fill=fill)
+                actual = Image.new('RGB', (400, 120), (10, 200, 30))
+                cache.draw(ImageDraw.Draw(actual), xy, text, font, fill)
+                assert actual.tobytes() == expected.tobytes()
+
+    def test_repeated_runs_hit_the_cache(self):
+        """The same run in any color is rasterized once."""
+        cache = TextRunCache()
+        font = load_fonts()[0]
+        img = Image.new('RGB', (300, 100))
+        for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255)]:
+            cache.draw(ImageDraw.Draw(img), (10, 10), "@factsmind", font, color)
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_total_bytes_stay_bounded(self):
+        """Least recently used masks are evicted once max_bytes is exceeded."""
+        font = load_fonts()[0]
+        mask, _ = TextRunCache.rasterize(font, "word 0")
+        cache = TextRunCache(max_bytes=mask.size[0] * mask.size[1] * 3)
+        for i in range(10):
+            cache.get(font, f"word {i}")
+            assert cache.stats()["bytes"] <= cache.max_bytes
+        cache.get(font, "word 9")
+        assert cache.stats()["hits"] == 1
+        cache.get(font, "word 0")
+        assert cache.stats()["misses"] == 11
+
+
+@pytest.mark.unit
+class TestBranding:
+    """Test suite for handle, footer and slide counter branding."""
+
+    def test_unbranded_slide_matches_plain_text_drawing(self):
+        """Pasting cached runs leaves unbranded slides pixel-identical to ImageDraw.text."""
+        renderer = CarouselRenderer()
+        text = "Pillow allows us to programmatically create and manipulate images with Python."
+        expected = Image.new('RGB', (renderer.width, renderer.height), (255, 255, 255))
+        d = ImageDraw.Draw(expected)
+        for line in renderer.layout.layout(text, renderer.width, renderer.height):
+            d.text((line.x, line.y), line.text, font=renderer.font, fill=(0, 0, 0))
+        assert renderer.create_slide(text).tobytes() == expected.tobytes()
+
+    def test_branding_is_drawn_and_cached(self, carousel_slides_data):
+        """Branding changes the slide, and repeats are served from the run cache."""
+        plain = CarouselRenderer(width=540, height=540)
+        branded = CarouselRenderer(width=540, height=540, handle="@factsmind", footer="factsmind.com",
+                                   slide_counter=True)
+        items = branded.carousel_items(carousel_slides_data)
+        images = [branded.slide_image(i, data) for i, data in items]
+
+        assert images[0].tobytes() != plain.slide_image(0, carousel_slides_data[0]).tobytes()
+        assert branded.branding(*items[1]) == {"handle": "@factsmind", "footer": "factsmind.com",
+                                               "counter": f"2/{len(carousel_slides_data)}"}
+        # handle and footer are rasterized once for the whole carousel
+        assert branded.text_runs.stats()["hits"] >= 2 * (len(carousel_slides_data) - 1)
+
+    def test_branding_is_part_of_cache_key(self, carousel_slides_data):
+        """Slides with different counters or footers never share a cache entry."""
+        renderer = CarouselRenderer(slide_counter=True)
+        first, second = renderer.carousel_items(carousel_slides_data[:2])
+        same_text = dict(second[1], text=first[1]["text"])
+        assert renderer.cache_key(0, first[1]) != renderer.cache_key(1, same_text)
+        assert renderer.cache_key(0, first[1]) != renderer.cache_key(0, dict(first[1], footer="Source: NASA"))
@@ -0,0 +1,111 @@
+"""Tests for streaming slide frames into ffmpeg (video.py)."""
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from rendering.carousel_renderer import CarouselRenderer
+from rendering.video import ffmpeg_command, slide_frames, write_video
+
+FAKE_FFMPEG = '''#!{python}
+# Stand-in for ffmpeg: counts raw bytes on stdin and writes the count to the output path
+import sys
+if "--fail" in sys.argv[0]:
+    sys.stderr.write("Unknown encoder\\n")
+    sys.exit(1)
+total = 0
+while True:
+    chunk = sys.stdin.buffer.read(65536)
+    if not chunk:
+        break
+    total += len(chunk)
+with open(sys.argv[-1], "w") as f:
+    f.write(str(total))
+'''
+
+
+@pytest.fixture
+def fake_ffmpeg(temp_dir):
+    """Executable that behaves like ffmpeg reading rawvideo from stdin."""
+    path = os.path.join(temp_dir, 'ffmpeg')
+    with open(path, 'w') as f:
+        f.write(FAKE_FFMPEG.format(python=sys.executable))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+@pytest.mark.unit
+class TestVideo:
+    """Test suite for video frame generation and the ffmpeg pipe."""
+
+    def test_frame_counts_and_crossfade(self):
+        """Each slide is held, and transitions blend between neighbours."""
+        black = Image.new('RGB', (4, 4), (0, 0, 0))
+        white = Image.new('RGB', (4, 4), (255, 255, 255))
+        frames = list(slide_frames([black, white], fps=10, slide_seconds=1.0, transition_seconds=0.3))
+
+        assert len(frames) == 10 + 3 + 10
+        assert all(len(frame) == 4 * 4 * 3 for frame in frames)
+        assert frames[0] == black.tobytes()
+        assert frames[-1] == white.tobytes()
+        fade = [frame[0] for frame in frames[10:13]]
+        assert fade == sorted(fade) and 0 < fade[0] < fade[-1] < 255
+
+    def test_slides_consumed_lazily(self):
+        """Slides are pulled one at a time as frames are consumed."""
+        pulled = []
+
+        def slides():
+            for i in range(3):
+                pulled.append(i)
+                yield Image.new('RGB', (2, 2), (i, i, i))
+
+        frames = slide_frames(slides(), fps=2, slide_seconds=1.0, transition_seconds=0)
+        next(frames)
+        assert pulled == [0]
+
+    def test_ffmpeg_command_reads_rawvideo_from_stdin(self):
+        """The command declares rgb24 raw frames of the canvas size on stdin."""
+        command = ffmpeg_command('out.mp4', (1080, 1350), fps=24, ffmpeg_bin='/usr/bin/ffmpeg')
+        assert command[0] == '/usr/bin/ffmpeg'
+        assert command[command.index('-pix_fmt') + 1] == 'rgb24'
+        assert command[command.index('-s') + 1] == '1080x1350'
+        assert command[command.index('-i') + 1] == '-'
+        assert command[-1] == 'out.mp4'
+
+    def test_render_video_pipes_all_frames(self, fake_ffmpeg, temp_dir, carousel_slides_data):
+        """render_video streams every frame to ffmpeg without writing slide files."""
+        renderer = CarouselRenderer(width=64, height=48)
+        output_path = os.path.join(temp_dir, 'videos', 'short.mp4')
+
+        result = renderer.render_video(carousel_slides_data, output_path, fps=5, slide_seconds=1.0,
+                                       transition_seconds=0.4, ffmpeg_bin=fake_ffmpeg)
+
+        slides = len(carousel_slides_data)
+        expected_frames = slides * 5 + (slides - 1) * 2
+        assert result == output_path
+        with open(output_path) as f:
+            assert int(f.read()) == expected_frames * 64 * 48 * 3
+        assert os.listdir(os.path.dirname(output_path)) == ['short.mp4']
+
+    def test_ffmpeg_failure_raises(self, temp_dir):
+        """A non-zero ffmpeg exit surfaces its stderr."""
+        failing = os.path.join(temp_dir, 'ffmpeg--fail')
+        with open(failing, 'w') as f:
+            f.write(FAKE_FFMPEG.format(python=sys.executable))
+        os.chmod(failing, 0o755)
+        frames = slide_frames([Image.new('RGB', (8, 8))], fps=30, slide_seconds=10)
+
+        with pytest.raises(RuntimeError, match="Unknown encoder"):
+            write_video(frames, os.path.join(temp_dir, 'out.mp4'), (8, 8), ffmpeg_bin=failing)
+
+    def test_missing_ffmpeg_raises(self, temp_dir):
+        """A missing ffmpeg binary is reported clearly."""
+        with pytest.raises(RuntimeError, match="Could not start ffmpeg"):
+            write_video([], os.path.join(temp_dir, 'out.mp4'), (8, 8), ffmpeg_bin='/nonexistent/ffmpeg')